@@ -1,5 +1,8 @@
 from django.contrib import admin
-from .models import BotConfiguration, InteractionLog, BotHealthCheck, BotMetrics, BotMessage
+from .models import (
+    BotConfiguration, InteractionLog, BotHealthCheck, BotMetrics, BotMessage,
+    BotHealthRollup, InteractionRollup,
+)
 
 @admin.register(BotConfiguration)
 class BotConfigurationAdmin(admin.ModelAdmin):
@@ -24,3 +27,13 @@ class BotMetricsAdmin(admin.ModelAdmin):
 class BotMessageAdmin(admin.ModelAdmin):
     list_display = ('key', 'description', 'updated_at')
     search_fields = ('key', 'text', 'description')
+
+@admin.register(BotHealthRollup)
+class BotHealthRollupAdmin(admin.ModelAdmin):
+    list_display = ('granularity', 'bucket_start', 'total_checks', 'online_checks', 'response_time_p95')
+    list_filter = ('granularity',)
+
+@admin.register(InteractionRollup)
+class InteractionRollupAdmin(admin.ModelAdmin):
+    list_display = ('granularity', 'bucket_start', 'messages_received', 'messages_sent', 'unique_users')
+    list_filter = ('granularity',)
@@ -0,0 +1,202 @@
+"""
+Cheap interaction counters for the dashboard.
+
+Every logged message increments an exact per-day counter and adds the user
+to a per-day HyperLogLog in Redis (one pipelined round trip), so "messages
+today" and "unique users over N days" never scan ``InteractionLog``. The
+table size itself comes from the PostgreSQL planner statistics
+(``reltuples``) instead of ``COUNT(*)``. Every reader returns None when the
+data is unavailable so callers can fall back to a query.
+"""
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+
+import structlog
+from django.db import connection
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from apps.bot.models import InteractionLog
+from config.env import settings
+from infra.redis import get_redis_client
+
+logger = structlog.get_logger(__name__)
+
+
+class InteractionCounters:
+    """
+    Incremental counters and HyperLogLogs kept alongside ``InteractionLog``.
+    """
+
+    KEY_PREFIX = "capyvagas:counters:interactions"
+    MESSAGE_TYPES = ("SENT", "RECEIVED")
+
+    def __init__(self, client=None, retention_days: Optional[int] = None) -> None:
+        """
+        Initialize the counters.
+
+        Args:
+            client: Redis client (optional, defaults to the shared client)
+            retention_days: How long daily keys are kept (defaults to log retention)
+        """
+        self.client = client if client is not None else get_redis_client()
+        self.retention_days = retention_days or settings.retention.interaction_log_days
+
+    def _count_key(self, day: date, message_type: str) -> str:
+        return f"{self.KEY_PREFIX}:{day.isoformat()}:{message_type}"
+
+    def _users_key(self, day: date) -> str:
+        return f"{self.KEY_PREFIX}:{day.isoformat()}:users"
+
+    def _days(self, days: int, today: Optional[date] = None) -> List[date]:
+        today = today or timezone.localdate()
+        return [today - timedelta(days=offset) for offset in range(days)]
+
+    def record(self, user_id: int, message_type: str, day: Optional[date] = None) -> None:
+        """
+        Count one logged message; failures are logged and ignored.
+
+        Args:
+            user_id: ``UserProfile`` id of the sender/recipient
+            message_type: ``"SENT"`` or ``"RECEIVED"``
+            day: Local date of the message (defaults to today)
+        """
+        if self.client is None:
+            return
+        day = day or timezone.localdate()
+        ttl = int(timedelta(days=self.retention_days + 1).total_seconds())
+        count_key = self._count_key(day, message_type)
+        users_key = self._users_key(day)
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            pipe.incr(count_key)
+            pipe.expire(count_key, ttl)
+            pipe.pfadd(users_key, user_id)
+            pipe.expire(users_key, ttl)
+            pipe.execute()
+        except Exception as e:
+            logger.warning("interaction_counter_unavailable", error=str(e))
+
+    def message_counts(
+        self, days: int = 1, today: Optional[date] = None
+    ) -> Optional[Dict[str, int]]:
+        """
+        Exact sent/received counts over the last ``days`` calendar days.
+
+        Args:
+            days: Number of days, today included
+            today: Reference date (defaults to today)
+
+        Returns:
+            dict keyed by message type, or None if Redis is unavailable
+        """
+        if self.client is None:
+            return None
+        day_list = self._days(days, today)
+        keys = [self._count_key(day, t) for t in self.MESSAGE_TYPES for day in day_list]
+        try:
+            values = self.client.mget(keys)
+        except Exception as e:
+            logger.warning("interaction_counter_unavailable", error=str(e))
+            return None
+        counts = {}
+        for index, message_type in enumerate(self.MESSAGE_TYPES):
+            chunk = values[index * days : (index + 1) * days]
+            counts[message_type] = sum(int(v) for v in chunk if v is not None)
+        return counts
+
+    def unique_users(self, days: int = 1, today: Optional[date] = None) -> Optional[int]:
+        """
+        Approximate distinct users over the last ``days`` calendar days (PFCOUNT).
+
+        Args:
+            days: Number of days, today included
+            today: Reference date (defaults to today)
+
+        Returns:
+            Estimated count (standard error ~0.8%), or None if Redis is unavailable
+        """
+        if self.client is None:
+            return None
+        try:
+            return self.client.pfcount(*[self._users_key(day) for day in self._days(days, today)])
+        except Exception as e:
+            logger.warning("interaction_counter_unavailable", error=str(e))
+            return None
+
+    def backfill(self, days: Optional[int] = None) -> int:
+        """
+        Rebuild the daily keys of past days from ``InteractionLog``.
+
+        Today is skipped because it is already being counted live; counts of
+        earlier days are overwritten, so running it twice is harmless.
+
+        Args:
+            days: How many past days to rebuild (defaults to log retention)
+
+        Returns:
+            Number of days written
+        """
+        if self.client is None:
+            return 0
+        today = timezone.localdate()
+        since = today - timedelta(days=days or self.retention_days)
+        logs = InteractionLog.objects.annotate(
+            day=TruncDate("created_at", tzinfo=timezone.get_current_timezone())
+        ).filter(day__gte=since, day__lt=today)
+        ttl = int(timedelta(days=self.retention_days + 1).total_seconds())
+
+        pipe = self.client.pipeline(transaction=False)
+        written = set()
+        for row in logs.values("day", "message_type").annotate(total=Count("id")).order_by():
+            pipe.set(self._count_key(row["day"], row["message_type"]), row["total"], ex=ttl)
+            written.add(row["day"])
+        for day, user_id in logs.values_list("day", "user_id").distinct().order_by().iterator():
+            pipe.pfadd(self._users_key(day), user_id)
+        for day in written:
+            pipe.expire(self._users_key(day), ttl)
+        pipe.execute()
+        logger.info("interaction_counters_backfilled", days=len(written))
+        return len(written)
+
+
+def estimated_interaction_total() -> int:
+    """
+    Approximate number of ``InteractionLog`` rows.
+
+    On PostgreSQL this reads ``reltuples`` (summed over the monthly
+    partitions), refreshed by autovacuum/ANALYZE; elsewhere it falls back to
+    an exact ``COUNT(*)``.
+
+    Returns:
+        Row count estimate
+    """
+    if connection.vendor == "postgresql":
+        table = InteractionLog._meta.db_table
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT COALESCE(SUM(GREATEST(c.reltuples, 0)), 0)
+                FROM pg_class c
+                WHERE c.oid = %s::regclass AND c.relkind = 'r'
+                   OR c.oid IN (SELECT inhrelid FROM pg_inherits WHERE inhparent = %s::regclass)
+                """,
+                [table, table],
+            )
+            estimate = cursor.fetchone()[0]
+        if estimate:
+            return int(estimate)
+    return InteractionLog.objects.count()
+
+
+# Global instance
+_counters: Optional[InteractionCounters] = None
+
+
+def get_interaction_counters() -> InteractionCounters:
+    """Get or create the process-wide interaction counters."""
+    global _counters
+    if _counters is None:
+        _counters = InteractionCounters()
+    return _counters
@@ -1,6 +1,7 @@
 """Bot conversation handlers package."""
 from .authentication import AuthenticationHandler
 from .base import BaseHandler
+from .job_alerts import JobAlertHandler
 from .job_search import JobSearchHandler
 from .menu import MenuHandler
 
@@ -8,5 +9,6 @@ __all__ = [
     "BaseHandler",
     "AuthenticationHandler",
     "JobSearchHandler",
+    "JobAlertHandler",
     "MenuHandler",
 ]
@@ -1,8 +1,13 @@
 """Authentication handler for login/logout flows."""
 import structlog
+from django.db import transaction
 
+from apps.bot.ratelimit import LOGIN, SlidingWindowRateLimiter, get_rate_limiter
+from apps.jobs.alerts import unsubscribe
 from apps.users.models import UserProfile
 from apps.users.services import UTFPRAuthService
+from infra.observability import track_step
+from infra.security import encrypt_field
 
 from .base import BaseHandler
 
@@ -12,17 +17,25 @@ logger = structlog.get_logger(__name__)
 class AuthenticationHandler(BaseHandler):
     """Handles user authentication (login/logout) flows."""
 
-    def __init__(self, waha_client, auth_service: UTFPRAuthService) -> None:
+    def __init__(
+        self,
+        waha_client,
+        auth_service: UTFPRAuthService,
+        rate_limiter: SlidingWindowRateLimiter | None = None,
+    ) -> None:
         """
         Initialize authentication handler.
         
         Args:
             waha_client: WAHA client for messaging
             auth_service: Service for UTFPR authentication
+            rate_limiter: Per-chat limiter for login attempts (optional, defaults to shared)
         """
         super().__init__(waha_client)
         self.auth_service = auth_service
+        self.rate_limiter = rate_limiter or get_rate_limiter()
 
+    @track_step()
     def start_login_flow(self, user: UserProfile, chat_id: str) -> None:
         """
         Start login flow by requesting RA.
@@ -41,7 +54,7 @@ class AuthenticationHandler(BaseHandler):
 
         user.current_action = "login_step_ra"
         user.flow_data = {}
-        user.save(update_fields=["current_action", "flow_data", "last_activity"])
+        user.save(update_fields=["current_action", "flow_data"])
 
         msg = self.get_text(
             "login_prompt_ra",
@@ -51,6 +64,7 @@ class AuthenticationHandler(BaseHandler):
         )
         self.send_msg(user, chat_id, msg)
 
+    @track_step()
     def handle_login_ra(self, user: UserProfile, chat_id: str, text: str) -> None:
         """
         Handle RA input during login.
@@ -70,7 +84,7 @@ class AuthenticationHandler(BaseHandler):
 
         user.flow_data["temp_ra"] = ra
         user.current_action = "login_step_password"
-        user.save(update_fields=["current_action", "flow_data", "last_activity"])
+        user.save(update_fields=["current_action", "flow_data"])
 
         msg = self.get_text(
             "login_prompt_password",
@@ -79,20 +93,35 @@ class AuthenticationHandler(BaseHandler):
         )
         self.send_msg(user, chat_id, msg)
 
+    @track_step()
     def handle_login_password(
         self, user: UserProfile, chat_id: str, text: str
     ) -> bool:
         """
-        Handle password input and complete authentication.
-        
+        Handle password input and queue the portal verification.
+
+        The portal login is a slow HTTP round trip, so it runs in the
+        ``verify_portal_credentials`` task; the user is answered from there.
+
         Args:
             user: User profile
             chat_id: WhatsApp chat ID
             text: User input (password)
-            
+
         Returns:
-            True if authentication succeeded
+            True if the verification was queued
         """
+        from apps.bot.tasks import verify_portal_credentials
+
+        if not self.rate_limiter.hit(LOGIN, chat_id):
+            self.send_msg(
+                user,
+                chat_id,
+                "⏳ Muitas tentativas de login. Aguarde alguns minutos e digite a senha novamente.",
+            )
+            logger.warning("login_rate_limited", user_id=user.id)
+            return False
+
         password = text.strip()
         ra = user.flow_data.get("temp_ra")
 
@@ -103,8 +132,35 @@ class AuthenticationHandler(BaseHandler):
             self.reset_state(user)
             return False
 
-        self.send_msg(user, chat_id, "🔄 Validando credenciais...")
+        user.current_action = "login_verifying"
+        user.save(update_fields=["current_action"])
+        self.send_msg(user, chat_id, "🔄 Validando credenciais…")
 
+        encrypted = encrypt_field(password)
+        transaction.on_commit(
+            lambda: verify_portal_credentials.delay(user.id, chat_id, ra, encrypted)
+        )
+        return True
+
+    @track_step()
+    def complete_login(
+        self, user: UserProfile, chat_id: str, ra: str, password: str
+    ) -> bool:
+        """
+        Verify the credentials on the portal and tell the user the outcome.
+
+        Args:
+            user: User profile
+            chat_id: WhatsApp chat ID
+            ra: RA typed by the user
+            password: Portal password
+
+        Returns:
+            True if authentication succeeded
+
+        Raises:
+            PortalUnavailableError: If the portal could not answer
+        """
         if self.auth_service.authenticate(ra, password):
             self.auth_service.link_user(chat_id, ra, password)
             self.reset_state(user)
@@ -116,21 +172,43 @@ class AuthenticationHandler(BaseHandler):
                 "Escolha a opção 3 no menu.",
             )
             self.send_msg(user, chat_id, msg)
-            
+
             logger.info("user_authenticated", user_id=user.id, ra=ra)
             return True
-        else:
-            msg = self.get_text(
-                "login_error",
-                "❌ **Falha no login.**\n"
-                "RA ou senha incorretos.\n\n"
-                "Tente digitar a senha novamente ou digite 'cancelar' para sair.",
-            )
-            self.send_msg(user, chat_id, msg)
-            
-            logger.warning("authentication_failed", user_id=user.id, ra=ra)
-            return False
 
+        user.current_action = "login_step_password"
+        user.save(update_fields=["current_action"])
+        msg = self.get_text(
+            "login_error",
+            "❌ **Falha no login.**\n"
+            "RA ou senha incorretos.\n\n"
+            "Tente digitar a senha novamente ou digite 'cancelar' para sair.",
+        )
+        self.send_msg(user, chat_id, msg)
+
+        logger.warning("authentication_failed", user_id=user.id, ra=ra)
+        return False
+
+    @track_step()
+    def portal_unavailable(self, user: UserProfile, chat_id: str) -> None:
+        """
+        Tell the user the portal is down and let them type the password again.
+
+        Args:
+            user: User profile
+            chat_id: WhatsApp chat ID
+        """
+        user.current_action = "login_step_password"
+        user.save(update_fields=["current_action"])
+        self.send_msg(
+            user,
+            chat_id,
+            "⚠️ O Portal do Aluno não respondeu.\n\n"
+            "Digite sua senha novamente em alguns minutos ou digite 'cancelar' para sair.",
+        )
+        logger.warning("portal_unavailable", user_id=user.id)
+
+    @track_step()
     def handle_logout(self, user: UserProfile, chat_id: str) -> None:
         """
         Handle user logout.
@@ -150,12 +228,13 @@ class AuthenticationHandler(BaseHandler):
                 "current_action",
                 "selected_course",
                 "selected_term",
-                "last_activity",
             ]
         )
+        unsubscribe(user)
         
         logger.info("user_logged_out", user_id=user.id)
 
+    @track_step()
     def reset_state(self, user: UserProfile) -> None:
         """
         Reset user conversation state.
@@ -165,8 +244,9 @@ class AuthenticationHandler(BaseHandler):
         """
         user.current_action = None
         user.flow_data = {}
-        user.save(update_fields=["current_action", "flow_data", "last_activity"])
+        user.save(update_fields=["current_action", "flow_data"])
 
+    @track_step()
     def handle(self, user: UserProfile, chat_id: str, text: str) -> bool:
         """
         Handle authentication-related messages.
@@ -187,5 +267,10 @@ class AuthenticationHandler(BaseHandler):
         elif action == "login_step_password":
             self.handle_login_password(user, chat_id, text)
             return True
+        elif action == "login_verifying":
+            self.send_msg(
+                user, chat_id, "⏳ Ainda estou validando suas credenciais, aguarde um instante."
+            )
+            return True
 
         return False
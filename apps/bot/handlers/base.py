@@ -4,8 +4,10 @@ from typing import Optional
 
 import structlog
 
+from apps.bot.counters import get_interaction_counters
 from apps.bot.models import BotMessage, InteractionLog
 from apps.users.models import UserProfile
+from infra.observability import track_step
 from infra.waha.client import WahaClient
 
 logger = structlog.get_logger(__name__)
@@ -28,6 +30,7 @@ class BaseHandler(ABC):
         """
         self.waha_client = waha_client
 
+    @track_step()
     def get_text(self, key: str, default: str) -> str:
         """
         Fetch configured message or use default.
@@ -47,6 +50,7 @@ class BaseHandler(ABC):
             logger.warning("failed_to_fetch_message", key=key, error=str(e))
         return default
 
+    @track_step()
     def send_msg(self, user: UserProfile, chat_id: str, message: str) -> None:
         """
         Send message to user and log it.
@@ -83,6 +87,7 @@ class BaseHandler(ABC):
                 message_type="SENT",
                 session_id=self.waha_client.settings.session_name,
             )
+            get_interaction_counters().record(user.id, "SENT")
         except Exception as e:
             logger.error(
                 "failed_to_log_message",
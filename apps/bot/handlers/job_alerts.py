@@ -0,0 +1,59 @@
+"""Handler de inscrição nos alertas automáticos de vagas."""
+import structlog
+
+from apps.jobs.alerts import subscribe, unsubscribe
+from apps.users.models import UserProfile
+from infra.observability import track_step
+
+from .base import BaseHandler
+
+logger = structlog.get_logger(__name__)
+
+
+class JobAlertHandler(BaseHandler):
+    """Liga e desliga os alertas de novas vagas do curso/termo selecionado."""
+
+    @track_step()
+    def toggle(self, user: UserProfile, chat_id: str) -> None:
+        """Ativa os alertas do usuário, ou desativa se já estiverem ativos."""
+
+        if not user.is_authenticated_utfpr:
+            self.send_msg(user, chat_id, "🔒 Você precisa se cadastrar primeiro (Opção 1).")
+            return
+
+        if unsubscribe(user):
+            self.send_msg(
+                user,
+                chat_id,
+                "🔕 Alertas de vagas desativados.\n\nDigite *4* para ativar novamente.",
+            )
+            logger.info("job_alerts_disabled", user_id=user.id)
+            return
+
+        if not user.selected_course_id:
+            self.send_msg(
+                user,
+                chat_id,
+                "⚠️ Escolha primeiro um curso e um termo na busca de vagas (Opção 3).",
+            )
+            return
+
+        subscription = subscribe(user)
+        target = subscription.term.term if subscription.term else subscription.course.name
+        self.send_msg(
+            user,
+            chat_id,
+            f"🔔 Alertas ativados para *{target}*!\n\n"
+            "Você receberá as novas vagas automaticamente.\n"
+            "Digite *4* para desativar.",
+        )
+        logger.info(
+            "job_alerts_enabled",
+            user_id=user.id,
+            course_id=subscription.course_id,
+            term_id=subscription.term_id,
+        )
+
+    def handle(self, user: UserProfile, chat_id: str, text: str) -> bool:
+        """Os alertas não têm estado de conversa; o menu chama ``toggle`` diretamente."""
+        return False
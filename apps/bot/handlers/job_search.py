@@ -1,9 +1,14 @@
 import structlog
 from typing import List
 
-from apps.courses.models import Course, SearchTerm
+from apps.bot.ratelimit import SEARCH, SlidingWindowRateLimiter, get_rate_limiter
+from apps.courses.cache import get_active_courses, get_default_terms
+from apps.courses.models import Course
+from apps.jobs.formatting import format_job_message
 from apps.users.models import UserProfile
 from infra.jobspy.service import JobSearchService
+from infra.observability import track_step
+from infra.observability.metrics import JOB_SEARCH_DURATION
 
 from .base import BaseHandler
 
@@ -13,10 +18,16 @@ logger = structlog.get_logger(__name__)
 class JobSearchHandler(BaseHandler):
     """Manipula o fluxo de busca de vagas (seleção de curso e termos)."""
 
-    def __init__(self, waha_client, job_service: JobSearchService | None = None) -> None:
+    def __init__(
+        self,
+        waha_client,
+        job_service: JobSearchService | None = None,
+        rate_limiter: SlidingWindowRateLimiter | None = None,
+    ) -> None:
         """Inicializa o handler de busca de vagas."""
         super().__init__(waha_client)
         self.job_service = job_service or JobSearchService()
+        self.rate_limiter = rate_limiter or get_rate_limiter()
 
     def _format_course_line(self, index: int, course: Course) -> str:
         """Monta uma linha amigável com informações do curso."""
@@ -36,6 +47,7 @@ class JobSearchHandler(BaseHandler):
 
         return f"*{index + 1}*) {course.name}{detalhe_str}{descricao}"
 
+    @track_step()
     def start_course_selection(self, user: UserProfile, chat_id: str) -> None:
         """Inicia o fluxo de seleção de curso."""
 
@@ -47,7 +59,7 @@ class JobSearchHandler(BaseHandler):
             )
             return
 
-        courses = list(Course.objects.filter(is_active=True).order_by("order", "name"))
+        courses = self._get_active_courses()
         if not courses:
             self.send_msg(user, chat_id, "⚠️ Nenhum curso cadastrado no sistema.")
             return
@@ -60,14 +72,15 @@ class JobSearchHandler(BaseHandler):
         )
 
         user.current_action = "course_selection"
-        user.save(update_fields=["current_action", "last_activity"])
+        user.save(update_fields=["current_action"])
         self.send_msg(user, chat_id, msg)
         logger.info("course_selection_started", user_id=user.id, total_courses=len(courses))
 
     def _get_active_courses(self) -> list[Course]:
-        """Retorna a lista de cursos ativos ordenados."""
-        return list(Course.objects.filter(is_active=True).order_by("order", "name"))
+        """Retorna a lista de cursos ativos ordenados (via cache do catálogo)."""
+        return get_active_courses()
 
+    @track_step()
     def handle_course_selection(self, user: UserProfile, chat_id: str, text: str) -> None:
         """Processa a escolha de curso pelo usuário."""
 
@@ -87,6 +100,7 @@ class JobSearchHandler(BaseHandler):
         user.save(update_fields=["selected_course"])
         self.start_term_selection(user, chat_id)
 
+    @track_step()
     def start_term_selection(self, user: UserProfile, chat_id: str) -> None:
         """Inicia a seleção de termos de busca para o curso escolhido."""
 
@@ -94,9 +108,7 @@ class JobSearchHandler(BaseHandler):
             self.send_msg(user, chat_id, "❌ Curso não selecionado. Comece novamente pelo menu.")
             return
 
-        terms = list(
-            user.selected_course.search_terms.filter(is_default=True).order_by("-priority")
-        )
+        terms = get_default_terms(user.selected_course_id)
         if not terms:
             self.send_msg(
                 user,
@@ -104,7 +116,7 @@ class JobSearchHandler(BaseHandler):
                 f"⚠️ O curso {user.selected_course.name} não tem termos de busca configurados.",
             )
             user.current_action = None
-            user.save(update_fields=["current_action", "last_activity"])
+            user.save(update_fields=["current_action"])
             return
 
         lines = [f"*{i + 1}*) {t.term}" for i, t in enumerate(terms)]
@@ -118,7 +130,7 @@ class JobSearchHandler(BaseHandler):
         )
 
         user.current_action = "term_selection"
-        user.save(update_fields=["current_action", "last_activity"])
+        user.save(update_fields=["current_action"])
         self.send_msg(user, chat_id, msg)
         logger.info(
             "term_selection_started",
@@ -127,6 +139,7 @@ class JobSearchHandler(BaseHandler):
             terms=len(terms),
         )
 
+    @track_step()
     def handle_term_selection(self, user: UserProfile, chat_id: str, text: str) -> None:
         """Processa a escolha de termos (um ou todos) e dispara a busca de vagas."""
 
@@ -134,9 +147,7 @@ class JobSearchHandler(BaseHandler):
             self.send_msg(user, chat_id, "❌ Curso não selecionado. Comece novamente pelo menu.")
             return
 
-        terms = list(
-            user.selected_course.search_terms.filter(is_default=True).order_by("-priority")
-        )
+        terms = get_default_terms(user.selected_course_id)
 
         try:
             idx = int(text) - 1
@@ -150,19 +161,28 @@ class JobSearchHandler(BaseHandler):
         elif 0 <= idx < len(terms):
             term = terms[idx]
             user.selected_term = term
-            user.save(update_fields=["selected_term"])
             selected_terms_list = [term.term]
             term_name = term.term
         else:
             self.send_msg(user, chat_id, "❌ Número inválido.")
             return
 
-        # Limpa estado e executa busca
+        # Cada busca dispara um scraping; mantém o estado para o usuário tentar depois
+        if not self.rate_limiter.hit(SEARCH, chat_id):
+            self.send_msg(
+                user,
+                chat_id,
+                "⏳ Você fez muitas buscas em pouco tempo. Tente novamente em alguns minutos.",
+            )
+            return
+
+        # Limpa estado e executa busca (um único UPDATE com o termo escolhido, se mudou)
         user.current_action = None
-        user.save(update_fields=["current_action", "last_activity"])
+        user.save()
 
         self.perform_search(user, chat_id, selected_terms_list, term_name)
 
+    @track_step()
     def perform_search(
         self, user: UserProfile, chat_id: str, terms: List[str], term_name: str
     ) -> None:
@@ -175,7 +195,8 @@ class JobSearchHandler(BaseHandler):
         )
 
         try:
-            jobs = self.job_service.search(terms, limit=5)
+            with JOB_SEARCH_DURATION.time():
+                jobs = self.job_service.search(terms, limit=5)
         except Exception as exc:  # pragma: no cover - log defensivo
             logger.error(
                 "job_search_failed",
@@ -195,19 +216,9 @@ class JobSearchHandler(BaseHandler):
             return
 
         header = f"🚀 *Vagas para {user.selected_course.name}* (termo: *{term_name}*)"
-        lines = [header]
-        for job in jobs:
-            title = job.get("title", "Vaga")
-            company = job.get("company", "Empresa")
-            url = job.get("url", "#")
-            lines.append(
-                f"\n💼 *{title}*\n"
-                f"🏢 {company}\n"
-                f"🔗 {url}"
-            )
-
-        self.send_msg(user, chat_id, "\n".join(lines))
+        self.send_msg(user, chat_id, format_job_message(header, jobs))
 
+    @track_step()
     def handle(self, user: UserProfile, chat_id: str, text: str) -> bool:
         """Despacha mensagens de acordo com o estado atual do usuário."""
 
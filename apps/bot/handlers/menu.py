@@ -2,6 +2,7 @@
 import structlog
 
 from apps.users.models import UserProfile
+from infra.observability import track_step
 
 from .base import BaseHandler
 
@@ -11,6 +12,7 @@ logger = structlog.get_logger(__name__)
 class MenuHandler(BaseHandler):
     """Handles menu display and navigation."""
 
+    @track_step()
     def send_menu(self, user: UserProfile, chat_id: str) -> None:
         """
         Send main menu to user.
@@ -26,7 +28,8 @@ class MenuHandler(BaseHandler):
                 "📋 *Menu Principal*:\n"
                 "1️⃣ Atualizar Cadastro\n"
                 "2️⃣ Sair da Conta\n"
-                "3️⃣ Buscar Vagas\n\n"
+                "3️⃣ Buscar Vagas\n"
+                "4️⃣ Alertas de Vagas\n\n"
                 "Digite o número da opção desejada."
             )
         else:
@@ -41,6 +44,7 @@ class MenuHandler(BaseHandler):
         self.send_msg(user, chat_id, menu_text)
         logger.info("menu_displayed", user_id=user.id, authenticated=user.is_authenticated_utfpr)
 
+    @track_step()
     def send_unknown_command(self, user: UserProfile, chat_id: str) -> None:
         """
         Send unknown command message.
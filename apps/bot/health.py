@@ -9,9 +9,9 @@ from datetime import datetime, timedelta
 
 from django.utils import timezone
 from django.core.cache import cache
-from django.db.models import Avg
 
 from apps.bot.models import BotHealthCheck, BotMetrics
+from apps.bot.rollups import health_window_totals
 from config.env import settings
 
 logger = logging.getLogger(__name__)
@@ -20,7 +20,13 @@ logger = logging.getLogger(__name__)
 class BotHealthMonitor:
     """
     Monitora a saúde e performance do bot WAHA.
+
+    As verificações rodam em background (tarefa ``probe_bot_health`` agendada
+    no Celery beat) e publicam o último status no cache; páginas e API leem
+    esse valor com ``get_cached_status`` em vez de consultar o WAHA.
     """
+
+    STATUS_CACHE_KEY = 'bot_last_status'
     
     def __init__(self, waha_url=None, session_name=None):
         """Inicializa o monitor usando as configurações centrais do WAHA."""
@@ -96,11 +102,55 @@ class BotHealthMonitor:
             session_status=result['session_status']
         )
         
-        # Salvar no cache para acesso rápido
-        cache.set('bot_last_status', result, timeout=60)  # 1 minuto
+        # Salvar no cache para acesso rápido (sobrevive a uma rodada perdida do prober)
+        cache.set(self.STATUS_CACHE_KEY, result, timeout=self._status_ttl())
         
         return result
+
+    @staticmethod
+    def _status_ttl():
+        return max(60, settings.monitoring.probe_interval_seconds * 3)
+
+    def get_cached_status(self):
+        """
+        Retorna o último status publicado pelo prober sem consultar o WAHA.
+
+        Se o cache estiver vazio (ex.: logo após o deploy), usa a última
+        verificação gravada; só faz uma verificação síncrona se não houver
+        nenhuma.
+
+        Returns:
+            dict: mesmo formato de ``check_bot_status``
+        """
+        try:
+            result = cache.get(self.STATUS_CACHE_KEY)
+        except Exception as e:
+            logger.warning(f"Cache indisponível ao ler status do bot: {e}")
+            result = None
+        if result is not None:
+            return result
+
+        last_check = BotHealthCheck.objects.only(
+            'status', 'response_time', 'session_status', 'error_message', 'created_at'
+        ).order_by('-created_at').first()
+        if last_check is None:
+            return self.check_bot_status()
+
+        result = {
+            'status': last_check.status,
+            'response_time': last_check.response_time,
+            'session_status': last_check.session_status,
+            'last_check': last_check.created_at,
+            'error_message': last_check.error_message,
+        }
+        try:
+            cache.set(self.STATUS_CACHE_KEY, result, timeout=self._status_ttl())
+        except Exception:
+            pass
+        return result
     
+    METRICS_CACHE_TTL = 30  # segundos
+
     def get_metrics_summary(self, hours=24):
         """
         Obtém resumo das métricas do bot nas últimas N horas.
@@ -117,36 +167,83 @@ class BotHealthMonitor:
                 'last_error': str | None
             }
         """
-        since = timezone.now() - timedelta(hours=hours)
-        checks = BotHealthCheck.objects.filter(created_at__gte=since)
-        
-        total = checks.count()
-        if total == 0:
-            return {
-                'uptime_percentage': 0,
-                'avg_response_time': 0,
-                'total_checks': 0,
-                'error_count': 0,
-                'last_error': None
+        return self.get_metrics_windows([hours])[hours]
+
+    def get_metrics_windows(self, hours_list=(1, 24, 24 * 7)):
+        """
+        Calcula o resumo de métricas de várias janelas de uma só vez.
+
+        Os totais vêm dos agregados por minuto/hora mais a cauda ainda não
+        agregada (``health_window_totals``), com agregação condicional por
+        janela; o último erro vem de uma consulta extra, feita só quando há
+        erros. O resultado fica em cache por ``METRICS_CACHE_TTL`` segundos.
+
+        Args:
+            hours_list: Janelas em horas (ex.: [1, 24, 168])
+
+        Returns:
+            dict: {horas: resumo no formato de ``get_metrics_summary``}
+        """
+        hours_list = sorted(set(hours_list))
+        cache_key = f"bot_metrics_windows:{','.join(str(h) for h in hours_list)}"
+        try:
+            cached = cache.get(cache_key)
+        except Exception:
+            cached = None
+        if cached is not None:
+            return cached
+
+        now = timezone.now()
+        since_by_hours = {h: now - timedelta(hours=h) for h in hours_list}
+        totals = health_window_totals(since_by_hours)
+
+        # Último erro da maior janela; vale para as menores se estiver dentro delas
+        last_error = None
+        largest = totals[hours_list[-1]]
+        if largest['total'] > largest['online']:
+            last_error = (
+                BotHealthCheck.objects.filter(
+                    created_at__gte=since_by_hours[hours_list[-1]], error_message__isnull=False
+                )
+                .order_by('-created_at')
+                .values('error_message', 'created_at')
+                .first()
+            )
+
+        result = {}
+        for h, since in since_by_hours.items():
+            total = totals[h]['total']
+            if total == 0:
+                result[h] = {
+                    'uptime_percentage': 0,
+                    'avg_response_time': 0,
+                    'total_checks': 0,
+                    'error_count': 0,
+                    'last_error': None
+                }
+                continue
+
+            online_count = totals[h]['online']
+            response_count = totals[h]['response_count']
+            result[h] = {
+                'uptime_percentage': round((online_count / total) * 100, 2),
+                'avg_response_time': (
+                    round(totals[h]['response_sum'] / response_count, 2) if response_count else 0
+                ),
+                'total_checks': total,
+                'error_count': total - online_count,
+                'last_error': (
+                    last_error['error_message']
+                    if last_error and last_error['created_at'] >= since
+                    else None
+                ),
             }
-        
-        online_count = checks.filter(status='online').count()
-        error_count = checks.exclude(status='online').count()
-        
-        # Calcular tempo médio de resposta (excluindo erros de timeout)
-        valid_checks = checks.filter(response_time__isnull=False, response_time__lt=5000)
-        avg_response = valid_checks.aggregate(Avg('response_time'))['response_time__avg'] or 0
-        
-        # Último erro
-        last_error_check = checks.filter(error_message__isnull=False).order_by('-created_at').first()
-        
-        return {
-            'uptime_percentage': round((online_count / total) * 100, 2),
-            'avg_response_time': round(avg_response, 2),
-            'total_checks': total,
-            'error_count': error_count,
-            'last_error': last_error_check.error_message if last_error_check else None
-        }
+
+        try:
+            cache.set(cache_key, result, timeout=self.METRICS_CACHE_TTL)
+        except Exception:
+            pass
+        return result
     
     def test_bot_now(self):
         """
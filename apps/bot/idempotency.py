@@ -0,0 +1,147 @@
+"""Idempotency guard for WAHA webhook redeliveries."""
+import hashlib
+import math
+import threading
+from typing import Optional
+
+import structlog
+from django.core.cache import cache
+
+from config.env import settings
+from infra.observability import record_cache_access
+
+logger = structlog.get_logger(__name__)
+
+
+class BloomFilter:
+    """
+    Fixed-size in-process Bloom filter.
+
+    Answers "definitely not seen" or "possibly seen" for a key. Once the
+    configured capacity is reached the filter is reset so the false positive
+    rate stays bounded.
+    """
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.001) -> None:
+        """
+        Initialize the filter.
+
+        Args:
+            capacity: Number of keys kept before the filter rotates
+            error_rate: Target false positive probability at full capacity
+        """
+        self.capacity = capacity
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def _positions(self, key: str) -> list[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, key: str) -> bool:
+        """
+        Add a key to the filter.
+
+        Args:
+            key: Key to add
+
+        Returns:
+            True if the key was possibly present before this call
+        """
+        positions = self._positions(key)
+        with self._lock:
+            seen = all(self._bits[p >> 3] & (1 << (p & 7)) for p in positions)
+            if seen:
+                return True
+            if self._count >= self.capacity:
+                self._bits = bytearray(len(self._bits))
+                self._count = 0
+            for p in positions:
+                self._bits[p >> 3] |= 1 << (p & 7)
+            self._count += 1
+        return False
+
+
+class WebhookDeduplicator:
+    """
+    Rejects webhook deliveries whose WAHA message id was already processed.
+
+    The shared store is a Redis key written with SET NX + TTL (``cache.add``),
+    so every gunicorn worker agrees on which delivery claimed a message. A
+    per-process Bloom filter sits in front of it: it lets the store confirm
+    possible duplicates and keeps deduplication working when Redis is down.
+    """
+
+    KEY_PREFIX = "webhook:msg"
+
+    def __init__(self, ttl_seconds: Optional[int] = None, bloom: Optional[BloomFilter] = None) -> None:
+        """
+        Initialize the deduplicator.
+
+        Args:
+            ttl_seconds: How long a message id is remembered (defaults to settings)
+            bloom: Bloom filter instance (optional, will create default)
+        """
+        self.ttl_seconds = ttl_seconds or settings.webhook.dedup_ttl_seconds
+        self.bloom = bloom or BloomFilter()
+
+    def _key(self, message_id: str) -> str:
+        return f"{self.KEY_PREFIX}:{message_id}"
+
+    def is_duplicate(self, message_id: Optional[str]) -> bool:
+        """
+        Claim a message id, reporting whether it was already claimed.
+
+        Args:
+            message_id: WAHA message identifier (``payload.id``)
+
+        Returns:
+            True if the message was already processed and must be skipped
+        """
+        if not message_id:
+            return False
+
+        maybe_seen = self.bloom.add(message_id)
+        try:
+            claimed = cache.add(self._key(message_id), 1, timeout=self.ttl_seconds)
+        except Exception as e:
+            logger.warning("webhook_dedup_store_unavailable", error=str(e))
+            return maybe_seen
+
+        record_cache_access(hit=not claimed)
+        if not claimed:
+            logger.info("webhook_duplicate_skipped", message_id=message_id)
+        return not claimed
+
+    def release(self, message_id: Optional[str]) -> None:
+        """
+        Forget a claimed message id so its redelivery gets processed.
+
+        Called when processing failed after ``is_duplicate`` claimed the id.
+
+        Args:
+            message_id: WAHA message identifier (``payload.id``)
+        """
+        if not message_id:
+            return
+        try:
+            cache.delete(self._key(message_id))
+        except Exception as e:
+            logger.warning("webhook_dedup_store_unavailable", error=str(e))
+
+
+# Global instance
+_deduplicator: Optional[WebhookDeduplicator] = None
+
+
+def get_deduplicator() -> WebhookDeduplicator:
+    """Get or create the per-process webhook deduplicator."""
+    global _deduplicator
+    if _deduplicator is None:
+        _deduplicator = WebhookDeduplicator()
+    return _deduplicator
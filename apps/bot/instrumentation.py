@@ -0,0 +1,146 @@
+"""Per-message instrumentation for the bot pipeline."""
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+import structlog
+
+from apps.bot.models import BotMetrics
+from infra.observability import MessageProfile, profiled
+
+logger = structlog.get_logger(__name__)
+
+
+class MessageMetricsAggregator:
+    """
+    Accumulates message profiles in memory and flushes rollups to ``BotMetrics``.
+
+    One row per metric is written per flush interval and worker, instead of
+    one write per message.
+    """
+
+    METRICS = {
+        "message_latency_ms": "total_ms",
+        "message_db_queries": "db_queries",
+        "message_db_time_ms": "db_time_ms",
+        "message_waha_calls": "waha_calls",
+        "message_waha_time_ms": "waha_time_ms",
+    }
+
+    def __init__(self, flush_interval_seconds: float = 60.0) -> None:
+        """
+        Initialize the aggregator.
+
+        Args:
+            flush_interval_seconds: Minimum time between two flushes
+        """
+        self.flush_interval_seconds = flush_interval_seconds
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._window_start = time.monotonic()
+        self._count = 0
+        self._sums = dict.fromkeys(self.METRICS, 0.0)
+        self._maxima = dict.fromkeys(self.METRICS, 0.0)
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    def add(self, profile: MessageProfile) -> None:
+        """
+        Add a message profile, flushing when the interval has elapsed.
+
+        Args:
+            profile: Profile of a fully processed message
+        """
+        with self._lock:
+            self._count += 1
+            for metric, attr in self.METRICS.items():
+                value = float(getattr(profile, attr))
+                self._sums[metric] += value
+                self._maxima[metric] = max(self._maxima[metric], value)
+            self._cache_hits += profile.cache_hits
+            self._cache_misses += profile.cache_misses
+            due = time.monotonic() - self._window_start >= self.flush_interval_seconds
+        if due:
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Write the current window as ``BotMetrics`` rows.
+
+        Returns:
+            Number of rows written
+        """
+        with self._lock:
+            if not self._count:
+                return 0
+            window_seconds = round(time.monotonic() - self._window_start, 1)
+            count = self._count
+            rows = [
+                BotMetrics(
+                    metric_name=metric,
+                    value=round(self._sums[metric] / count, 2),
+                    metadata={
+                        "aggregation": "avg",
+                        "count": count,
+                        "max": round(self._maxima[metric], 2),
+                        "window_seconds": window_seconds,
+                    },
+                )
+                for metric in self.METRICS
+            ]
+            lookups = self._cache_hits + self._cache_misses
+            if lookups:
+                rows.append(
+                    BotMetrics(
+                        metric_name="message_cache_hit_ratio",
+                        value=round(self._cache_hits / lookups, 4),
+                        metadata={
+                            "hits": self._cache_hits,
+                            "misses": self._cache_misses,
+                            "window_seconds": window_seconds,
+                        },
+                    )
+                )
+            self._reset()
+
+        try:
+            BotMetrics.objects.bulk_create(rows)
+        except Exception as e:
+            logger.error("message_metrics_flush_failed", error=str(e))
+            return 0
+        return len(rows)
+
+
+# Global instance
+_aggregator: Optional[MessageMetricsAggregator] = None
+
+
+def get_aggregator() -> MessageMetricsAggregator:
+    """Get or create the per-process metrics aggregator."""
+    global _aggregator
+    if _aggregator is None:
+        _aggregator = MessageMetricsAggregator()
+    return _aggregator
+
+
+@contextmanager
+def message_profile(chat_id: str) -> Iterator[MessageProfile]:
+    """
+    Profile the processing of one inbound message.
+
+    The outermost block logs a ``message_processed`` event (merged with the
+    correlation id bound by ``CorrelationIdMiddleware``) and feeds the
+    ``BotMetrics`` aggregator.
+
+    Args:
+        chat_id: WhatsApp chat ID of the sender
+    """
+    with profiled() as (profile, is_root):
+        yield profile
+
+    if is_root:
+        logger.info("message_processed", chat_id=chat_id, **profile.as_log_fields())
+        get_aggregator().add(profile)
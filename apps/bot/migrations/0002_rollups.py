@@ -0,0 +1,116 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bot", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RollupWatermark",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("name", models.CharField(max_length=50, unique=True)),
+                ("processed_until", models.DateTimeField()),
+            ],
+            options={
+                "verbose_name": "Marca d'água de Agregação",
+                "verbose_name_plural": "Marcas d'água de Agregação",
+            },
+        ),
+        migrations.CreateModel(
+            name="BotHealthRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "granularity",
+                    models.CharField(
+                        choices=[("minute", "Minuto"), ("hour", "Hora")], max_length=10
+                    ),
+                ),
+                ("bucket_start", models.DateTimeField(help_text="Início do intervalo (UTC)")),
+                ("total_checks", models.PositiveIntegerField(default=0)),
+                ("online_checks", models.PositiveIntegerField(default=0)),
+                (
+                    "response_time_count",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Amostras válidas de latência"
+                    ),
+                ),
+                (
+                    "response_time_sum",
+                    models.FloatField(default=0, help_text="Soma das latências válidas (ms)"),
+                ),
+                ("response_time_p50", models.FloatField(blank=True, null=True)),
+                ("response_time_p95", models.FloatField(blank=True, null=True)),
+                ("response_time_p99", models.FloatField(blank=True, null=True)),
+            ],
+            options={
+                "verbose_name": "Agregado de Saúde do Bot",
+                "verbose_name_plural": "Agregados de Saúde do Bot",
+                "ordering": ["-bucket_start"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("granularity", "bucket_start"), name="unique_health_rollup_bucket"
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="InteractionRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "granularity",
+                    models.CharField(
+                        choices=[("minute", "Minuto"), ("hour", "Hora")], max_length=10
+                    ),
+                ),
+                ("bucket_start", models.DateTimeField(help_text="Início do intervalo (UTC)")),
+                ("messages_sent", models.PositiveIntegerField(default=0)),
+                ("messages_received", models.PositiveIntegerField(default=0)),
+                (
+                    "unique_users",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Usuários distintos no intervalo"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Agregado de Interações",
+                "verbose_name_plural": "Agregados de Interações",
+                "ordering": ["-bucket_start"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("granularity", "bucket_start"),
+                        name="unique_interaction_rollup_bucket",
+                    )
+                ],
+            },
+        ),
+    ]
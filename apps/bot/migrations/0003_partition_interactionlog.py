@@ -0,0 +1,93 @@
+"""
+Convert ``bot_interactionlog`` into a table range-partitioned by month.
+
+PostgreSQL only; on other databases this migration does nothing and
+retention falls back to batched deletes (see ``apps.bot.partitions``).
+The primary key becomes (id, created_at) because a partitioned table's
+unique constraints must include the partition key; ``id`` keeps its identity
+sequence, so it stays unique in practice and Django keeps using it as pk.
+"""
+
+from datetime import date
+
+from django.db import migrations
+
+TABLE = "bot_interactionlog"
+LEGACY = "bot_interactionlog_legacy"
+
+
+def _add_months(value, months):
+    month = value.month - 1 + months
+    return date(value.year + month // 12, month % 12 + 1, 1)
+
+
+def partition_table(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    execute = schema_editor.execute
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT indexname, indexdef FROM pg_indexes "
+            "WHERE tablename = %s AND indexname NOT LIKE %s",
+            [TABLE, "%_pkey"],
+        )
+        index_definitions = cursor.fetchall()
+        cursor.execute(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = %s::regclass AND contype = 'f'",
+            [TABLE],
+        )
+        foreign_keys = cursor.fetchall()
+        cursor.execute(f'SELECT min(created_at), now() FROM "{TABLE}"')
+        oldest, now = cursor.fetchone()
+
+    execute(f'ALTER TABLE "{TABLE}" RENAME TO "{LEGACY}"')
+    for name, _ in foreign_keys:
+        execute(f'ALTER TABLE "{LEGACY}" DROP CONSTRAINT "{name}"')
+    for name, _ in index_definitions:
+        execute(f'DROP INDEX "{name}"')
+
+    execute(
+        f'CREATE TABLE "{TABLE}" (LIKE "{LEGACY}" INCLUDING DEFAULTS INCLUDING IDENTITY) '
+        "PARTITION BY RANGE (created_at)"
+    )
+    execute(f'ALTER TABLE "{TABLE}" ADD PRIMARY KEY (id, created_at)')
+
+    month = (oldest or now).date().replace(day=1)
+    last = _add_months(now.date().replace(day=1), 2)
+    while month <= last:
+        execute(
+            f'CREATE TABLE "{TABLE}_p{month:%Y%m}" PARTITION OF "{TABLE}" '
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_add_months(month, 1).isoformat()}')"
+        )
+        month = _add_months(month, 1)
+    execute(f'CREATE TABLE "{TABLE}_default" PARTITION OF "{TABLE}" DEFAULT')
+
+    execute(f'INSERT INTO "{TABLE}" OVERRIDING SYSTEM VALUE SELECT * FROM "{LEGACY}"')
+    execute(
+        f"SELECT setval(pg_get_serial_sequence('\"{TABLE}\"', 'id'), "
+        f'COALESCE((SELECT max(id) FROM "{TABLE}"), 1))'
+    )
+    execute(f'DROP TABLE "{LEGACY}"')
+
+    for _, definition in index_definitions:
+        execute(definition)
+    for name, definition in foreign_keys:
+        execute(f'ALTER TABLE "{TABLE}" ADD CONSTRAINT "{name}" {definition}')
+
+
+class Migration(migrations.Migration):
+
+    atomic = True
+
+    dependencies = [
+        ("bot", "0002_rollups"),
+        ("users", "0001_initial"),
+    ]
+
+    # Reverting leaves the partitioned table in place; it is schema-compatible
+    # with the model, so earlier migrations keep working against it.
+    operations = [
+        migrations.RunPython(partition_table, migrations.RunPython.noop),
+    ]
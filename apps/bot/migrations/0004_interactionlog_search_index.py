@@ -0,0 +1,68 @@
+"""
+Search index for ``InteractionLog.message_content`` (see ``apps.bot.search``).
+
+PostgreSQL gets ``pg_trgm`` GIN indexes on ``UPPER(column::text)``, the exact
+expression Django emits for ``__icontains``, so ``LIKE '%TERM%'`` can use them;
+SQLite gets an FTS5 table with the trigram tokenizer, kept in sync with the
+log table by triggers. Other databases are left unchanged.
+"""
+
+from django.db import migrations
+
+POSTGRES_FORWARD = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS bot_interactionlog_content_trgm "
+    "ON bot_interactionlog USING gin ((UPPER(message_content::text)) gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS users_userprofile_phone_trgm "
+    "ON users_userprofile USING gin ((UPPER(phone_number::text)) gin_trgm_ops)",
+]
+POSTGRES_REVERSE = [
+    "DROP INDEX IF EXISTS users_userprofile_phone_trgm",
+    "DROP INDEX IF EXISTS bot_interactionlog_content_trgm",
+]
+
+SQLITE_FORWARD = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS bot_interactionlog_fts USING fts5("
+    "message_content, content='bot_interactionlog', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS bot_interactionlog_fts_ai AFTER INSERT ON bot_interactionlog "
+    "BEGIN INSERT INTO bot_interactionlog_fts(rowid, message_content) "
+    "VALUES (new.id, new.message_content); END",
+    "CREATE TRIGGER IF NOT EXISTS bot_interactionlog_fts_ad AFTER DELETE ON bot_interactionlog "
+    "BEGIN INSERT INTO bot_interactionlog_fts(bot_interactionlog_fts, rowid, message_content) "
+    "VALUES ('delete', old.id, old.message_content); END",
+    "CREATE TRIGGER IF NOT EXISTS bot_interactionlog_fts_au AFTER UPDATE ON bot_interactionlog "
+    "BEGIN INSERT INTO bot_interactionlog_fts(bot_interactionlog_fts, rowid, message_content) "
+    "VALUES ('delete', old.id, old.message_content); "
+    "INSERT INTO bot_interactionlog_fts(rowid, message_content) "
+    "VALUES (new.id, new.message_content); END",
+    "INSERT INTO bot_interactionlog_fts(bot_interactionlog_fts) VALUES ('rebuild')",
+]
+SQLITE_REVERSE = [
+    "DROP TRIGGER IF EXISTS bot_interactionlog_fts_au",
+    "DROP TRIGGER IF EXISTS bot_interactionlog_fts_ad",
+    "DROP TRIGGER IF EXISTS bot_interactionlog_fts_ai",
+    "DROP TABLE IF EXISTS bot_interactionlog_fts",
+]
+
+
+def _run(statements_by_vendor):
+    def run(apps, schema_editor):
+        for statement in statements_by_vendor.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bot", "0003_partition_interactionlog"),
+        ("users", "0002_userprofile_last_activity_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _run({"postgresql": POSTGRES_FORWARD, "sqlite": SQLITE_FORWARD}),
+            _run({"postgresql": POSTGRES_REVERSE, "sqlite": SQLITE_REVERSE}),
+        ),
+    ]
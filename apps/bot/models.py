@@ -1,5 +1,6 @@
 from django.db import models
-from django.db.models import Avg
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from apps.core.models import TimeStampedModel
 from apps.users.models import UserProfile
 from config.env import WahaSettings, settings
@@ -82,6 +83,103 @@ class InteractionLog(TimeStampedModel):
     def __str__(self):
         return f"[{self.message_type}] {self.user.phone_number}: {self.message_content[:50]}..."
 
+    @classmethod
+    def count_per_user(cls):
+        """
+        Expressão para ``UserProfile.objects.annotate(...)`` com o total de interações.
+
+        Uma subconsulta correlacionada por usuário (índice ``user, -created_at``)
+        em vez de ``Count('interactions')``, que agruparia a tabela inteira
+        antes de paginar os usuários.
+        """
+        counts = (
+            cls.objects.filter(user=OuterRef('pk'))
+            .order_by()
+            .values('user')
+            .annotate(total=Count('id'))
+            .values('total')
+        )
+        return Coalesce(Subquery(counts, output_field=models.IntegerField()), 0)
+
+
+ROLLUP_GRANULARITIES = (
+    ('minute', 'Minuto'),
+    ('hour', 'Hora'),
+)
+
+
+class BotHealthRollup(TimeStampedModel):
+    """
+    Agregado de ``BotHealthCheck`` por minuto ou hora (mantido por ``apps.bot.rollups``).
+    """
+    granularity = models.CharField(max_length=10, choices=ROLLUP_GRANULARITIES)
+    bucket_start = models.DateTimeField(help_text="Início do intervalo (UTC)")
+    total_checks = models.PositiveIntegerField(default=0)
+    online_checks = models.PositiveIntegerField(default=0)
+    response_time_count = models.PositiveIntegerField(default=0, help_text="Amostras válidas de latência")
+    response_time_sum = models.FloatField(default=0, help_text="Soma das latências válidas (ms)")
+    response_time_p50 = models.FloatField(null=True, blank=True)
+    response_time_p95 = models.FloatField(null=True, blank=True)
+    response_time_p99 = models.FloatField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-bucket_start']
+        verbose_name = 'Agregado de Saúde do Bot'
+        verbose_name_plural = 'Agregados de Saúde do Bot'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['granularity', 'bucket_start'], name='unique_health_rollup_bucket'
+            ),
+        ]
+
+    @property
+    def uptime_percentage(self):
+        if not self.total_checks:
+            return 0
+        return round(self.online_checks / self.total_checks * 100, 2)
+
+    def __str__(self):
+        return f"{self.granularity} {self.bucket_start:%Y-%m-%d %H:%M}: {self.uptime_percentage}%"
+
+
+class InteractionRollup(TimeStampedModel):
+    """
+    Agregado de ``InteractionLog`` por minuto ou hora (mantido por ``apps.bot.rollups``).
+    """
+    granularity = models.CharField(max_length=10, choices=ROLLUP_GRANULARITIES)
+    bucket_start = models.DateTimeField(help_text="Início do intervalo (UTC)")
+    messages_sent = models.PositiveIntegerField(default=0)
+    messages_received = models.PositiveIntegerField(default=0)
+    unique_users = models.PositiveIntegerField(default=0, help_text="Usuários distintos no intervalo")
+
+    class Meta:
+        ordering = ['-bucket_start']
+        verbose_name = 'Agregado de Interações'
+        verbose_name_plural = 'Agregados de Interações'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['granularity', 'bucket_start'], name='unique_interaction_rollup_bucket'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.granularity} {self.bucket_start:%Y-%m-%d %H:%M}: {self.messages_received}/{self.messages_sent}"
+
+
+class RollupWatermark(TimeStampedModel):
+    """
+    Até onde cada agregado já foi calculado; tudo antes de ``processed_until`` está nos rollups.
+    """
+    name = models.CharField(max_length=50, unique=True)
+    processed_until = models.DateTimeField()
+
+    class Meta:
+        verbose_name = 'Marca d\'água de Agregação'
+        verbose_name_plural = 'Marcas d\'água de Agregação'
+
+    def __str__(self):
+        return f"{self.name}: {self.processed_until}"
+
 
 class BotConfiguration(TimeStampedModel):
     """Configurações persistentes do bot controladas pelo dashboard."""
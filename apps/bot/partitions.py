@@ -0,0 +1,168 @@
+"""
+Monthly partitions and retention for ``InteractionLog``.
+
+On PostgreSQL the table is range-partitioned by ``created_at`` (migration
+``0003_partition_interactionlog``), one partition per month named
+``bot_interactionlog_pYYYYMM`` (UTC months, the connection time zone) plus a
+default partition as a safety net. Retention then detaches and drops whole
+months, which is instant and takes no row locks. Other databases (SQLite in
+development) fall back to deleting expired rows in small batches.
+"""
+import re
+from datetime import date, datetime, timedelta
+from typing import List, Optional
+
+import structlog
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.bot.models import InteractionLog
+from apps.core.bulk_delete import delete_in_batches
+from config.env import settings
+
+logger = structlog.get_logger(__name__)
+
+PARTITION_PATTERN = re.compile(r"_p(\d{4})(\d{2})$")
+
+
+def _month_start(value: date) -> date:
+    return value.replace(day=1)
+
+
+def _add_months(value: date, months: int) -> date:
+    month = value.month - 1 + months
+    return date(value.year + month // 12, month % 12 + 1, 1)
+
+
+class InteractionLogPartitionManager:
+    """
+    Creates upcoming monthly partitions and enforces the retention policy.
+    """
+
+    def __init__(
+        self, retention_days: Optional[int] = None, batch_size: Optional[int] = None
+    ) -> None:
+        """
+        Initialize the manager.
+
+        Args:
+            retention_days: Days of history to keep (defaults to settings)
+            batch_size: Rows per batch in the chunked purge (defaults to settings)
+        """
+        self.retention_days = retention_days or settings.retention.interaction_log_days
+        self.batch_size = batch_size or settings.retention.purge_batch_size
+        self.table = InteractionLog._meta.db_table
+
+    def is_partitioned(self) -> bool:
+        """Whether the table is a native PostgreSQL partitioned table."""
+        if connection.vendor != "postgresql":
+            return False
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT relkind FROM pg_class WHERE relname = %s", [self.table])
+            row = cursor.fetchone()
+        return bool(row) and row[0] == "p"
+
+    def partition_name(self, month: date) -> str:
+        return f"{self.table}_p{month:%Y%m}"
+
+    def list_partitions(self) -> List[str]:
+        """Names of the monthly partitions currently attached."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT child.relname
+                FROM pg_inherits
+                JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+                JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+                WHERE parent.relname = %s
+                ORDER BY child.relname
+                """,
+                [self.table],
+            )
+            names = [row[0] for row in cursor.fetchall()]
+        return [name for name in names if PARTITION_PATTERN.search(name)]
+
+    def ensure_partitions(self, months_ahead: int = 2, today: Optional[date] = None) -> List[str]:
+        """
+        Create the partitions for the current and the next months.
+
+        Args:
+            months_ahead: How many months after the current one to prepare
+            today: Reference date (defaults to today)
+
+        Returns:
+            Names of the partitions created
+        """
+        first = _month_start(today or timezone.now().date())
+        existing = set(self.list_partitions())
+        created = []
+        with connection.cursor() as cursor:
+            for offset in range(months_ahead + 1):
+                month = _add_months(first, offset)
+                name = self.partition_name(month)
+                if name in existing:
+                    continue
+                cursor.execute(
+                    f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF "{self.table}" '
+                    f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_add_months(month, 1).isoformat()}')"
+                )
+                created.append(name)
+        if created:
+            logger.info("interaction_log_partitions_created", partitions=created)
+        return created
+
+    def drop_expired_partitions(self, now: Optional[datetime] = None) -> List[str]:
+        """
+        Drop every monthly partition that ends before the retention cut-off.
+
+        Args:
+            now: Reference time (defaults to the current time)
+
+        Returns:
+            Names of the partitions dropped
+        """
+        cutoff = ((now or timezone.now()) - timedelta(days=self.retention_days)).date()
+        dropped = []
+        for name in self.list_partitions():
+            year, month = map(int, PARTITION_PATTERN.search(name).groups())
+            if _add_months(date(year, month, 1), 1) > cutoff:
+                continue
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute(f'ALTER TABLE "{self.table}" DETACH PARTITION "{name}"')
+                cursor.execute(f'DROP TABLE "{name}"')
+            dropped.append(name)
+        if dropped:
+            logger.info("interaction_log_partitions_dropped", partitions=dropped)
+        return dropped
+
+    def purge_in_batches(self, now: Optional[datetime] = None) -> int:
+        """
+        Delete expired rows in primary-key batches, each in its own transaction.
+
+        Args:
+            now: Reference time (defaults to the current time)
+
+        Returns:
+            Number of rows deleted
+        """
+        cutoff = (now or timezone.now()) - timedelta(days=self.retention_days)
+        expired = InteractionLog.objects.filter(created_at__lt=cutoff)
+        deleted = delete_in_batches(expired, self.batch_size)
+        if deleted:
+            logger.info("interaction_log_purged", rows=deleted, cutoff=cutoff.isoformat())
+        return deleted
+
+    def enforce_retention(self, now: Optional[datetime] = None) -> dict:
+        """
+        Apply the retention policy with the strategy the database supports.
+
+        Args:
+            now: Reference time (defaults to the current time)
+
+        Returns:
+            dict describing what was done
+        """
+        if self.is_partitioned():
+            created = self.ensure_partitions(today=now.date() if now else None)
+            return {"created": created, "dropped": self.drop_expired_partitions(now)}
+        return {"purged": self.purge_in_batches(now)}
@@ -0,0 +1,161 @@
+"""
+Per-chat sliding-window rate limits for the bot.
+
+Each (action, chat) pair keeps the timestamps of its recent hits in a Redis
+sorted set. One Lua call drops the hits older than the window, counts the
+rest and records the new hit only if it is under the limit, so the check is
+atomic across gunicorn workers and Celery. When Redis is unreachable the
+limiter switches to per-process deques for ``FALLBACK_SECONDS`` before trying
+Redis again; limits then hold per worker instead of globally.
+"""
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+import structlog
+
+from config.env import settings
+from infra.observability.metrics import RATE_LIMITED
+from infra.redis import get_redis_client
+
+logger = structlog.get_logger(__name__)
+
+MESSAGE = "message"
+LOGIN = "login"
+SEARCH = "search"
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """At most ``limit`` hits per ``window_seconds``; a limit of 0 disables it."""
+
+    limit: int
+    window_seconds: int
+
+
+def default_limits() -> Dict[str, RateLimit]:
+    """Limits per action class from the environment."""
+    rate_limits = settings.rate_limits
+    return {
+        MESSAGE: RateLimit(rate_limits.messages, rate_limits.messages_window_seconds),
+        LOGIN: RateLimit(rate_limits.login_attempts, rate_limits.login_window_seconds),
+        SEARCH: RateLimit(rate_limits.searches, rate_limits.search_window_seconds),
+    }
+
+
+_SLIDING_WINDOW_SCRIPT = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[3]) then
+    return 0
+end
+redis.call('ZADD', KEYS[1], now, ARGV[4])
+redis.call('PEXPIRE', KEYS[1], window)
+return 1
+"""
+
+
+class SlidingWindowRateLimiter:
+    """
+    Sliding-window limiter keyed by action class and chat id.
+    """
+
+    KEY_PREFIX = "capyvagas:ratelimit"
+    # How long to stay on the in-memory fallback after a Redis error
+    FALLBACK_SECONDS = 30
+    # Keys kept by the in-memory fallback (least recently used are evicted)
+    MAX_LOCAL_KEYS = 10_000
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, RateLimit]] = None,
+        client=None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize the limiter.
+
+        Args:
+            limits: Limit per action class (defaults to the environment)
+            client: Redis client (optional, defaults to the shared client)
+            clock: Time source in seconds
+        """
+        self.limits = limits if limits is not None else default_limits()
+        self.client = client if client is not None else get_redis_client()
+        self.clock = clock
+        self._script = self.client.register_script(_SLIDING_WINDOW_SCRIPT) if self.client else None
+        self._redis_retry_at = 0.0
+        self._local: "OrderedDict[Tuple[str, str], Deque[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _key(self, action: str, key: str) -> str:
+        return f"{self.KEY_PREFIX}:{action}:{key}"
+
+    def _hit_redis(self, action: str, key: str, rule: RateLimit, now: float) -> bool:
+        now_ms = int(now * 1000)
+        member = f"{now_ms}:{uuid.uuid4().hex[:8]}"
+        allowed = self._script(
+            keys=[self._key(action, key)],
+            args=[now_ms, rule.window_seconds * 1000, rule.limit, member],
+        )
+        return bool(allowed)
+
+    def _hit_local(self, action: str, key: str, rule: RateLimit, now: float) -> bool:
+        with self._lock:
+            hits = self._local.pop((action, key), None) or deque()
+            while hits and hits[0] <= now - rule.window_seconds:
+                hits.popleft()
+            allowed = len(hits) < rule.limit
+            if allowed:
+                hits.append(now)
+            self._local[(action, key)] = hits
+            while len(self._local) > self.MAX_LOCAL_KEYS:
+                self._local.popitem(last=False)
+        return allowed
+
+    def hit(self, action: str, key: str) -> bool:
+        """
+        Record one hit of an action, unless it is over the limit.
+
+        Args:
+            action: Action class (``MESSAGE``, ``LOGIN`` or ``SEARCH``)
+            key: Who is being limited (the chat id)
+
+        Returns:
+            True if the action may proceed
+        """
+        rule = self.limits.get(action)
+        if rule is None or rule.limit <= 0:
+            return True
+
+        now = self.clock()
+        allowed = None
+        if self._script is not None and now >= self._redis_retry_at:
+            try:
+                allowed = self._hit_redis(action, key, rule, now)
+            except Exception as e:
+                self._redis_retry_at = now + self.FALLBACK_SECONDS
+                logger.warning("rate_limit_store_unavailable", error=str(e))
+        if allowed is None:
+            allowed = self._hit_local(action, key, rule, now)
+
+        if not allowed:
+            RATE_LIMITED.labels(action=action).inc()
+            logger.info("rate_limited", action=action, key=key)
+        return allowed
+
+
+# Global instance
+_limiter: Optional[SlidingWindowRateLimiter] = None
+
+
+def get_rate_limiter() -> SlidingWindowRateLimiter:
+    """Get or create the per-process rate limiter."""
+    global _limiter
+    if _limiter is None:
+        _limiter = SlidingWindowRateLimiter()
+    return _limiter
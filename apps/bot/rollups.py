@@ -0,0 +1,329 @@
+"""
+Incremental per-minute and per-hour rollups of health checks and interactions.
+
+``update_rollups`` (run by Celery beat) folds closed buckets of the raw
+``BotHealthCheck`` and ``InteractionLog`` tables into ``BotHealthRollup`` and
+``InteractionRollup``. Each (source, granularity) pair keeps a
+``RollupWatermark``: everything before ``processed_until`` is already rolled up,
+so a run only scans rows written since the previous one. Readers combine the
+rollups with the short raw tail after the watermark. Minute buckets are only
+read for windows up to ``MINUTE_RETENTION`` and are pruned after that.
+"""
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+import structlog
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import TruncHour, TruncMinute
+from django.utils import timezone
+
+from apps.bot.models import (
+    BotHealthCheck,
+    BotHealthRollup,
+    InteractionLog,
+    InteractionRollup,
+    RollupWatermark,
+)
+
+logger = structlog.get_logger(__name__)
+
+MINUTE = "minute"
+HOUR = "hour"
+BUCKET_SIZES = {MINUTE: timedelta(minutes=1), HOUR: timedelta(hours=1)}
+TRUNCATE = {MINUTE: TruncMinute, HOUR: TruncHour}
+
+# Rows may still be committing for the bucket that just closed
+SETTLE_DELAY = timedelta(seconds=30)
+# Upper bound on how much history one run folds in (first run / long outage)
+MAX_SPAN_PER_RUN = timedelta(days=7)
+# Longest window served from minute buckets (see ``health_window_totals``)
+MINUTE_RETENTION = timedelta(days=1)
+# Same cut-off the health summary uses for timeouts
+MAX_VALID_RESPONSE_MS = 5000
+
+
+def floor_bucket(value: datetime, granularity: str) -> datetime:
+    """
+    Truncate a datetime to the start of its UTC bucket.
+
+    Args:
+        value: Aware datetime
+        granularity: ``"minute"`` or ``"hour"``
+
+    Returns:
+        Bucket start in UTC
+    """
+    value = value.astimezone(dt_timezone.utc).replace(second=0, microsecond=0)
+    if granularity == HOUR:
+        value = value.replace(minute=0)
+    return value
+
+
+def percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    """
+    Nearest-rank percentile of an already sorted list.
+
+    Args:
+        sorted_values: Values in ascending order
+        pct: Percentile between 0 and 100
+
+    Returns:
+        The percentile, or None for an empty list
+    """
+    if not sorted_values:
+        return None
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def _health_rollups(start: datetime, end: datetime, granularity: str) -> List[BotHealthRollup]:
+    # Percentiles need the individual samples, so health checks are grouped in
+    # Python; at one probe every 30s this is a handful of rows per bucket.
+    buckets: Dict[datetime, dict] = defaultdict(lambda: {"total": 0, "online": 0, "samples": []})
+    rows = BotHealthCheck.objects.filter(created_at__gte=start, created_at__lt=end).values_list(
+        "created_at", "status", "response_time"
+    )
+    for created_at, status, response_time in rows.iterator(chunk_size=2000):
+        bucket = buckets[floor_bucket(created_at, granularity)]
+        bucket["total"] += 1
+        bucket["online"] += status == "online"
+        if response_time is not None and response_time < MAX_VALID_RESPONSE_MS:
+            bucket["samples"].append(response_time)
+
+    rollups = []
+    for bucket_start, bucket in buckets.items():
+        samples = sorted(bucket["samples"])
+        rollups.append(
+            BotHealthRollup(
+                granularity=granularity,
+                bucket_start=bucket_start,
+                total_checks=bucket["total"],
+                online_checks=bucket["online"],
+                response_time_count=len(samples),
+                response_time_sum=sum(samples),
+                response_time_p50=percentile(samples, 50),
+                response_time_p95=percentile(samples, 95),
+                response_time_p99=percentile(samples, 99),
+            )
+        )
+    return rollups
+
+
+def _interaction_rollups(
+    start: datetime, end: datetime, granularity: str
+) -> List[InteractionRollup]:
+    rows = (
+        InteractionLog.objects.filter(created_at__gte=start, created_at__lt=end)
+        .annotate(bucket=TRUNCATE[granularity]("created_at", tzinfo=dt_timezone.utc))
+        .values("bucket")
+        .annotate(
+            sent=Count("id", filter=Q(message_type="SENT")),
+            received=Count("id", filter=Q(message_type="RECEIVED")),
+            users=Count("user", distinct=True),
+        )
+        .order_by()
+    )
+    return [
+        InteractionRollup(
+            granularity=granularity,
+            bucket_start=row["bucket"],
+            messages_sent=row["sent"],
+            messages_received=row["received"],
+            unique_users=row["users"],
+        )
+        for row in rows
+    ]
+
+
+ROLLUPS: Dict[str, Tuple[type, type, Callable]] = {
+    "health": (BotHealthCheck, BotHealthRollup, _health_rollups),
+    "interactions": (InteractionLog, InteractionRollup, _interaction_rollups),
+}
+
+
+def watermark_name(source: str, granularity: str) -> str:
+    return f"{source}:{granularity}"
+
+
+def _advance(source: str, granularity: str, now: datetime) -> int:
+    raw_model, rollup_model, build = ROLLUPS[source]
+    name = watermark_name(source, granularity)
+    end = floor_bucket(now - SETTLE_DELAY, granularity)
+
+    with transaction.atomic():
+        watermark = RollupWatermark.objects.select_for_update().filter(name=name).first()
+        if watermark is not None:
+            start = watermark.processed_until
+        else:
+            oldest = raw_model.objects.order_by("created_at").values_list("created_at", flat=True).first()
+            start = floor_bucket(oldest, granularity) if oldest else end
+        end = min(end, start + MAX_SPAN_PER_RUN)
+        if end <= start:
+            return 0
+
+        rollups = build(start, end, granularity)
+        rollup_model.objects.bulk_create(
+            rollups,
+            update_conflicts=True,
+            unique_fields=["granularity", "bucket_start"],
+            update_fields=[
+                f.name
+                for f in rollup_model._meta.concrete_fields
+                if not f.primary_key and f.name not in ("granularity", "bucket_start", "created_at")
+            ],
+        )
+        RollupWatermark.objects.update_or_create(name=name, defaults={"processed_until": end})
+
+    logger.info("rollup_advanced", rollup=name, buckets=len(rollups), processed_until=end.isoformat())
+    return len(rollups)
+
+
+def update_rollups(now: Optional[datetime] = None) -> Dict[str, int]:
+    """
+    Fold every closed bucket since the last run into the rollup tables.
+
+    Args:
+        now: Reference time (defaults to the current time)
+
+    Returns:
+        Buckets written per watermark name
+    """
+    now = now or timezone.now()
+    written = {
+        watermark_name(source, granularity): _advance(source, granularity, now)
+        for source in ROLLUPS
+        for granularity in BUCKET_SIZES
+    }
+    prune_minute_rollups(now)
+    return written
+
+
+def prune_minute_rollups(now: Optional[datetime] = None) -> int:
+    """
+    Delete minute buckets older than any window that still reads them.
+
+    Hourly buckets are kept; they serve the longer windows.
+
+    Args:
+        now: Reference time (defaults to the current time)
+
+    Returns:
+        Number of rollup rows deleted
+    """
+    now = now or timezone.now()
+    # Rounded down to the hour so a window of exactly MINUTE_RETENTION stays whole
+    cutoff = floor_bucket(now - MINUTE_RETENTION, HOUR)
+    deleted = 0
+    for _, rollup_model, _ in ROLLUPS.values():
+        count, _ = rollup_model.objects.filter(granularity=MINUTE, bucket_start__lt=cutoff).delete()
+        deleted += count
+    if deleted:
+        logger.info("minute_rollups_pruned", deleted=deleted, cutoff=cutoff.isoformat())
+    return deleted
+
+
+def _watermarks() -> Dict[str, datetime]:
+    return dict(RollupWatermark.objects.values_list("name", "processed_until"))
+
+
+def interaction_totals(since: Optional[datetime] = None) -> Dict[str, int]:
+    """
+    Count sent and received messages from hourly rollups plus the raw tail.
+
+    Hourly buckets are counted whole, so ``since`` is effectively rounded
+    down to the hour. Unique users cannot be summed across buckets and are
+    not returned here.
+
+    Args:
+        since: Start of the period (None for all time)
+
+    Returns:
+        dict with ``messages_sent`` and ``messages_received``
+    """
+    tail_start = _watermarks().get(watermark_name("interactions", HOUR))
+    totals = {"messages_sent": 0, "messages_received": 0}
+
+    if tail_start is not None:
+        rollups = InteractionRollup.objects.filter(granularity=HOUR, bucket_start__lt=tail_start)
+        if since is not None:
+            rollups = rollups.filter(bucket_start__gte=floor_bucket(since, HOUR))
+        summed = rollups.aggregate(sent=Sum("messages_sent"), received=Sum("messages_received"))
+        totals["messages_sent"] += summed["sent"] or 0
+        totals["messages_received"] += summed["received"] or 0
+        if since is not None:
+            tail_start = max(tail_start, since)
+    else:
+        tail_start = since
+
+    raw = InteractionLog.objects.all()
+    if tail_start is not None:
+        raw = raw.filter(created_at__gte=tail_start)
+    counted = raw.aggregate(
+        sent=Count("id", filter=Q(message_type="SENT")),
+        received=Count("id", filter=Q(message_type="RECEIVED")),
+    )
+    totals["messages_sent"] += counted["sent"]
+    totals["messages_received"] += counted["received"]
+    return totals
+
+
+def health_window_totals(since_by_key: Dict[object, datetime]) -> Dict[object, dict]:
+    """
+    Sum health checks for several windows from rollups plus the raw tail.
+
+    Windows up to a day read minute rollups, longer ones hourly rollups;
+    rows after each granularity's watermark come from ``BotHealthCheck``.
+    Three queries regardless of the number of windows.
+
+    Args:
+        since_by_key: Window start per caller-chosen key
+
+    Returns:
+        Per key: ``total``, ``online``, ``response_sum`` and ``response_count``
+    """
+    now = timezone.now()
+    watermarks = _watermarks()
+
+    rollup_aggregates = {}
+    tail_starts = {}
+    for key, since in since_by_key.items():
+        granularity = MINUTE if now - since <= timedelta(days=1) else HOUR
+        processed_until = watermarks.get(watermark_name("health", granularity))
+        if processed_until is None or processed_until <= since:
+            tail_starts[key] = since
+            continue
+        tail_starts[key] = processed_until
+        in_window = Q(granularity=granularity, bucket_start__gte=since, bucket_start__lt=processed_until)
+        rollup_aggregates[f"total_{key}"] = Sum("total_checks", filter=in_window)
+        rollup_aggregates[f"online_{key}"] = Sum("online_checks", filter=in_window)
+        rollup_aggregates[f"rsum_{key}"] = Sum("response_time_sum", filter=in_window)
+        rollup_aggregates[f"rcount_{key}"] = Sum("response_time_count", filter=in_window)
+
+    from_rollups = BotHealthRollup.objects.aggregate(**rollup_aggregates) if rollup_aggregates else {}
+
+    valid_response = Q(response_time__isnull=False, response_time__lt=MAX_VALID_RESPONSE_MS)
+    tail_aggregates = {}
+    for key, tail_start in tail_starts.items():
+        in_tail = Q(created_at__gte=tail_start)
+        tail_aggregates[f"total_{key}"] = Count("id", filter=in_tail)
+        tail_aggregates[f"online_{key}"] = Count("id", filter=in_tail & Q(status="online"))
+        tail_aggregates[f"rsum_{key}"] = Sum("response_time", filter=in_tail & valid_response)
+        tail_aggregates[f"rcount_{key}"] = Count("response_time", filter=in_tail & valid_response)
+    from_tail = BotHealthCheck.objects.filter(created_at__gte=min(tail_starts.values())).aggregate(
+        **tail_aggregates
+    )
+
+    def combined(field, key):
+        return (from_rollups.get(f"{field}_{key}") or 0) + (from_tail[f"{field}_{key}"] or 0)
+
+    return {
+        key: {
+            "total": combined("total", key),
+            "online": combined("online", key),
+            "response_sum": combined("rsum", key),
+            "response_count": combined("rcount", key),
+        }
+        for key in since_by_key
+    }
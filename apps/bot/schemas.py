@@ -0,0 +1,56 @@
+"""Validated schemas for inbound WAHA webhook payloads."""
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+
+class WahaMessagePayload(BaseModel):
+    """Subset of the WAHA message payload consumed by the bot."""
+
+    model_config = ConfigDict(extra="ignore", populate_by_name=True)
+
+    id: Optional[str] = None
+    from_: Optional[str] = Field(default=None, alias="from")
+    body: Optional[str] = None
+    from_me: bool = Field(default=False, alias="fromMe")
+
+
+class WahaWebhookEvent(BaseModel):
+    """Envelope of a WAHA webhook delivery."""
+
+    model_config = ConfigDict(extra="ignore")
+
+    event: Optional[str] = None
+    session: Optional[str] = None
+    payload: WahaMessagePayload = Field(default_factory=WahaMessagePayload)
+
+    @property
+    def is_message(self) -> bool:
+        """Whether this delivery is a text message event (message, message.any...)."""
+        return bool(self.event and "message" in self.event and self.payload.body)
+
+
+def parse_webhook(body: bytes) -> WahaWebhookEvent:
+    """
+    Decode and validate a raw webhook body.
+
+    Uses orjson when installed; otherwise falls back to pydantic's native JSON
+    parser, which avoids building intermediate dicts for ignored fields.
+
+    Args:
+        body: Raw request body
+
+    Returns:
+        Validated webhook event
+
+    Raises:
+        ValueError: If the body is not valid JSON or does not match the schema
+    """
+    if orjson is not None:
+        return WahaWebhookEvent.model_validate(orjson.loads(body))
+    return WahaWebhookEvent.model_validate_json(body)
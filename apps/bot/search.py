@@ -0,0 +1,63 @@
+"""
+Indexed substring search over ``InteractionLog``.
+
+Migration ``0004_interactionlog_search_index`` creates the index the
+database supports:
+
+* PostgreSQL: ``pg_trgm`` GIN indexes on ``message_content`` and on the
+  user's phone number, so ``__icontains`` becomes a bitmap index scan.
+* SQLite: an external-content FTS5 table with the ``trigram`` tokenizer,
+  kept in sync by triggers, queried with ``MATCH``.
+
+``search_interactions`` builds the matching filter; user fields are matched
+through a subquery on ``UserProfile`` so each side can use its own index.
+"""
+from django.db import connection
+from django.db.models import Q, QuerySet
+from django.db.models.expressions import RawSQL
+
+from apps.users.models import UserProfile
+
+FTS_TABLE = "bot_interactionlog_fts"
+# The trigram tokenizer cannot match anything shorter than one trigram
+FTS_MIN_TERM_LENGTH = 3
+
+_fts_available_cache = {}
+
+
+def _fts_available() -> bool:
+    if connection.vendor != "sqlite":
+        return False
+    if connection.alias not in _fts_available_cache:
+        _fts_available_cache[connection.alias] = (
+            FTS_TABLE in connection.introspection.table_names()
+        )
+    return _fts_available_cache[connection.alias]
+
+
+def _content_filter(term: str) -> Q:
+    if len(term) >= FTS_MIN_TERM_LENGTH and _fts_available():
+        phrase = '"' + term.replace('"', '""') + '"'
+        return Q(
+            pk__in=RawSQL(f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", [phrase])
+        )
+    return Q(message_content__icontains=term)
+
+
+def search_interactions(queryset: QuerySet, search: str) -> QuerySet:
+    """
+    Filter interactions whose content, phone number or RA contains every term.
+
+    Args:
+        queryset: ``InteractionLog`` queryset
+        search: Space-separated search terms
+
+    Returns:
+        Filtered queryset
+    """
+    for term in search.split():
+        users = UserProfile.objects.filter(
+            Q(phone_number__icontains=term) | Q(ra__icontains=term)
+        ).values("pk")
+        queryset = queryset.filter(_content_filter(term) | Q(user_id__in=users))
+    return queryset
@@ -1,8 +1,17 @@
 """Refactored bot service using handler pattern and separation of concerns."""
 import structlog
 
-from apps.bot.handlers import AuthenticationHandler, JobSearchHandler, MenuHandler
+from apps.bot.counters import get_interaction_counters
+from apps.bot.handlers import (
+    AuthenticationHandler,
+    JobAlertHandler,
+    JobSearchHandler,
+    MenuHandler,
+)
+from apps.bot.instrumentation import message_profile
 from apps.bot.models import BotConfiguration, InteractionLog
+from apps.bot.ratelimit import SlidingWindowRateLimiter, get_rate_limiter
+from apps.users.activity import get_activity_tracker
 from apps.users.models import UserProfile
 from apps.users.services import UTFPRAuthService
 from infra.jobspy.service import JobSearchService
@@ -24,6 +33,7 @@ class BotService:
         auth_service: UTFPRAuthService | None = None,
         job_service: JobSearchService | None = None,
         waha_client: WahaClient | None = None,
+        rate_limiter: SlidingWindowRateLimiter | None = None,
     ) -> None:
         """
         Initialize bot service with dependencies.
@@ -32,15 +42,19 @@ class BotService:
             auth_service: Authentication service (optional, will create default)
             job_service: Job search service (optional, will create default)
             waha_client: WAHA client (optional, will create default)
+            rate_limiter: Per-chat rate limiter (optional, defaults to shared)
         """
-        waha_settings = BotConfiguration.get_active()
         self.auth_service = auth_service or UTFPRAuthService()
         self.job_service = job_service or JobSearchService()
-        self.waha_client = waha_client or WahaClient(settings=waha_settings)
+        self.waha_client = waha_client or WahaClient(settings=BotConfiguration.get_active())
+        self.rate_limiter = rate_limiter or get_rate_limiter()
 
         # Initialize handlers
-        self.auth_handler = AuthenticationHandler(self.waha_client, self.auth_service)
-        self.job_handler = JobSearchHandler(self.waha_client, self.job_service)
+        self.auth_handler = AuthenticationHandler(
+            self.waha_client, self.auth_service, self.rate_limiter
+        )
+        self.job_handler = JobSearchHandler(self.waha_client, self.job_service, self.rate_limiter)
+        self.alert_handler = JobAlertHandler(self.waha_client)
         self.menu_handler = MenuHandler(self.waha_client)
 
     def process_message(self, chat_id: str, message: str, from_me: bool) -> None:
@@ -52,6 +66,11 @@ class BotService:
             message: Message text
             from_me: Whether message was sent by the bot
         """
+        with message_profile(chat_id):
+            self._process_message(chat_id, message, from_me)
+
+    def _process_message(self, chat_id: str, message: str, from_me: bool) -> None:
+        """Route a message through global commands, pending actions and the menu."""
         # Ignore messages from bot itself
         if from_me:
             return
@@ -68,6 +87,8 @@ class BotService:
         except UserProfile.DoesNotExist:
             user = UserProfile.objects.create(phone_number=chat_id)
             logger.info("new_user_created", chat_id=chat_id)
+        else:
+            get_activity_tracker().touch(user.id)
 
         # Log received message
         self._log_received(user, message)
@@ -106,6 +127,10 @@ class BotService:
             self.job_handler.start_course_selection(user, chat_id)
             return
 
+        if text in {"4", "alertas", "alerta"}:
+            self.alert_handler.toggle(user, chat_id)
+            return
+
         # Unknown command
         self.menu_handler.send_unknown_command(user, chat_id)
 
@@ -142,7 +167,7 @@ class BotService:
         """
         user.current_action = None
         user.flow_data = {}
-        user.save(update_fields=["current_action", "flow_data", "last_activity"])
+        user.save(update_fields=["current_action", "flow_data"])
 
     def _log_received(self, user: UserProfile, message: str) -> None:
         """
@@ -159,6 +184,7 @@ class BotService:
                 message_type="RECEIVED",
                 session_id=self.waha_client.settings.session_name,
             )
+            get_interaction_counters().record(user.id, "RECEIVED")
         except Exception as e:
             logger.error(
                 "failed_to_log_received_message",
@@ -0,0 +1,59 @@
+"""Background tasks for the bot app."""
+from celery import shared_task
+
+from apps.bot.counters import get_interaction_counters
+from apps.bot.handlers import AuthenticationHandler
+from apps.bot.health import BotHealthMonitor
+from apps.bot.models import BotConfiguration
+from apps.bot.partitions import InteractionLogPartitionManager
+from apps.bot.rollups import update_rollups
+from apps.users.models import UserProfile
+from apps.users.services import UTFPRAuthService
+from infra.security import decrypt_field
+from infra.utfpr.portal import PortalUnavailableError
+from infra.waha.client import WahaClient
+
+
+@shared_task(ignore_result=True)
+def probe_bot_health() -> None:
+    """Probe WAHA and publish the result to the status cache (run by Celery beat)."""
+    BotHealthMonitor().check_bot_status()
+
+
+@shared_task(ignore_result=True)
+def refresh_rollups() -> None:
+    """Fold newly closed minutes and hours into the rollup tables (run by Celery beat)."""
+    update_rollups()
+
+
+@shared_task(ignore_result=True)
+def enforce_interaction_log_retention() -> None:
+    """Prepare upcoming partitions and drop or purge expired interaction logs."""
+    InteractionLogPartitionManager().enforce_retention()
+
+
+@shared_task(ignore_result=True)
+def backfill_interaction_counters() -> None:
+    """Seed the Redis interaction counters from past logs (run once after deploying them)."""
+    get_interaction_counters().backfill()
+
+
+@shared_task(bind=True, ignore_result=True, max_retries=3, default_retry_delay=10)
+def verify_portal_credentials(
+    self, user_id: int, chat_id: str, ra: str, encrypted_password: str
+) -> None:
+    """Log a user in on the UTFPR portal and reply on WhatsApp (queued by the login flow)."""
+    user = UserProfile.objects.filter(pk=user_id, current_action="login_verifying").first()
+    if user is None:
+        # Cancelled (or already handled) while queued
+        return
+    handler = AuthenticationHandler(
+        WahaClient(settings=BotConfiguration.get_active()), UTFPRAuthService()
+    )
+    try:
+        handler.complete_login(user, chat_id, ra, decrypt_field(encrypted_password))
+    except PortalUnavailableError as e:
+        if self.request.retries >= self.max_retries:
+            handler.portal_unavailable(user, chat_id)
+            return
+        raise self.retry(exc=e)
@@ -1,8 +1,10 @@
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from django.test import TestCase
 
 from apps.bot.services import BotService
+from apps.bot.tasks import verify_portal_credentials
+from apps.courses.cache import bump_catalog_version
 from apps.courses.models import Course, SearchTerm
 from apps.users.models import UserProfile
 
@@ -35,6 +37,9 @@ class BotServiceMenuTests(TestCase):
 
 class BotServiceFlowTests(TestCase):
     def setUp(self):
+        # The catalog is invalidated on commit, which never happens inside a
+        # TestCase: drop lists cached by earlier tests
+        bump_catalog_version()
         self.waha_client = MagicMock()
         self.waha_client.settings = MagicMock(session_name="test-session")
         self.job_service = MagicMock()
@@ -148,3 +153,60 @@ class BotServiceFlowTests(TestCase):
         self.service.process_message(chat_id, "3", from_me=False)
 
         self.job_service.search.assert_called_with(["Python", "Django"], limit=5)
+
+
+class BotServiceLoginVerificationTests(TestCase):
+    def setUp(self):
+        self.waha_client = MagicMock()
+        self.waha_client.settings = MagicMock(session_name="test-session")
+        self.auth_service = MagicMock()
+        self.service = BotService(waha_client=self.waha_client, auth_service=self.auth_service)
+        self.chat_id = "5511777666555@c.us"
+        self.user = UserProfile.objects.create(
+            phone_number=self.chat_id,
+            current_action="login_step_password",
+            flow_data={"temp_ra": "a1234567"},
+        )
+
+    def _run_task_with_service_handler(self):
+        def run(user_id, chat_id, ra, encrypted_password):
+            with patch("apps.bot.tasks.AuthenticationHandler", return_value=self.service.auth_handler):
+                verify_portal_credentials.run(user_id, chat_id, ra, encrypted_password)
+
+        return patch.object(verify_portal_credentials, "delay", side_effect=run)
+
+    def test_password_is_verified_once_in_background(self):
+        self.auth_service.authenticate.return_value = True
+        with self._run_task_with_service_handler() as delay:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.service.process_message(self.chat_id, "secret", from_me=False)
+
+        delay.assert_called_once()
+        self.assertNotIn("secret", delay.call_args.args)
+        self.auth_service.authenticate.assert_called_once_with("a1234567", "secret")
+        self.auth_service.link_user.assert_called_once_with(self.chat_id, "a1234567", "secret")
+        sent = [c.args[1] for c in self.waha_client.send_message.call_args_list]
+        self.assertIn("Validando", sent[0])
+        self.assertIn("Cadastro Confirmado", sent[-1])
+        self.user.refresh_from_db()
+        self.assertIsNone(self.user.current_action)
+
+    def test_rejected_password_returns_to_password_step(self):
+        self.auth_service.authenticate.return_value = False
+        with self._run_task_with_service_handler():
+            with self.captureOnCommitCallbacks(execute=True):
+                self.service.process_message(self.chat_id, "wrong", from_me=False)
+
+        self.auth_service.link_user.assert_not_called()
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.current_action, "login_step_password")
+        self.assertIn("Falha no login", self.waha_client.send_message.call_args[0][1])
+
+    def test_messages_while_verifying_get_a_wait_notice(self):
+        with patch.object(verify_portal_credentials, "delay"):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.service.process_message(self.chat_id, "secret", from_me=False)
+        self.service.process_message(self.chat_id, "oi", from_me=False)
+
+        self.assertIn("Ainda estou validando", self.waha_client.send_message.call_args[0][1])
+        self.auth_service.authenticate.assert_not_called()
@@ -0,0 +1,64 @@
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import redis
+from django.test import TestCase
+
+from apps.bot.counters import InteractionCounters, estimated_interaction_total
+from apps.bot.models import InteractionLog
+from apps.users.models import UserProfile
+
+TODAY = date(2025, 3, 10)
+
+
+class InteractionCountersTests(TestCase):
+    def setUp(self):
+        self.client = MagicMock()
+        self.counters = InteractionCounters(client=self.client, retention_days=30)
+
+    def test_record_pipelines_counter_and_hyperloglog(self):
+        pipe = self.client.pipeline.return_value
+
+        self.counters.record(7, "RECEIVED", day=TODAY)
+
+        pipe.incr.assert_called_once_with(
+            "capyvagas:counters:interactions:2025-03-10:RECEIVED"
+        )
+        pipe.pfadd.assert_called_once_with("capyvagas:counters:interactions:2025-03-10:users", 7)
+        pipe.execute.assert_called_once()
+
+    def test_message_counts_sum_daily_keys(self):
+        # SENT for today and yesterday, then RECEIVED for today and yesterday
+        self.client.mget.return_value = [b"3", None, b"5", b"2"]
+
+        counts = self.counters.message_counts(days=2, today=TODAY)
+
+        self.assertEqual(counts, {"SENT": 3, "RECEIVED": 7})
+        keys = self.client.mget.call_args[0][0]
+        self.assertEqual(keys[1], "capyvagas:counters:interactions:2025-03-09:SENT")
+
+    def test_unique_users_counts_union_of_days(self):
+        self.client.pfcount.return_value = 42
+
+        self.assertEqual(self.counters.unique_users(days=3, today=TODAY), 42)
+        self.assertEqual(len(self.client.pfcount.call_args[0]), 3)
+
+    def test_unavailable_redis_returns_none(self):
+        self.client.pfcount.side_effect = redis.ConnectionError("down")
+        self.client.pipeline.return_value.execute.side_effect = redis.ConnectionError("down")
+
+        self.counters.record(7, "SENT", day=TODAY)
+        self.assertIsNone(self.counters.unique_users(days=1, today=TODAY))
+
+    def test_without_redis_url_readers_return_none(self):
+        with patch("apps.bot.counters.get_redis_client", return_value=None):
+            counters = InteractionCounters()
+
+        self.assertIsNone(counters.message_counts())
+        self.assertIsNone(counters.unique_users())
+
+    def test_estimated_total_falls_back_to_count(self):
+        user = UserProfile.objects.create(phone_number="5511000000001@c.us")
+        InteractionLog.objects.create(user=user, message_content="oi", message_type="SENT")
+
+        self.assertEqual(estimated_interaction_total(), 1)
@@ -0,0 +1,112 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.bot.health import BotHealthMonitor
+from apps.bot.models import BotHealthCheck
+from apps.bot.tasks import probe_bot_health
+from apps.core.testing import LOCMEM_CACHE
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class BackgroundHealthProbeTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_probe_task_publishes_status_to_cache(self):
+        with patch("apps.bot.health.requests.get") as get_mock:
+            get_mock.return_value.status_code = 200
+            get_mock.return_value.json.return_value = {"status": "WORKING"}
+            probe_bot_health()
+
+        cached = cache.get(BotHealthMonitor.STATUS_CACHE_KEY)
+        self.assertEqual(cached["status"], "online")
+        self.assertEqual(BotHealthCheck.objects.count(), 1)
+
+    def test_cached_status_does_not_call_waha(self):
+        with patch("apps.bot.health.requests.get") as get_mock:
+            get_mock.return_value.status_code = 200
+            get_mock.return_value.json.return_value = {"status": "WORKING"}
+            BotHealthMonitor().check_bot_status()
+            get_mock.reset_mock()
+
+            status = BotHealthMonitor().get_cached_status()
+
+        get_mock.assert_not_called()
+        self.assertEqual(status["session_status"], "WORKING")
+
+    def test_cold_cache_falls_back_to_last_check(self):
+        BotHealthCheck.objects.create(status="offline", session_status="STOPPED")
+
+        with patch("apps.bot.health.requests.get") as get_mock:
+            status = BotHealthMonitor().get_cached_status()
+
+        get_mock.assert_not_called()
+        self.assertEqual(status["status"], "offline")
+        self.assertEqual(cache.get(BotHealthMonitor.STATUS_CACHE_KEY)["session_status"], "STOPPED")
+
+    def test_status_api_reads_from_cache(self):
+        cache.set(
+            BotHealthMonitor.STATUS_CACHE_KEY,
+            {
+                "status": "online",
+                "response_time": 12.0,
+                "session_status": "WORKING",
+                "last_check": "2025-01-01T00:00:00Z",
+                "error_message": None,
+            },
+        )
+
+        with patch("apps.bot.health.requests.get") as get_mock:
+            response = self.client.get("/api/bot/status/", secure=True)
+
+        get_mock.assert_not_called()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["status"], "online")
+        self.assertEqual(BotHealthCheck.objects.count(), 0)
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class HealthMetricsWindowsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        now = timezone.now()
+        rows = [
+            ("online", 100.0, None, timedelta(minutes=10)),
+            ("error", 5000.0, "Timeout ao conectar com WAHA", timedelta(hours=3)),
+            ("online", 300.0, None, timedelta(days=2)),
+            ("offline", None, "HTTP 502", timedelta(days=3)),
+        ]
+        for status, response_time, error, age in rows:
+            check = BotHealthCheck.objects.create(
+                status=status, response_time=response_time, error_message=error
+            )
+            BotHealthCheck.objects.filter(pk=check.pk).update(created_at=now - age)
+
+    def test_all_windows_computed_in_one_aggregate(self):
+        # watermarks + raw aggregate (no rollups yet) + last error
+        with self.assertNumQueries(3):
+            windows = BotHealthMonitor().get_metrics_windows([1, 24, 24 * 7])
+
+        self.assertEqual(windows[1]["total_checks"], 1)
+        self.assertEqual(windows[1]["uptime_percentage"], 100.0)
+        self.assertIsNone(windows[1]["last_error"])
+
+        self.assertEqual(windows[24]["total_checks"], 2)
+        self.assertEqual(windows[24]["error_count"], 1)
+        self.assertEqual(windows[24]["avg_response_time"], 100.0)
+        self.assertEqual(windows[24]["last_error"], "Timeout ao conectar com WAHA")
+
+        self.assertEqual(windows[24 * 7]["total_checks"], 4)
+        self.assertEqual(windows[24 * 7]["uptime_percentage"], 50.0)
+        self.assertEqual(windows[24 * 7]["avg_response_time"], 200.0)
+
+    def test_metrics_are_cached_briefly(self):
+        monitor = BotHealthMonitor()
+        first = monitor.get_metrics_summary(hours=24)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(monitor.get_metrics_summary(hours=24), first)
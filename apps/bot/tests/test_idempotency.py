@@ -0,0 +1,88 @@
+import json
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from apps.bot.idempotency import BloomFilter, WebhookDeduplicator
+from apps.core.testing import LOCMEM_CACHE
+
+
+class BloomFilterTests(TestCase):
+    def test_add_reports_previously_seen_keys(self):
+        bloom = BloomFilter(capacity=100)
+
+        self.assertFalse(bloom.add("msg-1"))
+        self.assertTrue(bloom.add("msg-1"))
+        self.assertFalse(bloom.add("msg-2"))
+
+    def test_filter_rotates_when_full(self):
+        bloom = BloomFilter(capacity=2)
+        bloom.add("a")
+        bloom.add("b")
+        bloom.add("c")  # rotation: only "c" remains
+
+        self.assertFalse(bloom.add("a"))
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class WebhookDeduplicatorTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.dedup = WebhookDeduplicator(ttl_seconds=60)
+
+    def test_second_delivery_is_duplicate(self):
+        self.assertFalse(self.dedup.is_duplicate("false_5511@c.us_ABC"))
+        self.assertTrue(self.dedup.is_duplicate("false_5511@c.us_ABC"))
+
+    def test_missing_message_id_is_never_duplicate(self):
+        self.assertFalse(self.dedup.is_duplicate(None))
+        self.assertFalse(self.dedup.is_duplicate(""))
+
+    def test_duplicate_seen_by_another_worker(self):
+        other_worker = WebhookDeduplicator(ttl_seconds=60)
+        self.assertFalse(other_worker.is_duplicate("msg-1"))
+
+        self.assertTrue(self.dedup.is_duplicate("msg-1"))
+
+    def test_falls_back_to_bloom_when_store_unavailable(self):
+        with patch("apps.bot.idempotency.cache.add", side_effect=ConnectionError("down")):
+            self.assertFalse(self.dedup.is_duplicate("msg-1"))
+            self.assertTrue(self.dedup.is_duplicate("msg-1"))
+
+    def test_released_id_can_be_claimed_again(self):
+        self.assertFalse(self.dedup.is_duplicate("msg-1"))
+        self.dedup.release("msg-1")
+
+        self.assertFalse(self.dedup.is_duplicate("msg-1"))
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class WebhookDedupViewTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def _post(self):
+        body = json.dumps(
+            {
+                "event": "message.any",
+                "payload": {"id": "false_5511@c.us_XYZ", "from": "5511@c.us", "body": "menu"},
+            }
+        )
+        return self.client.post("/webhook/", body, content_type="application/json", secure=True)
+
+    def test_redelivered_webhook_is_processed_once(self):
+        with patch("apps.bot.views.BotService") as service_mock:
+            for _ in range(2):
+                self.assertEqual(self._post().status_code, 200)
+
+        service_mock.return_value.process_message.assert_called_once_with("5511@c.us", "menu", False)
+
+    def test_redelivery_after_failure_is_processed(self):
+        with patch("apps.bot.views.BotService") as service_mock:
+            service_mock.return_value.process_message.side_effect = [RuntimeError("boom"), None]
+
+            self.assertEqual(self._post().status_code, 500)
+            self.assertEqual(self._post().status_code, 200)
+
+        self.assertEqual(service_mock.return_value.process_message.call_count, 2)
@@ -0,0 +1,60 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from apps.bot.instrumentation import MessageMetricsAggregator, message_profile
+from apps.bot.models import BotMetrics
+from apps.bot.services import BotService
+from config.env import WahaSettings
+from infra.observability import MessageProfile, current_profile, record_cache_access
+from infra.waha.client import WahaClient
+
+
+class MessageProfileTests(TestCase):
+    def setUp(self):
+        self.waha_client = WahaClient(settings=WahaSettings())
+        self.service = BotService(waha_client=self.waha_client)
+
+    def test_process_message_records_costs_per_step(self):
+        with patch("infra.waha.client.requests.post") as post_mock, patch(
+            "apps.bot.instrumentation.get_aggregator"
+        ) as aggregator_mock:
+            post_mock.return_value.status_code = 201
+            self.service.process_message("5511999999999@c.us", "menu", from_me=False)
+
+        profile = aggregator_mock.return_value.add.call_args[0][0]
+        self.assertGreater(profile.db_queries, 0)
+        self.assertEqual(profile.waha_calls, 1)
+        self.assertIn("MenuHandler.send_menu", profile.steps)
+        self.assertIn("BaseHandler.send_msg", profile.steps)
+        self.assertGreaterEqual(profile.total_ms, profile.steps["MenuHandler.send_menu"])
+
+    def test_nested_profiles_report_once(self):
+        with patch("apps.bot.instrumentation.get_aggregator") as aggregator_mock:
+            with message_profile("chat") as outer:
+                with message_profile("chat") as inner:
+                    record_cache_access(hit=True)
+                self.assertIs(inner, outer)
+
+        aggregator_mock.return_value.add.assert_called_once()
+        self.assertEqual(outer.cache_hits, 1)
+        self.assertIsNone(current_profile())
+
+
+class MessageMetricsAggregatorTests(TestCase):
+    def test_flush_writes_one_rollup_per_metric(self):
+        aggregator = MessageMetricsAggregator(flush_interval_seconds=3600)
+        aggregator.add(MessageProfile(db_queries=4, total_ms=10.0, cache_hits=1))
+        aggregator.add(MessageProfile(db_queries=6, total_ms=30.0, cache_misses=1))
+
+        self.assertEqual(BotMetrics.objects.count(), 0)
+        written = aggregator.flush()
+
+        self.assertEqual(written, BotMetrics.objects.count())
+        latency = BotMetrics.objects.get(metric_name="message_latency_ms")
+        self.assertEqual(latency.value, 20.0)
+        self.assertEqual(latency.metadata["count"], 2)
+        self.assertEqual(latency.metadata["max"], 30.0)
+        self.assertEqual(BotMetrics.objects.get(metric_name="message_db_queries").value, 5.0)
+        self.assertEqual(BotMetrics.objects.get(metric_name="message_cache_hit_ratio").value, 0.5)
+        self.assertEqual(aggregator.flush(), 0)
@@ -0,0 +1,39 @@
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+
+from django.test import TestCase
+
+from apps.bot.models import InteractionLog
+from apps.bot.partitions import InteractionLogPartitionManager, _add_months
+from apps.users.models import UserProfile
+
+NOW = datetime(2025, 6, 15, 12, 0, tzinfo=dt_timezone.utc)
+
+
+class InteractionLogRetentionTests(TestCase):
+    def setUp(self):
+        user = UserProfile.objects.create(phone_number="5511000000001@c.us")
+        for days_ago in (400, 200, 91, 89, 1):
+            log = InteractionLog.objects.create(
+                user=user, message_content=f"{days_ago}", message_type="RECEIVED"
+            )
+            InteractionLog.objects.filter(pk=log.pk).update(
+                created_at=NOW - timedelta(days=days_ago)
+            )
+
+    def test_purges_expired_rows_in_batches(self):
+        manager = InteractionLogPartitionManager(retention_days=90, batch_size=2)
+
+        result = manager.enforce_retention(now=NOW)
+
+        self.assertEqual(result, {"purged": 3})
+        self.assertEqual(
+            sorted(InteractionLog.objects.values_list("message_content", flat=True)),
+            ["1", "89"],
+        )
+
+    def test_not_partitioned_outside_postgres(self):
+        self.assertFalse(InteractionLogPartitionManager().is_partitioned())
+
+    def test_add_months_wraps_year(self):
+        self.assertEqual(_add_months(date(2025, 11, 1), 2), date(2026, 1, 1))
+        self.assertEqual(_add_months(date(2025, 1, 1), -1), date(2024, 12, 1))
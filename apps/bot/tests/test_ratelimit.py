@@ -0,0 +1,154 @@
+from unittest.mock import MagicMock, patch
+
+from django.test import TestCase, override_settings
+
+from apps.bot.ratelimit import LOGIN, MESSAGE, SEARCH, RateLimit, SlidingWindowRateLimiter
+from apps.bot.schemas import WahaMessagePayload
+from apps.bot.services import BotService
+from apps.bot.tasks import verify_portal_credentials
+from apps.bot.views import _process_inbound
+from apps.core.testing import LOCMEM_CACHE
+from apps.courses.cache import bump_catalog_version
+from apps.courses.models import Course, SearchTerm
+from apps.users.models import UserProfile
+
+
+class FakeClock:
+    def __init__(self, now=1_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _unavailable_redis():
+    client = MagicMock()
+    client.register_script.return_value = MagicMock(side_effect=ConnectionError("down"))
+    return client
+
+
+class SlidingWindowRateLimiterTests(TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.client = _unavailable_redis()
+        self.limiter = SlidingWindowRateLimiter(
+            limits={MESSAGE: RateLimit(2, 10), LOGIN: RateLimit(0, 10)},
+            client=self.client,
+            clock=self.clock,
+        )
+
+    def test_window_slides_instead_of_resetting(self):
+        self.assertTrue(self.limiter.hit(MESSAGE, "chat"))
+        self.clock.now += 6
+        self.assertTrue(self.limiter.hit(MESSAGE, "chat"))
+        self.assertFalse(self.limiter.hit(MESSAGE, "chat"))
+        self.assertTrue(self.limiter.hit(MESSAGE, "other-chat"))
+
+        # Only the first hit has left the window
+        self.clock.now += 5
+        self.assertTrue(self.limiter.hit(MESSAGE, "chat"))
+        self.assertFalse(self.limiter.hit(MESSAGE, "chat"))
+
+    def test_zero_limit_and_unknown_actions_are_unlimited(self):
+        for _ in range(5):
+            self.assertTrue(self.limiter.hit(LOGIN, "chat"))
+            self.assertTrue(self.limiter.hit(SEARCH, "chat"))
+
+    def test_redis_is_retried_only_after_fallback_period(self):
+        script = self.client.register_script.return_value
+        self.limiter.hit(MESSAGE, "chat")
+        self.limiter.hit(MESSAGE, "chat")
+        self.assertEqual(script.call_count, 1)
+
+        self.clock.now += SlidingWindowRateLimiter.FALLBACK_SECONDS
+        self.limiter.hit(MESSAGE, "chat")
+        self.assertEqual(script.call_count, 2)
+
+    def test_redis_script_decides_when_available(self):
+        client = MagicMock()
+        script = client.register_script.return_value
+        script.return_value = 0
+        limiter = SlidingWindowRateLimiter(
+            limits={MESSAGE: RateLimit(3, 60)}, client=client, clock=self.clock
+        )
+
+        self.assertFalse(limiter.hit(MESSAGE, "chat"))
+        kwargs = script.call_args.kwargs
+        self.assertEqual(kwargs["keys"], ["capyvagas:ratelimit:message:chat"])
+        self.assertEqual(kwargs["args"][:3], [1_000_000, 60_000, 3])
+
+
+class BotServiceRateLimitTests(TestCase):
+    def setUp(self):
+        # Catalog lists cached by earlier tests are never invalidated (no commit)
+        bump_catalog_version()
+        self.waha_client = MagicMock()
+        self.waha_client.settings = MagicMock(session_name="test-session")
+        self.limiter = SlidingWindowRateLimiter(
+            limits={MESSAGE: RateLimit(3, 60), LOGIN: RateLimit(1, 900), SEARCH: RateLimit(1, 600)},
+            client=_unavailable_redis(),
+            clock=FakeClock(),
+        )
+        self.job_service = MagicMock()
+        self.auth_service = MagicMock()
+        self.service = BotService(
+            waha_client=self.waha_client,
+            job_service=self.job_service,
+            auth_service=self.auth_service,
+            rate_limiter=self.limiter,
+        )
+        self.chat_id = "5511911112222@c.us"
+
+    @override_settings(CACHES=LOCMEM_CACHE)
+    def test_flood_is_dropped_before_touching_the_database(self):
+        for _ in range(3):
+            self.limiter.hit(MESSAGE, self.chat_id)
+        payload = WahaMessagePayload.model_validate(
+            {"id": "false_flood_1", "from": self.chat_id, "body": "oi"}
+        )
+
+        with patch("apps.bot.views.get_rate_limiter", return_value=self.limiter), patch(
+            "infra.waha.client.requests.post"
+        ) as post_mock, self.assertNumQueries(0):
+            _process_inbound(payload)
+        post_mock.assert_not_called()
+
+    def test_login_attempts_are_limited(self):
+        UserProfile.objects.create(
+            phone_number=self.chat_id,
+            current_action="login_step_password",
+            flow_data={"temp_ra": "a1234567"},
+        )
+        with patch.object(verify_portal_credentials, "delay"):
+            self.service.process_message(self.chat_id, "first", from_me=False)
+        UserProfile.objects.filter(phone_number=self.chat_id).update(
+            current_action="login_step_password"
+        )
+
+        self.service.process_message(self.chat_id, "second", from_me=False)
+
+        self.assertIn("Muitas tentativas", self.waha_client.send_message.call_args[0][1])
+        user = UserProfile.objects.get(phone_number=self.chat_id)
+        self.assertEqual(user.current_action, "login_step_password")
+
+    def test_searches_are_limited_and_keep_term_selection(self):
+        course = Course.objects.create(name="Engenharia", is_active=True)
+        SearchTerm.objects.create(course=course, term="Python")
+        UserProfile.objects.create(
+            phone_number=self.chat_id,
+            is_authenticated_utfpr=True,
+            selected_course=course,
+            current_action="term_selection",
+        )
+        self.job_service.search.return_value = []
+        self.service.process_message(self.chat_id, "1", from_me=False)
+        UserProfile.objects.filter(phone_number=self.chat_id).update(
+            current_action="term_selection"
+        )
+
+        self.service.process_message(self.chat_id, "1", from_me=False)
+
+        self.assertEqual(self.job_service.search.call_count, 1)
+        self.assertIn("muitas buscas", self.waha_client.send_message.call_args[0][1])
+        user = UserProfile.objects.get(phone_number=self.chat_id)
+        self.assertEqual(user.current_action, "term_selection")
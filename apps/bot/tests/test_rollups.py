@@ -0,0 +1,124 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from apps.bot.health import BotHealthMonitor
+from apps.bot.models import (
+    BotHealthCheck,
+    BotHealthRollup,
+    InteractionLog,
+    InteractionRollup,
+    RollupWatermark,
+)
+from apps.bot.rollups import interaction_totals, percentile, update_rollups
+from apps.core.testing import LOCMEM_CACHE
+from apps.users.models import UserProfile
+
+NOW = datetime(2025, 3, 10, 12, 0, 30, tzinfo=dt_timezone.utc)
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class RollupTests(TestCase):
+    def _backdate(self, obj, when):
+        type(obj).objects.filter(pk=obj.pk).update(created_at=when)
+
+    def setUp(self):
+        alice = UserProfile.objects.create(phone_number="5511000000001@c.us")
+        bob = UserProfile.objects.create(phone_number="5511000000002@c.us")
+        for minutes_ago, user, message_type in [
+            (125, alice, "RECEIVED"),
+            (124, alice, "SENT"),
+            (70, bob, "RECEIVED"),
+            (70, alice, "RECEIVED"),
+            (0, bob, "SENT"),
+        ]:
+            log = InteractionLog.objects.create(
+                user=user, message_content="oi", message_type=message_type
+            )
+            self._backdate(log, NOW - timedelta(minutes=minutes_ago))
+
+        for minutes_ago, status, response_time in [
+            (90, "online", 100.0),
+            (90, "online", 300.0),
+            (89, "error", 5000.0),
+            (30, "online", 200.0),
+        ]:
+            check = BotHealthCheck.objects.create(status=status, response_time=response_time)
+            self._backdate(check, NOW - timedelta(minutes=minutes_ago))
+
+    def test_update_rollups_builds_minute_and_hour_buckets(self):
+        written = update_rollups(now=NOW)
+
+        self.assertEqual(written["interactions:hour"], 2)
+        hour = InteractionRollup.objects.get(
+            granularity="hour", bucket_start=datetime(2025, 3, 10, 9, tzinfo=dt_timezone.utc)
+        )
+        self.assertEqual((hour.messages_received, hour.messages_sent, hour.unique_users), (1, 1, 1))
+        self.assertEqual(
+            InteractionRollup.objects.get(
+                granularity="minute", bucket_start=datetime(2025, 3, 10, 10, 50, tzinfo=dt_timezone.utc)
+            ).unique_users,
+            2,
+        )
+
+        health = BotHealthRollup.objects.get(
+            granularity="hour", bucket_start=datetime(2025, 3, 10, 10, tzinfo=dt_timezone.utc)
+        )
+        self.assertEqual((health.total_checks, health.online_checks), (3, 2))
+        self.assertEqual(health.response_time_count, 2)
+        self.assertEqual(health.response_time_p50, 100.0)
+        self.assertEqual(health.response_time_p99, 300.0)
+
+        self.assertEqual(
+            RollupWatermark.objects.get(name="interactions:minute").processed_until,
+            datetime(2025, 3, 10, 12, 0, tzinfo=dt_timezone.utc),
+        )
+
+    def test_second_run_only_processes_new_buckets(self):
+        update_rollups(now=NOW)
+        written = update_rollups(now=NOW + timedelta(seconds=20))
+
+        self.assertEqual(set(written.values()), {0})
+
+    def test_minute_buckets_are_pruned_after_a_day(self):
+        update_rollups(now=NOW)
+        later = NOW + timedelta(days=1, hours=2)
+        update_rollups(now=later)
+
+        for model in (InteractionRollup, BotHealthRollup):
+            self.assertFalse(
+                model.objects.filter(
+                    granularity="minute", bucket_start__lt=NOW - timedelta(minutes=30)
+                ).exists()
+            )
+            self.assertTrue(model.objects.filter(granularity="hour", bucket_start__lt=NOW).exists())
+        self.assertEqual(interaction_totals(), {"messages_sent": 2, "messages_received": 3})
+
+    def test_totals_combine_rollups_with_raw_tail(self):
+        update_rollups(now=NOW)
+        log = InteractionLog.objects.create(
+            user=UserProfile.objects.first(), message_content="novo", message_type="RECEIVED"
+        )
+        self._backdate(log, NOW)
+
+        self.assertEqual(
+            interaction_totals(),
+            {"messages_sent": 2, "messages_received": 4},
+        )
+
+    def test_health_summary_matches_raw_scan(self):
+        with patch("django.utils.timezone.now", return_value=NOW):
+            expected = BotHealthMonitor().get_metrics_windows([1, 24, 24 * 7])
+            update_rollups()
+            cache.clear()
+            from_rollups = BotHealthMonitor().get_metrics_windows([1, 24, 24 * 7])
+
+        self.assertEqual(expected[24]["total_checks"], 4)
+        self.assertEqual(from_rollups, expected)
+
+    def test_percentile_nearest_rank(self):
+        self.assertEqual(percentile([1, 2, 3, 4], 50), 2)
+        self.assertEqual(percentile([1, 2, 3, 4], 95), 4)
+        self.assertIsNone(percentile([], 50))
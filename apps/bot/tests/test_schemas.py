@@ -0,0 +1,48 @@
+import json
+
+from django.test import TestCase
+
+from apps.bot.schemas import parse_webhook
+
+
+class ParseWebhookTests(TestCase):
+    def test_parses_message_event_and_ignores_unknown_fields(self):
+        body = json.dumps(
+            {
+                "event": "message.any",
+                "session": "default",
+                "payload": {
+                    "id": "false_5511@c.us_ABC",
+                    "from": "5511@c.us",
+                    "body": "menu",
+                    "fromMe": False,
+                    "_data": {"media": "x" * 1024},
+                },
+            }
+        ).encode()
+
+        data = parse_webhook(body)
+
+        self.assertTrue(data.is_message)
+        self.assertEqual(data.payload.id, "false_5511@c.us_ABC")
+        self.assertEqual(data.payload.from_, "5511@c.us")
+        self.assertEqual(data.payload.body, "menu")
+        self.assertFalse(data.payload.from_me)
+
+    def test_non_message_event_is_not_a_message(self):
+        data = parse_webhook(b'{"event": "session.status", "payload": {"status": "WORKING"}}')
+
+        self.assertFalse(data.is_message)
+
+    def test_invalid_body_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            parse_webhook(b"not json")
+        with self.assertRaises(ValueError):
+            parse_webhook(b'{"payload": {"fromMe": "maybe"}}')
+
+    def test_view_rejects_malformed_payload(self):
+        response = self.client.post(
+            "/webhook/", "not json", content_type="application/json", secure=True
+        )
+
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,50 @@
+from django.test import TestCase
+
+from apps.bot.models import InteractionLog
+from apps.bot.search import search_interactions
+from apps.users.models import UserProfile
+
+
+class InteractionSearchTests(TestCase):
+    def setUp(self):
+        self.alice = UserProfile.objects.create(phone_number="5541999990001@c.us", ra="a123456")
+        self.bob = UserProfile.objects.create(phone_number="5541888880002@c.us")
+        self.estagio = InteractionLog.objects.create(
+            user=self.alice,
+            message_content="Quero vagas de Estágio em Python",
+            message_type="RECEIVED",
+        )
+        self.menu = InteractionLog.objects.create(
+            user=self.bob, message_content="menu", message_type="RECEIVED"
+        )
+
+    def _search(self, term):
+        return set(search_interactions(InteractionLog.objects.all(), term))
+
+    def test_matches_substring_case_insensitively(self):
+        self.assertEqual(self._search("estágio em pyth"), {self.estagio})
+        self.assertEqual(self._search("PYTHON"), {self.estagio})
+
+    def test_uses_fts_index_on_sqlite(self):
+        sql = str(search_interactions(InteractionLog.objects.all(), "python").query)
+
+        self.assertIn("bot_interactionlog_fts", sql)
+
+    def test_index_follows_updates_and_deletes(self):
+        InteractionLog.objects.filter(pk=self.menu.pk).update(message_content="ajuda com currículo")
+        self.estagio.delete()
+
+        self.assertEqual(self._search("currículo"), {self.menu})
+        self.assertEqual(self._search("python"), set())
+
+    def test_matches_phone_and_ra(self):
+        self.assertEqual(self._search("88880002"), {self.menu})
+        self.assertEqual(self._search("A123"), {self.estagio})
+
+    def test_short_terms_fall_back_to_like(self):
+        self.assertEqual(self._search("me"), {self.menu})
+
+    def test_api_search_parameter(self):
+        response = self.client.get("/api/interactions/?search=python", secure=True)
+
+        self.assertEqual([r["id"] for r in response.json()["results"]], [self.estagio.id])
@@ -0,0 +1,103 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import connection, connections
+from django.db.backends.signals import connection_created
+from django.test import TestCase, TransactionTestCase, override_settings
+
+from apps.bot import views
+from apps.bot.schemas import WahaMessagePayload
+from apps.core.testing import LOCMEM_CACHE
+from benchmarks import webhook_load
+from config.env import settings
+
+
+def message_body(message_id="false_5511@c.us_1", text="menu"):
+    return json.dumps(
+        {"event": "message", "payload": {"id": message_id, "from": "5511@c.us", "body": text}}
+    )
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class WebhookExecutorTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_pipeline_runs_on_the_bounded_webhook_pool(self):
+        threads = []
+
+        def record(*args):
+            threads.append(threading.current_thread().name)
+
+        with patch("apps.bot.views.BotService") as service_mock:
+            service_mock.return_value.process_message.side_effect = record
+            response = self.client.post(
+                "/webhook/", message_body(), content_type="application/json", secure=True
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(threads[0].startswith("webhook"))
+        self.assertEqual(views._executor._max_workers, settings.webhook.worker_threads)
+
+    def test_worker_thread_gives_its_connection_back(self):
+        # With the psycopg pool CONN_MAX_AGE is 0 and closing returns the
+        # connection to the pool (in-memory SQLite ignores close(), so record it)
+        worker = ThreadPoolExecutor(max_workers=1)
+        self.addCleanup(worker.shutdown)
+        worker_thread = worker.submit(threading.get_ident).result()
+        payload = WahaMessagePayload.model_validate(
+            {"id": "false_5511@c.us_2", "from": "5511@c.us", "body": "menu"}
+        )
+        closed_on = []
+
+        def query(*args):
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+
+        with patch("apps.bot.views.BotService") as service_mock, patch.dict(
+            connections.settings["default"], CONN_MAX_AGE=0
+        ), patch.object(
+            type(connections["default"]),
+            "close",
+            autospec=True,
+            side_effect=lambda wrapper: closed_on.append(threading.get_ident()),
+        ):
+            service_mock.return_value.process_message.side_effect = query
+            worker.submit(views._process_inbound_on_worker, payload).result()
+
+        service_mock.return_value.process_message.assert_called_once()
+        self.assertIn(worker_thread, closed_on)
+
+
+@override_settings(CACHES=LOCMEM_CACHE, SECURE_SSL_REDIRECT=False)
+class LoadHarnessQueryCountTests(TransactionTestCase):
+    # The real pipeline commits on the pool threads' own connections, outside
+    # TestCase's transaction; TransactionTestCase flushes those rows afterwards
+    def setUp(self):
+        cache.clear()
+        webhook_load._install_query_counter()
+        self.addCleanup(
+            connection_created.disconnect, dispatch_uid=webhook_load.QUERY_COUNTER_UID
+        )
+        self.addCleanup(self._remove_query_counter)
+
+    def _remove_query_counter(self):
+        for conn in connections.all():
+            if webhook_load._count_queries in conn.execute_wrappers:
+                conn.execute_wrappers.remove(webhook_load._count_queries)
+
+    def test_every_message_counts_its_queries(self):
+        # The webhook pool threads are long-lived: the counter must survive the
+        # profiled() block of the message that opened their connection
+        replayer = webhook_load.Replayer()
+        with patch("infra.waha.client.requests.post") as post_mock:
+            post_mock.return_value.status_code = 201
+            for index in range(3):
+                replayer.send("menu", f"551100000000{index}@c.us", "menu")
+
+        self.assertEqual([sample[3] for sample in replayer.samples], [True] * 3)
+        for _, _, queries, _ in replayer.samples:
+            self.assertGreater(queries, 0)
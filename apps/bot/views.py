@@ -1,34 +1,104 @@
-import json
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import structlog
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections
 from django.http import HttpResponse
 from django.views.decorators.csrf import csrf_exempt
+
+from apps.bot.idempotency import get_deduplicator
+from apps.bot.instrumentation import message_profile
+from apps.bot.ratelimit import MESSAGE, get_rate_limiter
+from apps.bot.schemas import WahaMessagePayload, parse_webhook
 from apps.bot.services import BotService
+from config.env import settings
+from infra.observability.metrics import WEBHOOK_LATENCY
+
+logger = structlog.get_logger(__name__)
+
+
+def _process_inbound(payload: WahaMessagePayload) -> None:
+    """Deduplicate and run one inbound message through the bot pipeline."""
+    with message_profile(payload.from_):
+        # Ignorar reentregas do WAHA
+        deduplicator = get_deduplicator()
+        if deduplicator.is_duplicate(payload.id):
+            return
+
+        # Proteção contra flood antes de qualquer consulta (inclusive a da
+        # configuração do WAHA feita pelo BotService); excesso é descartado
+        if not get_rate_limiter().hit(MESSAGE, payload.from_):
+            return
 
-@csrf_exempt
-def webhook(request):
-    if request.method == 'POST':
         try:
-            data = json.loads(request.body)
-            print('Webhook recebido:', json.dumps(data, indent=2))
-            
-            event = data.get('event')
-            payload = data.get('payload', {})
-            
-            # Aceitar eventos message, message.any, ou qualquer evento de mensagem
-            if event and 'message' in event and payload.get('body'):
-                chat_id = payload.get('from')
-                message = payload.get('body')
-                from_me = payload.get('fromMe', False)
-                
-                # Ignorar mensagens enviadas pelo próprio bot
-                if not from_me:
-                    bot = BotService()
-                    bot.process_message(chat_id, message, from_me)
-                    
-            return HttpResponse('OK', status=200)
-        except Exception as e:
-            print(f'Erro no webhook: {e}')
-            import traceback
-            traceback.print_exc()
-            return HttpResponse('Erro', status=500)
-            
-    return HttpResponse('Método não permitido', status=405)
+            bot = BotService()
+            bot.process_message(payload.from_, payload.body, payload.from_me)
+        except Exception:
+            # Libera o id: a reentrega do WAHA após o erro 500 deve ser processada
+            deduplicator.release(payload.id)
+            raise
+
+
+# The pipeline is ORM/HTTP bound and stays synchronous; thread_sensitive=False
+# runs each conversation in a dedicated, bounded pool instead of queueing every
+# request on Django's single sync thread. A busy thread holds one DB connection,
+# so WEBHOOK_WORKER_THREADS stays below the connection pool size.
+_executor = ThreadPoolExecutor(
+    max_workers=settings.webhook.worker_threads, thread_name_prefix="webhook"
+)
+
+
+def _process_inbound_on_worker(payload: WahaMessagePayload) -> None:
+    """Run ``_process_inbound`` on a pool thread, recycling its DB connection."""
+    # Pool threads get no request_started/request_finished cleanup: drop broken
+    # connections first and hand the connection back (to the pool) afterwards
+    close_old_connections()
+    try:
+        _process_inbound(payload)
+    finally:
+        close_old_connections()
+
+
+process_inbound = sync_to_async(
+    _process_inbound_on_worker, thread_sensitive=False, executor=_executor
+)
+
+
+@csrf_exempt
+async def webhook(request):
+    if request.method != 'POST':
+        return HttpResponse('Método não permitido', status=405)
+
+    start = time.perf_counter()
+    try:
+        data = parse_webhook(request.body)
+    except ValueError as e:
+        logger.warning("webhook_invalid_payload", error=str(e)[:200])
+        WEBHOOK_LATENCY.labels(outcome="invalid").observe(time.perf_counter() - start)
+        return HttpResponse('Payload inválido', status=400)
+
+    if random.random() < settings.webhook.debug_sample_rate:
+        logger.debug(
+            "webhook_received",
+            webhook_event=data.event,
+            message_id=data.payload.id,
+            payload_bytes=len(request.body),
+        )
+
+    try:
+        # Aceitar eventos message, message.any, ou qualquer evento de mensagem
+        # e ignorar mensagens enviadas pelo próprio bot
+        if data.is_message and not data.payload.from_me:
+            await process_inbound(data.payload)
+            outcome = "processed"
+        else:
+            outcome = "ignored"
+
+        WEBHOOK_LATENCY.labels(outcome=outcome).observe(time.perf_counter() - start)
+        return HttpResponse('OK', status=200)
+    except Exception:
+        logger.exception("webhook_processing_failed", message_id=data.payload.id)
+        WEBHOOK_LATENCY.labels(outcome="error").observe(time.perf_counter() - start)
+        return HttpResponse('Erro', status=500)
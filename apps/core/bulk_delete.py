@@ -0,0 +1,136 @@
+"""
+Batched deletes for large tables, run as background jobs.
+
+``QuerySet.delete()`` first collects every matching object (and its cascade
+dependents) in memory so it can send signals, then deletes them in one
+transaction. ``delete_in_batches`` walks the queryset in primary-key ranges
+instead; each range is deleted in its own short transaction, with a raw
+``DELETE`` when Django's collector says no cascades or signals are involved.
+"""
+from typing import Callable, Dict, Optional
+
+import structlog
+from django.apps import apps
+from django.db import models, router, transaction
+from django.db.models.deletion import Collector
+from django.utils import timezone
+
+from apps.core.models import BulkDeleteJob
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_BATCH_SIZE = 2000
+
+
+def delete_in_batches(
+    queryset: models.QuerySet,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    on_progress: Optional[Callable[[int], None]] = None,
+) -> int:
+    """
+    Delete every row of a queryset in ascending primary-key ranges.
+
+    Args:
+        queryset: Rows to delete
+        batch_size: Maximum rows per range (and per transaction)
+        on_progress: Called with the running total after each range
+
+    Returns:
+        Number of rows deleted, cascades included
+    """
+    queryset = queryset.order_by()
+    using = router.db_for_write(queryset.model)
+    deleted = 0
+    last_pk = None
+    while True:
+        remaining = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        pks = remaining.order_by("pk").values_list("pk", flat=True)
+        upper = next(iter(pks[batch_size - 1 : batch_size]), None)
+        if upper is None:
+            # Fewer than batch_size rows left: the last range is open-ended
+            batch = remaining
+        else:
+            batch = remaining.filter(pk__lte=upper)
+
+        with transaction.atomic(using=using):
+            if Collector(using=using).can_fast_delete(batch):
+                count = batch._raw_delete(using)
+            else:
+                count = batch.delete()[0]
+        deleted += count
+        if on_progress is not None:
+            on_progress(deleted)
+        if upper is None:
+            return deleted
+        last_pk = upper
+
+
+class BulkDeleteService:
+    """
+    Schedules and runs ``BulkDeleteJob`` records.
+    """
+
+    def __init__(self, batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+        """
+        Initialize the service.
+
+        Args:
+            batch_size: Rows deleted per primary-key range
+        """
+        self.batch_size = batch_size
+
+    def schedule(self, model: type, filters: Dict) -> BulkDeleteJob:
+        """
+        Record a delete job and hand it to the Celery worker after commit.
+
+        Args:
+            model: Model class whose rows will be deleted
+            filters: JSON-serialisable lookups selecting the rows
+
+        Returns:
+            The pending job
+        """
+        from apps.core.tasks import run_bulk_delete
+
+        job = BulkDeleteJob.objects.create(
+            model_label=model._meta.label,
+            filters=filters,
+            total=model._default_manager.filter(**filters).count(),
+        )
+        transaction.on_commit(lambda: run_bulk_delete.delay(job.pk))
+        logger.info("bulk_delete_scheduled", job_id=job.pk, model=job.model_label, total=job.total)
+        return job
+
+    def run(self, job: BulkDeleteJob) -> BulkDeleteJob:
+        """
+        Execute a job, saving progress after every range.
+
+        Args:
+            job: Job to execute
+
+        Returns:
+            The job in its final state
+        """
+        BulkDeleteJob.objects.filter(pk=job.pk).update(
+            status="running", started_at=timezone.now()
+        )
+
+        def report(deleted):
+            BulkDeleteJob.objects.filter(pk=job.pk).update(deleted=deleted)
+
+        try:
+            model = apps.get_model(job.model_label)
+            queryset = model._default_manager.filter(**job.filters)
+            deleted = delete_in_batches(queryset, self.batch_size, on_progress=report)
+        except Exception as e:
+            logger.exception("bulk_delete_failed", job_id=job.pk)
+            BulkDeleteJob.objects.filter(pk=job.pk).update(
+                status="failed", error_message=str(e), finished_at=timezone.now()
+            )
+        else:
+            logger.info("bulk_delete_finished", job_id=job.pk, deleted=deleted)
+            BulkDeleteJob.objects.filter(pk=job.pk).update(
+                status="done", deleted=deleted, finished_at=timezone.now()
+            )
+        job.refresh_from_db()
+        return job
@@ -0,0 +1,186 @@
+"""
+Liveness and readiness checks for orchestrator probes.
+
+Liveness needs no I/O: if the process can answer, it is alive. Readiness
+checks the database (``SELECT 1``) and Redis (``PING``). Nothing is written
+per probe. The result is kept for ``HEALTH_READINESS_CACHE_SECONDS`` both in
+the process and in the shared cache under a per-host key, so the workers of
+one container share it (checking dependencies about once per interval) while
+each container still reports its own readiness.
+
+Deep checks (``?deep=1``) add the WAHA session status published by the
+background prober (read from the cache, never from WAHA itself) and the
+Celery queue backlog. They only downgrade the status to ``degraded``, so a
+WhatsApp outage never takes the web tier out of rotation.
+"""
+import socket
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+import structlog
+from django.core.cache import cache
+from django.db import connection
+from django.utils import timezone
+
+from apps.bot.health import BotHealthMonitor
+from config.env import settings
+from infra.observability.metrics import QUEUE_DEPTH
+from infra.redis import get_redis_client
+
+logger = structlog.get_logger(__name__)
+
+HEALTHY = "healthy"
+DEGRADED = "degraded"
+UNHEALTHY = "unhealthy"
+
+
+class ReadinessProbe:
+    """
+    Runs the readiness checks and caches their outcome.
+    """
+
+    CACHE_KEY = "capyvagas:health:readiness"
+    # Redis lists backing background queues (Celery default queue)
+    QUEUE_NAMES = ("celery",)
+
+    def __init__(
+        self,
+        ttl_seconds: Optional[int] = None,
+        queue_backlog_max: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the probe.
+
+        Args:
+            ttl_seconds: How long a result is reused (defaults to settings)
+            queue_backlog_max: Queue length above which deep checks report degraded
+            clock: Monotonic time source in seconds
+        """
+        monitoring = settings.monitoring
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else monitoring.readiness_cache_seconds
+        self.queue_backlog_max = (
+            queue_backlog_max if queue_backlog_max is not None else monitoring.queue_backlog_max
+        )
+        self.clock = clock
+        # Readiness is per instance: workers of one container share the result, containers do not
+        self.cache_key = f"{self.CACHE_KEY}:{socket.gethostname()}"
+        self._memo: Dict[bool, tuple[float, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def check(self, deep: bool = False) -> Dict[str, Any]:
+        """
+        Readiness of this instance, reusing a recent result when there is one.
+
+        Args:
+            deep: Also report WAHA and queue backlog
+
+        Returns:
+            ``{"status": ..., "components": {...}, "checked_at": ...}``
+        """
+        now = self.clock()
+        memo = self._memo.get(deep)
+        if memo is not None and memo[0] > now:
+            return memo[1]
+
+        with self._lock:
+            memo = self._memo.get(deep)
+            if memo is not None and memo[0] > now:
+                return memo[1]
+            key = f"{self.cache_key}:{'deep' if deep else 'basic'}"
+            try:
+                result = cache.get(key)
+            except Exception:
+                result = None
+            if result is None:
+                result = self._run(deep)
+                try:
+                    cache.set(key, result, timeout=self.ttl_seconds)
+                except Exception:
+                    pass
+            self._memo[deep] = (now + self.ttl_seconds, result)
+        return result
+
+    def _run(self, deep: bool) -> Dict[str, Any]:
+        components: Dict[str, Any] = {"database": self._check_database()}
+        components.update(self._check_redis(deep))
+        status = HEALTHY
+        if UNHEALTHY in (components["database"], components["cache"]):
+            status = UNHEALTHY
+        elif deep:
+            components["waha"] = self._check_waha()
+            if components["waha"]["status"] != HEALTHY or components["queue"]["status"] != HEALTHY:
+                status = DEGRADED
+        if status != HEALTHY:
+            logger.warning("readiness_check_failed", status=status, components=components)
+        return {"status": status, "components": components, "checked_at": timezone.now().isoformat()}
+
+    @staticmethod
+    def _check_database() -> str:
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+        except Exception as e:
+            logger.error("database_health_check_failed", error=str(e))
+            return UNHEALTHY
+        return HEALTHY
+
+    def _check_redis(self, deep: bool) -> Dict[str, Any]:
+        client = get_redis_client()
+        if client is None:
+            # Local development without Redis (in-memory cache, eager Celery)
+            components: Dict[str, Any] = {"cache": "disabled"}
+            if deep:
+                components["queue"] = {"status": HEALTHY, "depth": None}
+            return components
+        try:
+            pipe = client.pipeline(transaction=False)
+            pipe.ping()
+            for name in self.QUEUE_NAMES if deep else ():
+                pipe.llen(name)
+            _, *depths = pipe.execute()
+        except Exception as e:
+            logger.error("cache_health_check_failed", error=str(e))
+            components = {"cache": UNHEALTHY}
+            if deep:
+                components["queue"] = {"status": UNHEALTHY, "depth": None}
+            return components
+
+        components = {"cache": HEALTHY}
+        if deep:
+            for name, depth in zip(self.QUEUE_NAMES, depths):
+                QUEUE_DEPTH.labels(queue=name).set(depth)
+            backlog = sum(depths)
+            components["queue"] = {
+                "status": HEALTHY if backlog <= self.queue_backlog_max else DEGRADED,
+                "depth": backlog,
+            }
+        return components
+
+    @staticmethod
+    def _check_waha() -> Dict[str, Any]:
+        try:
+            last = cache.get(BotHealthMonitor.STATUS_CACHE_KEY)
+        except Exception:
+            last = None
+        if last is None:
+            return {"status": "unknown", "session_status": None, "last_check": None}
+        last_check = last.get("last_check")
+        return {
+            "status": HEALTHY if last.get("status") == "online" else UNHEALTHY,
+            "session_status": last.get("session_status"),
+            "last_check": last_check.isoformat() if last_check else None,
+        }
+
+
+# Global instance
+_probe: Optional[ReadinessProbe] = None
+
+
+def get_readiness_probe() -> ReadinessProbe:
+    """Get or create the per-process readiness probe."""
+    global _probe
+    if _probe is None:
+        _probe = ReadinessProbe()
+    return _probe
@@ -0,0 +1,65 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="BulkDeleteJob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "model_label",
+                    models.CharField(help_text="Modelo alvo (app_label.Model)", max_length=100),
+                ),
+                (
+                    "filters",
+                    models.JSONField(default=dict, help_text="Filtros do queryset a excluir"),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pendente"),
+                            ("running", "Em execução"),
+                            ("done", "Concluída"),
+                            ("failed", "Falhou"),
+                        ],
+                        default="pending",
+                        max_length=10,
+                    ),
+                ),
+                (
+                    "total",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Registros encontrados ao agendar"
+                    ),
+                ),
+                (
+                    "deleted",
+                    models.PositiveIntegerField(default=0, help_text="Registros já excluídos"),
+                ),
+                ("error_message", models.TextField(blank=True, default="")),
+                ("started_at", models.DateTimeField(blank=True, null=True)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "verbose_name": "Exclusão em Massa",
+                "verbose_name_plural": "Exclusões em Massa",
+                "ordering": ["-created_at"],
+            },
+        ),
+    ]
@@ -1,3 +1,5 @@
+import copy
+
 from django.db import models
 
 class TimeStampedModel(models.Model):
@@ -10,3 +12,119 @@ class TimeStampedModel(models.Model):
 
     class Meta:
         abstract = True
+
+
+class DirtyFieldsMixin(models.Model):
+    """
+    Rastreia os campos alterados desde a leitura do banco.
+
+    Em um objeto já salvo, ``save()`` sem ``update_fields`` grava apenas as
+    colunas que mudaram (mais os campos ``auto_now``) e não faz nada se
+    nenhuma mudou, em vez de reescrever a linha inteira.
+    """
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._snapshot()
+        return instance
+
+    def _tracked_values(self):
+        # Campos adiados (``only``/``defer``) não estão em __dict__ e ficam de fora
+        return {
+            field.attname: getattr(self, field.attname)
+            for field in self._meta.concrete_fields
+            if not field.primary_key and field.attname in self.__dict__
+        }
+
+    def _snapshot(self, fields=None):
+        values = self._tracked_values()
+        if fields is None:
+            self._loaded_values = copy.deepcopy(values)
+            return
+        names = {self._meta.get_field(name).attname for name in fields}
+        self._loaded_values.update(
+            copy.deepcopy({k: v for k, v in values.items() if k in names})
+        )
+
+    def get_dirty_fields(self):
+        """Nomes dos campos cujo valor difere do lido do banco."""
+        loaded = getattr(self, "_loaded_values", None) or {}
+        missing = object()
+        return [
+            field.name
+            for field in self._meta.concrete_fields
+            if field.attname in self.__dict__
+            and not field.primary_key
+            and loaded.get(field.attname, missing) != getattr(self, field.attname)
+        ]
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if (
+            not args
+            and update_fields is None
+            and not self._state.adding
+            and getattr(self, "_loaded_values", None) is not None
+        ):
+            dirty = self.get_dirty_fields()
+            if not dirty:
+                return
+            auto_now = [
+                field.name
+                for field in self._meta.concrete_fields
+                if getattr(field, "auto_now", False) and field.name not in dirty
+            ]
+            kwargs["update_fields"] = update_fields = dirty + auto_now
+        super().save(*args, **kwargs)
+        if getattr(self, "_loaded_values", None) is None or update_fields is None:
+            self._snapshot()
+        else:
+            self._snapshot(update_fields)
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        if fields is None or getattr(self, "_loaded_values", None) is None:
+            self._snapshot()
+        else:
+            self._snapshot(fields)
+
+
+class BulkDeleteJob(TimeStampedModel):
+    """
+    Exclusão em massa executada em segundo plano (ver ``apps.core.bulk_delete``).
+    """
+    STATUS_CHOICES = (
+        ('pending', 'Pendente'),
+        ('running', 'Em execução'),
+        ('done', 'Concluída'),
+        ('failed', 'Falhou'),
+    )
+
+    model_label = models.CharField(max_length=100, help_text="Modelo alvo (app_label.Model)")
+    filters = models.JSONField(default=dict, help_text="Filtros do queryset a excluir")
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='pending')
+    total = models.PositiveIntegerField(default=0, help_text="Registros encontrados ao agendar")
+    deleted = models.PositiveIntegerField(default=0, help_text="Registros já excluídos")
+    error_message = models.TextField(blank=True, default='')
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = 'Exclusão em Massa'
+        verbose_name_plural = 'Exclusões em Massa'
+
+    @property
+    def progress(self):
+        if self.status == 'done':
+            return 100.0
+        if not self.total:
+            return 0.0
+        return round(min(self.deleted / self.total, 1) * 100, 1)
+
+    def __str__(self):
+        return f"{self.model_label} [{self.status}] {self.deleted}/{self.total}"
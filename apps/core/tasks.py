@@ -0,0 +1,13 @@
+"""Background tasks for the core app."""
+from celery import shared_task
+
+from apps.core.bulk_delete import BulkDeleteService
+from apps.core.models import BulkDeleteJob
+
+
+@shared_task(ignore_result=True)
+def run_bulk_delete(job_id: int) -> None:
+    """Execute a scheduled bulk delete job."""
+    job = BulkDeleteJob.objects.filter(pk=job_id, status="pending").first()
+    if job is not None:
+        BulkDeleteService().run(job)
@@ -0,0 +1,5 @@
+"""Helpers shared by the test suites."""
+
+# In-process cache for tests that exercise caching; the default cache points at
+# REDIS_URL, which is not reachable in most test environments
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
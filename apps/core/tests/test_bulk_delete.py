@@ -0,0 +1,81 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from apps.bot.models import InteractionLog
+from apps.core.bulk_delete import BulkDeleteService, delete_in_batches
+from apps.core.models import BulkDeleteJob
+from apps.core.tasks import run_bulk_delete
+from apps.courses.models import Course, SearchTerm
+from apps.users.models import UserProfile
+
+
+class DeleteInBatchesTests(TestCase):
+    def setUp(self):
+        self.user = UserProfile.objects.create(phone_number="5511000000001@c.us")
+        other = UserProfile.objects.create(phone_number="5511000000002@c.us")
+        InteractionLog.objects.bulk_create(
+            InteractionLog(user=user, message_content=str(i), message_type="RECEIVED")
+            for i in range(7)
+            for user in (self.user, other)
+        )
+
+    def test_deletes_matching_rows_in_ranges(self):
+        progress = []
+
+        deleted = delete_in_batches(
+            InteractionLog.objects.filter(user=self.user), batch_size=3, on_progress=progress.append
+        )
+
+        self.assertEqual(deleted, 7)
+        self.assertEqual(progress, [3, 6, 7])
+        self.assertFalse(InteractionLog.objects.filter(user=self.user).exists())
+        self.assertEqual(InteractionLog.objects.count(), 7)
+
+    def test_interaction_logs_use_raw_delete(self):
+        # no cascades or signals: one SELECT for the range bound + one DELETE per range
+        with self.assertNumQueries(4):
+            delete_in_batches(InteractionLog.objects.filter(user=self.user), batch_size=10)
+
+    def test_cascades_are_still_collected(self):
+        course = Course.objects.create(name="Engenharia de Software")
+        SearchTerm.objects.create(course=course, term="Django")
+
+        deleted = delete_in_batches(Course.objects.filter(pk=course.pk), batch_size=10)
+
+        self.assertEqual(deleted, 2)
+        self.assertFalse(SearchTerm.objects.exists())
+
+
+class BulkDeleteApiTests(TestCase):
+    def setUp(self):
+        user = UserProfile.objects.create(phone_number="5511000000001@c.us")
+        InteractionLog.objects.bulk_create(
+            InteractionLog(user=user, message_content=str(i), message_type="SENT") for i in range(5)
+        )
+
+    def test_clear_runs_in_background_and_reports_progress(self):
+        with patch("apps.core.tasks.run_bulk_delete.delay", side_effect=run_bulk_delete), \
+                self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post("/api/interactions/clear/", {}, secure=True)
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.json()["count"], 5)
+        job_id = response.json()["job"]["id"]
+
+        job = self.client.get(f"/api/bulk-deletes/{job_id}/", secure=True).json()
+        self.assertEqual(job["status"], "done")
+        self.assertEqual(job["deleted"], 5)
+        self.assertEqual(job["progress"], 100.0)
+        self.assertEqual(InteractionLog.objects.count(), 0)
+
+    def test_failed_job_is_recorded(self):
+        job = BulkDeleteJob.objects.create(
+            model_label="bot.InteractionLog", filters={"no_such_field": 1}
+        )
+
+        job = BulkDeleteService().run(job)
+
+        self.assertEqual(job.status, "failed")
+        self.assertTrue(job.error_message)
+        self.assertEqual(InteractionLog.objects.count(), 5)
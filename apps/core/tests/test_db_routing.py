@@ -0,0 +1,95 @@
+import time
+from unittest import skipUnless
+from unittest.mock import patch
+
+from django.conf import settings
+from django.db import connections
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+
+from apps.users.models import UserProfile
+from infra.db import REPLICA_ALIAS, ReadReplicaRouter, read_from_replica
+from infra.middleware.read_replica import PIN_COOKIE, ReadReplicaMiddleware
+
+WITH_REPLICA = {REPLICA_ALIAS: {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}}
+
+
+class ReadReplicaRouterTests(SimpleTestCase):
+    def setUp(self):
+        self.router = ReadReplicaRouter()
+
+    @patch.dict(settings.DATABASES, WITH_REPLICA)
+    def test_reads_use_replica_only_inside_the_block(self):
+        self.assertIsNone(self.router.db_for_read(UserProfile))
+        with read_from_replica():
+            self.assertEqual(self.router.db_for_read(UserProfile), REPLICA_ALIAS)
+            self.assertEqual(self.router.db_for_write(UserProfile), "default")
+            with read_from_replica(False):
+                self.assertIsNone(self.router.db_for_read(UserProfile))
+        self.assertIsNone(self.router.db_for_read(UserProfile))
+
+    @patch.dict(settings.DATABASES)
+    def test_without_replica_alias_reads_stay_on_default(self):
+        settings.DATABASES.pop(REPLICA_ALIAS, None)
+        with read_from_replica():
+            self.assertIsNone(self.router.db_for_read(UserProfile))
+
+    def test_replica_is_never_migrated(self):
+        self.assertFalse(self.router.allow_migrate(REPLICA_ALIAS, "users"))
+        self.assertTrue(self.router.allow_migrate("default", "users"))
+
+
+@patch.dict(settings.DATABASES, WITH_REPLICA)
+class ReadReplicaMiddlewareTests(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.routed_to = []
+
+        def view(request):
+            self.routed_to.append(ReadReplicaRouter().db_for_read(UserProfile))
+            return HttpResponse()
+
+        self.middleware = ReadReplicaMiddleware(view)
+
+    def test_safe_dashboard_and_api_requests_read_from_replica(self):
+        self.middleware(self.factory.get("/dashboard/users/"))
+        self.middleware(self.factory.get("/api/interactions/"))
+
+        self.assertEqual(self.routed_to, [REPLICA_ALIAS, REPLICA_ALIAS])
+
+    def test_webhook_and_writes_stay_on_default(self):
+        self.middleware(self.factory.post("/webhook/"))
+        self.middleware(self.factory.get("/health/"))
+        self.middleware(self.factory.post("/api/search-terms/reorder/"))
+
+        self.assertEqual(self.routed_to, [None, None, None])
+
+    def test_write_pins_the_browser_to_default(self):
+        response = self.middleware(self.factory.post("/dashboard/bot/configuration/"))
+        pinned_until = response.cookies[PIN_COOKIE].value
+        self.assertGreater(float(pinned_until), time.time())
+
+        request = self.factory.get("/dashboard/bot/configuration/")
+        request.COOKIES[PIN_COOKIE] = pinned_until
+        self.middleware(request)
+
+        self.assertEqual(self.routed_to, [None, None])
+
+
+@skipUnless(REPLICA_ALIAS in settings.DATABASES, "set DATABASE_REPLICA_URL to run")
+class ReadReplicaAliasTests(TransactionTestCase):
+    """Run with e.g. ``DATABASE_REPLICA_URL=sqlite:////tmp/replica.sqlite3``."""
+
+    databases = {"default", REPLICA_ALIAS}
+
+    def test_dashboard_reads_hit_the_replica_connection(self):
+        UserProfile.objects.create(phone_number="5511000000001@c.us")
+
+        with CaptureQueriesContext(connections[REPLICA_ALIAS]) as replica:
+            with read_from_replica():
+                self.assertEqual(UserProfile.objects.count(), 1)
+                UserProfile.objects.update(current_action="x")
+
+        self.assertEqual(len(replica.captured_queries), 1)
+        self.assertEqual(UserProfile.objects.get().current_action, "x")
@@ -0,0 +1,92 @@
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import cache
+from django.db import DatabaseError
+from django.test import TestCase, override_settings
+
+from apps.bot.health import BotHealthMonitor
+from apps.core.health import ReadinessProbe
+from apps.core.testing import LOCMEM_CACHE
+
+
+def fake_redis(queue_depth=0):
+    client = MagicMock()
+    client.pipeline.return_value.execute.return_value = [True, queue_depth]
+    return client
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class HealthEndpointTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        patcher = patch("apps.core.health._probe", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        redis_patcher = patch("apps.core.health.get_redis_client", return_value=fake_redis())
+        self.redis = redis_patcher.start()
+        self.addCleanup(redis_patcher.stop)
+
+    def test_liveness_touches_nothing(self):
+        with self.assertNumQueries(0):
+            response = self.client.get("/health/live/", secure=True)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"status": "alive"})
+        self.redis.assert_not_called()
+
+    def test_readiness_result_is_reused_within_ttl(self):
+        with self.assertNumQueries(1):
+            first = self.client.get("/health/ready/", secure=True)
+        with self.assertNumQueries(0):
+            second = self.client.get("/health/ready/", secure=True)
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.json()["components"], {"database": "healthy", "cache": "healthy"})
+        self.assertEqual(second.json(), first.json())
+        self.assertEqual(self.redis.call_count, 1)
+
+    def test_other_processes_share_the_cached_result(self):
+        ReadinessProbe(ttl_seconds=5).check()
+
+        with self.assertNumQueries(0):
+            result = ReadinessProbe(ttl_seconds=5).check()
+
+        self.assertEqual(result["status"], "healthy")
+
+    def test_other_hosts_do_not_share_the_result(self):
+        with patch("apps.core.health.socket.gethostname", return_value="backend-1"):
+            ReadinessProbe(ttl_seconds=5).check()
+        with patch("apps.core.health.socket.gethostname", return_value="backend-2"), patch(
+            "apps.core.health.connection.cursor", side_effect=DatabaseError("down")
+        ):
+            result = ReadinessProbe(ttl_seconds=5).check()
+
+        self.assertEqual(result["status"], "unhealthy")
+
+    def test_database_failure_fails_readiness(self):
+        with patch("apps.core.health.connection.cursor", side_effect=DatabaseError("down")):
+            response = self.client.get("/health/ready/", secure=True)
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json()["components"]["database"], "unhealthy")
+
+    def test_deep_checks_only_degrade(self):
+        self.redis.return_value = fake_redis(queue_depth=5000)
+        cache.set(BotHealthMonitor.STATUS_CACHE_KEY, {"status": "offline", "session_status": "STOPPED"})
+
+        response = self.client.get("/health/ready/?deep=1", secure=True)
+
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body["status"], "degraded")
+        self.assertEqual(body["components"]["waha"]["session_status"], "STOPPED")
+        self.assertEqual(body["components"]["queue"], {"status": "degraded", "depth": 5000})
+
+    def test_legacy_endpoint_no_longer_writes_to_the_cache(self):
+        with patch("apps.core.health.cache.set", wraps=cache.set) as cache_set:
+            for _ in range(3):
+                response = self.client.get("/health/", secure=True)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["status"], "healthy")
+        self.assertEqual(cache_set.call_count, 1)
@@ -0,0 +1,39 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from apps.bot.health import BotHealthMonitor
+from apps.core.testing import LOCMEM_CACHE
+from config.env import WahaSettings
+from infra.waha.client import WahaClient
+
+
+class MetricsViewTests(TestCase):
+    def test_exposes_prometheus_metrics(self):
+        with patch("infra.waha.client.requests.post") as post_mock:
+            post_mock.return_value.status_code = 201
+            WahaClient(settings=WahaSettings()).send_message("5511999999999", "oi")
+
+        with patch("apps.core.views.metrics.get_redis_client", return_value=None):
+            response = self.client.get("/metrics/", secure=True)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain"))
+        body = response.content.decode()
+        self.assertIn('capyvagas_waha_send_total{status="ok"}', body)
+        self.assertIn("capyvagas_webhook_latency_seconds", body)
+        self.assertIn("capyvagas_job_search_seconds", body)
+
+    @override_settings(CACHES=LOCMEM_CACHE)
+    def test_publishes_waha_status_cached_by_the_worker(self):
+        cache.set(
+            BotHealthMonitor.STATUS_CACHE_KEY,
+            {"status": "online", "response_time": 250.0, "session_status": "WORKING"},
+        )
+
+        with patch("apps.core.views.metrics.get_redis_client", return_value=None):
+            body = self.client.get("/metrics/", secure=True).content.decode()
+
+        self.assertIn("capyvagas_waha_up 1.0", body)
+        self.assertIn("capyvagas_waha_probe_seconds 0.25", body)
@@ -0,0 +1,34 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from django.test import SimpleTestCase
+
+from config.env import AppConfig
+
+ROOT = Path(__file__).resolve().parents[3]
+
+
+class LazySettingsTests(SimpleTestCase):
+    def test_sections_are_built_on_first_access(self):
+        config = AppConfig()
+
+        self.assertEqual(vars(config), {})
+        self.assertIs(config.job_alerts, config.job_alerts)
+        self.assertEqual(list(vars(config)), ["job_alerts"])
+
+
+class StartupImportTests(SimpleTestCase):
+    def test_web_boot_does_not_import_the_scraping_stack(self):
+        code = (
+            "import sys, django; django.setup(); import waha_bot.urls;"
+            "print(sorted({'pandas', 'numpy', 'jobspy', 'tls_client'} & set(sys.modules)))"
+        )
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE="waha_bot.settings", REDIS_URL="")
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True
+        )
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), "[]")
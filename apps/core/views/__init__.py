@@ -1,4 +1,5 @@
 """Core views package."""
-from .health import HealthCheckView
+from .health import HealthCheckView, LivenessView, ReadinessView
+from .metrics import MetricsView
 
-__all__ = ["HealthCheckView"]
+__all__ = ["HealthCheckView", "LivenessView", "MetricsView", "ReadinessView"]
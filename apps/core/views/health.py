@@ -1,13 +1,43 @@
-"""Health check endpoint for monitoring."""
-from typing import Any, Dict
+"""Health check endpoints for monitoring and orchestrator probes."""
+from typing import Any
 
-import structlog
-from django.core.cache import cache
-from django.db import connection
 from django.http import JsonResponse
 from django.views import View
 
-logger = structlog.get_logger(__name__)
+from apps.core.health import HEALTHY, UNHEALTHY, get_readiness_probe
+
+
+class LivenessView(View):
+    """Liveness probe: answers without touching any dependency."""
+
+    def get(self, request: Any) -> JsonResponse:
+        """
+        Report that the process is up.
+
+        Returns:
+            JsonResponse with ``{"status": "alive"}``.
+        """
+        return JsonResponse({"status": "alive"})
+
+
+class ReadinessView(View):
+    """Readiness probe backed by the cached dependency checks."""
+
+    def get(self, request: Any) -> JsonResponse:
+        """
+        Check whether this instance can serve traffic.
+
+        ``?deep=1`` also reports the WAHA session and the Celery backlog; those
+        only degrade the status and never fail the probe.
+
+        Returns:
+            JsonResponse with status and component health information,
+            503 when the database or Redis is unreachable.
+        """
+        deep = request.GET.get("deep", "").lower() in ("1", "true", "yes")
+        result = get_readiness_probe().check(deep=deep)
+        status_code = 503 if result["status"] == UNHEALTHY else 200
+        return JsonResponse(result, status=status_code)
 
 
 class HealthCheckView(View):
@@ -16,36 +46,13 @@ class HealthCheckView(View):
     def get(self, request: Any) -> JsonResponse:
         """
         Check the health of the application.
-        
+
+        Kept for existing monitors; shares the cached readiness result.
+
         Returns:
             JsonResponse with status and component health information.
         """
-        health_status = {
-            "status": "healthy",
-            "components": {},
-        }
-        
-        # Check database
-        try:
-            with connection.cursor() as cursor:
-                cursor.execute("SELECT 1")
-            health_status["components"]["database"] = "healthy"
-        except Exception as e:
-            logger.error("database_health_check_failed", error=str(e))
-            health_status["components"]["database"] = "unhealthy"
-            health_status["status"] = "unhealthy"
-        
-        # Check cache (Redis)
-        try:
-            cache.set("health_check", "ok", timeout=10)
-            if cache.get("health_check") == "ok":
-                health_status["components"]["cache"] = "healthy"
-            else:
-                raise Exception("Cache read/write test failed")
-        except Exception as e:
-            logger.error("cache_health_check_failed", error=str(e))
-            health_status["components"]["cache"] = "unhealthy"
-            health_status["status"] = "unhealthy"
-        
-        status_code = 200 if health_status["status"] == "healthy" else 503
+        result = get_readiness_probe().check()
+        health_status = {"status": result["status"], "components": result["components"]}
+        status_code = 200 if health_status["status"] == HEALTHY else 503
         return JsonResponse(health_status, status=status_code)
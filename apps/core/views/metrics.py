@@ -0,0 +1,66 @@
+"""Prometheus scrape endpoint."""
+from typing import Any
+
+import structlog
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.views import View
+
+from apps.bot.health import BotHealthMonitor
+from infra.observability.metrics import QUEUE_DEPTH, WAHA_PROBE_LATENCY, WAHA_UP, render_latest
+from infra.redis import get_redis_client
+
+logger = structlog.get_logger(__name__)
+
+
+class MetricsView(View):
+    """Expose in-process counters and histograms in the Prometheus text format."""
+
+    # Redis lists backing background queues (Celery default queue)
+    QUEUE_NAMES = ("celery",)
+
+    def get(self, request: Any) -> HttpResponse:
+        """
+        Render the current metrics.
+
+        Returns:
+            HttpResponse with the Prometheus exposition payload.
+        """
+        self._sample_queue_depths()
+        self._sample_waha_status()
+        payload, content_type = render_latest()
+        return HttpResponse(payload, content_type=content_type)
+
+    def _sample_queue_depths(self) -> None:
+        """Refresh queue depth gauges from Redis (one pipelined round-trip)."""
+        client = get_redis_client()
+        if client is None:
+            return
+        try:
+            pipe = client.pipeline(transaction=False)
+            for name in self.QUEUE_NAMES:
+                pipe.llen(name)
+            depths = pipe.execute()
+        except Exception as e:
+            logger.warning("queue_depth_sample_failed", error=str(e))
+            return
+        for name, depth in zip(self.QUEUE_NAMES, depths):
+            QUEUE_DEPTH.labels(queue=name).set(depth)
+
+    def _sample_waha_status(self) -> None:
+        """
+        Refresh the WAHA gauges from the status cached by the Celery prober.
+
+        The prober runs in the worker, whose in-process metrics this endpoint
+        never sees, so the gauges are published here at scrape time.
+        """
+        try:
+            last = cache.get(BotHealthMonitor.STATUS_CACHE_KEY)
+        except Exception as e:
+            logger.warning("waha_status_sample_failed", error=str(e))
+            return
+        if last is None:
+            return
+        WAHA_UP.set(1 if last.get("status") == "online" else 0)
+        if last.get("response_time") is not None:
+            WAHA_PROBE_LATENCY.set(last["response_time"] / 1000)
@@ -0,0 +1,95 @@
+"""
+Versioned cache of the course catalog read by the bot.
+
+Cached lists live under keys that embed a catalog version. Any change to a
+course or search term bumps the version once the transaction commits, so
+every old entry becomes unreachable at once and simply expires. The bot
+falls back to the database whenever the cache is unavailable.
+"""
+import time
+from typing import Callable, List, TypeVar
+
+import structlog
+from django.core.cache import cache
+from django.db import transaction
+
+from apps.courses.models import Course, SearchTerm
+
+logger = structlog.get_logger(__name__)
+
+CATALOG_VERSION_KEY = "catalog:version"
+CATALOG_TTL = 3600  # seconds
+
+T = TypeVar("T")
+
+
+def catalog_version() -> int:
+    """
+    Current catalog version, initialised on first use.
+
+    The initial value is time-based so that a version key lost to eviction
+    never brings back entries written under an earlier version.
+
+    Returns:
+        Version number
+    """
+    cache.add(CATALOG_VERSION_KEY, time.time_ns(), timeout=None)
+    return cache.get(CATALOG_VERSION_KEY)
+
+
+def bump_catalog_version() -> None:
+    """Invalidate every cached catalog entry immediately."""
+    try:
+        cache.incr(CATALOG_VERSION_KEY)
+    except ValueError:
+        # Key missing: any fresh value invalidates what was cached before
+        cache.set(CATALOG_VERSION_KEY, time.time_ns(), timeout=None)
+    except Exception as e:
+        logger.warning("catalog_cache_unavailable", error=str(e))
+
+
+def invalidate_catalog() -> None:
+    """Bump the catalog version once the current transaction commits."""
+    transaction.on_commit(bump_catalog_version)
+
+
+def _cached(name: str, load: Callable[[], T]) -> T:
+    try:
+        key = f"catalog:v{catalog_version()}:{name}"
+        value = cache.get(key)
+    except Exception as e:
+        logger.warning("catalog_cache_unavailable", error=str(e))
+        return load()
+    if value is None:
+        value = load()
+        try:
+            cache.set(key, value, timeout=CATALOG_TTL)
+        except Exception:
+            pass
+    return value
+
+
+def get_active_courses() -> List[Course]:
+    """Active courses in display order."""
+    return _cached(
+        "courses:active",
+        lambda: list(Course.objects.filter(is_active=True).order_by("order", "name")),
+    )
+
+
+def get_default_terms(course_id: int) -> List[SearchTerm]:
+    """
+    Active search terms of a course, highest priority first.
+
+    Args:
+        course_id: ``Course`` id
+
+    Returns:
+        Search terms
+    """
+    return _cached(
+        f"courses:{course_id}:terms",
+        lambda: list(
+            SearchTerm.objects.filter(course_id=course_id, is_default=True).order_by("-priority")
+        ),
+    )
@@ -0,0 +1,12 @@
+"""Invalida o cache do catálogo quando cursos ou termos mudam."""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.courses.cache import invalidate_catalog
+from apps.courses.models import Course, SearchTerm
+
+
+@receiver([post_save, post_delete], sender=Course)
+@receiver([post_save, post_delete], sender=SearchTerm)
+def catalog_changed(sender, **kwargs):
+    invalidate_catalog()
@@ -0,0 +1,46 @@
+from django.test import TestCase, override_settings
+
+from apps.core.testing import LOCMEM_CACHE
+from apps.courses.cache import get_active_courses, get_default_terms
+from apps.courses.models import Course, SearchTerm
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class CatalogCacheTests(TestCase):
+    def setUp(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.course = Course.objects.create(name="Engenharia de Software")
+            SearchTerm.objects.create(course=self.course, term="Python", priority=1)
+
+    def test_lists_are_served_from_cache(self):
+        get_active_courses()
+        get_default_terms(self.course.pk)
+
+        with self.assertNumQueries(0):
+            self.assertEqual([c.name for c in get_active_courses()], ["Engenharia de Software"])
+            self.assertEqual([t.term for t in get_default_terms(self.course.pk)], ["Python"])
+
+    def test_changes_invalidate_after_commit(self):
+        get_default_terms(self.course.pk)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            SearchTerm.objects.create(course=self.course, term="Django", priority=5)
+
+        self.assertEqual([t.term for t in get_default_terms(self.course.pk)], ["Django", "Python"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.course.is_active = False
+            self.course.save()
+
+        self.assertEqual(get_active_courses(), [])
+
+
+class CatalogCacheUnavailableTests(TestCase):
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.redis.RedisCache",
+                            "LOCATION": "redis://127.0.0.1:1/0"}}
+    )
+    def test_falls_back_to_database(self):
+        Course.objects.create(name="Engenharia de Software")
+
+        self.assertEqual([c.name for c in get_active_courses()], ["Engenharia de Software"])
@@ -7,9 +7,11 @@ from apps.dashboard.api_views import (
     CourseViewSet,
     SearchTermViewSet,
     InteractionLogViewSet,
+    JobSearchLogViewSet,
     BotStatusViewSet,
     BotConfigurationViewSet,
     UserProfileViewSet,
+    BulkDeleteJobViewSet,
 )
 
 # Router para viewsets
@@ -17,9 +19,11 @@ router = DefaultRouter()
 router.register(r'courses', CourseViewSet, basename='course')
 router.register(r'terms', SearchTermViewSet, basename='term')
 router.register(r'interactions', InteractionLogViewSet, basename='interaction')
+router.register(r'job-searches', JobSearchLogViewSet, basename='job-search')
 router.register(r'bot/status', BotStatusViewSet, basename='bot-status')
 router.register(r'bot/configuration', BotConfigurationViewSet, basename='bot-configuration')
 router.register(r'users', UserProfileViewSet, basename='user')
+router.register(r'bulk-deletes', BulkDeleteJobViewSet, basename='bulk-delete')
 
 urlpatterns = [
     path('', include(router.urls)),
@@ -5,24 +5,38 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny  # TODO: Adicionar autenticação em produção
+from django.db import transaction
+from django.db.models import Count
 from django.utils import timezone
 from datetime import timedelta
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
 from django.contrib.auth import get_user_model
 
+from apps.core.bulk_delete import BulkDeleteService
+from apps.courses.cache import invalidate_catalog
+from apps.core.models import BulkDeleteJob
+from apps.jobs.models import JobSearchLog
 from apps.courses.models import Course, SearchTerm
 from apps.users.models import UserProfile
 from apps.bot.models import InteractionLog, BotHealthCheck, BotMetrics, BotConfiguration
+from apps.bot.counters import get_interaction_counters
 from apps.bot.health import BotHealthMonitor
+from apps.bot.rollups import interaction_totals
+from apps.dashboard.exports import StreamingExportMixin
+from apps.dashboard.filters import InteractionSearchFilter
+from apps.dashboard.pagination import KeysetPagination
 from apps.dashboard.serializers import (
     CourseSerializer,
     CourseListSerializer,
     SearchTermSerializer,
+    SearchTermReorderSerializer,
     InteractionLogSerializer,
+    JobSearchLogSerializer,
     BotHealthCheckSerializer,
     BotStatusSerializer,
     BotConfigurationSerializer,
+    BulkDeleteJobSerializer,
     UserProfileSerializer,
     UserProfileListSerializer,
 )
@@ -47,6 +61,12 @@ class CourseViewSet(viewsets.ModelViewSet):
     ordering_fields = ['name', 'order', 'created_at']
     ordering = ['order', 'name']
     
+    def get_queryset(self):
+        queryset = super().get_queryset().annotate(search_terms_count=Count('search_terms'))
+        if self.action != 'list':
+            queryset = queryset.prefetch_related('search_terms')
+        return queryset
+
     def get_serializer_class(self):
         if self.action == 'list':
             return CourseListSerializer
@@ -71,18 +91,44 @@ class CourseViewSet(viewsets.ModelViewSet):
         if not ids:
             return Response({'error': 'Nenhum ID fornecido'}, status=status.HTTP_400_BAD_REQUEST)
         
-        count = Course.objects.filter(id__in=ids).delete()[0]
-        return Response({'message': f'{count} curso(s) deletado(s) com sucesso', 'count': count})
+        # Exclusão em lotes no worker; o progresso fica em /api/bulk-deletes/<id>/
+        job = BulkDeleteService().schedule(Course, {'id__in': list(ids)})
+        return Response(
+            {
+                'message': f'Exclusão de {job.total} curso(s) agendada',
+                'count': job.total,
+                'job': BulkDeleteJobSerializer(job).data,
+            },
+            status=status.HTTP_202_ACCEPTED,
+        )
 
 
-class UserProfileViewSet(viewsets.ModelViewSet):
+class UserProfileViewSet(StreamingExportMixin, viewsets.ModelViewSet):
     queryset = UserProfile.objects.select_related("selected_course").all()
     permission_classes = [AllowAny]
+    pagination_class = KeysetPagination
+    keyset_fields = ("last_activity", "id")
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_fields = ["is_authenticated_utfpr", "selected_course"]
     search_fields = ["phone_number", "ra"]
     ordering_fields = ["last_activity", "created_at", "ra", "phone_number"]
     ordering = ["-last_activity"]
+    export_filename = "users"
+    export_columns = [
+        ("id", "id"),
+        ("phone_number", "phone_number"),
+        ("ra", "ra"),
+        ("is_authenticated_utfpr", "is_authenticated_utfpr"),
+        ("selected_course", "selected_course__name"),
+        ("interactions_count", "interactions_count"),
+        ("last_activity", "last_activity"),
+        ("created_at", "created_at"),
+    ]
+
+    def get_queryset(self):
+        return super().get_queryset().annotate(
+            interactions_count=InteractionLog.count_per_user()
+        )
 
     def get_serializer_class(self):
         if self.action == "list":
@@ -128,26 +174,55 @@ class SearchTermViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['post'])
     def reorder(self, request):
         """Reordenar termos de busca."""
-        order_data = request.data.get('order', [])  # [{'id': 1, 'priority': 10}, ...]
+        # {'order': [{'id': 1, 'priority': 10}, ...]}
+        serializer = SearchTermReorderSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        priorities = {item['id']: item['priority'] for item in serializer.validated_data['order']}
         
-        for item in order_data:
-            SearchTerm.objects.filter(id=item['id']).update(priority=item['priority'])
+        # Um único UPDATE ... CASE para todos os termos, numa transação
+        now = timezone.now()
+        with transaction.atomic():
+            terms = list(
+                SearchTerm.objects.select_for_update()
+                .filter(id__in=priorities)
+                .only('id', 'priority', 'updated_at')
+                .order_by()
+            )
+            for term in terms:
+                term.priority = priorities[term.id]
+                term.updated_at = now
+            SearchTerm.objects.bulk_update(terms, ['priority', 'updated_at'])
+            # bulk_update não dispara sinais: invalida o catálogo uma vez só
+            invalidate_catalog()
         
-        return Response({'message': 'Ordem atualizada com sucesso'})
+        return Response({'message': 'Ordem atualizada com sucesso', 'updated': len(terms)})
 
 
-class InteractionLogViewSet(viewsets.ReadOnlyModelViewSet):
+class InteractionLogViewSet(StreamingExportMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet para visualização de logs de interação (somente leitura).
     """
     queryset = InteractionLog.objects.select_related('user')
     serializer_class = InteractionLogSerializer
     permission_classes = [AllowAny]
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    pagination_class = KeysetPagination
+    keyset_fields = ('created_at', 'id')
+    filter_backends = [DjangoFilterBackend, InteractionSearchFilter, OrderingFilter]
     filterset_fields = ['user', 'message_type', 'session_id']
-    search_fields = ['message_content', 'user__phone_number', 'user__ra']
     ordering_fields = ['created_at']
     ordering = ['-created_at']
+    export_filename = 'interactions'
+    export_columns = [
+        ('id', 'id'),
+        ('created_at', 'created_at'),
+        ('user', 'user_id'),
+        ('user_phone', 'user__phone_number'),
+        ('user_ra', 'user__ra'),
+        ('message_type', 'message_type'),
+        ('session_id', 'session_id'),
+        ('message_content', 'message_content'),
+        ('metadata', 'metadata'),
+    ]
     
     @action(detail=False, methods=['get'])
     def stats(self, request):
@@ -155,13 +230,19 @@ class InteractionLogViewSet(viewsets.ReadOnlyModelViewSet):
         days = int(request.query_params.get('days', 7))
         since = timezone.now() - timedelta(days=days)
         
-        logs = self.queryset.filter(created_at__gte=since)
+        # Contagens vêm dos agregados por hora; usuários distintos do
+        # HyperLogLog diário no Redis (tabela bruta só se ele estiver fora)
+        totals = interaction_totals(since)
+        unique_users = get_interaction_counters().unique_users(days=days)
+        if unique_users is None:
+            logs = InteractionLog.objects.filter(created_at__gte=since)
+            unique_users = logs.values('user').distinct().count()
         
         stats = {
-            'total_interactions': logs.count(),
-            'messages_received': logs.filter(message_type='RECEIVED').count(),
-            'messages_sent': logs.filter(message_type='SENT').count(),
-            'unique_users': logs.values('user').distinct().count(),
+            'total_interactions': totals['messages_received'] + totals['messages_sent'],
+            'messages_received': totals['messages_received'],
+            'messages_sent': totals['messages_sent'],
+            'unique_users': unique_users,
             'period_days': days
         }
         
@@ -173,21 +254,62 @@ class InteractionLogViewSet(viewsets.ReadOnlyModelViewSet):
         user_id = request.data.get('user_id')
         days = request.data.get('days')
         
-        queryset = self.queryset
+        filters = {}
         
         if user_id:
-            queryset = queryset.filter(user_id=user_id)
+            filters['user_id'] = user_id
         
         if days:
             cutoff = timezone.now() - timedelta(days=days)
-            queryset = queryset.filter(created_at__lt=cutoff)
+            filters['created_at__lt'] = cutoff.isoformat()
         
-        count = queryset.delete()[0]
+        # Exclusão em lotes no worker; o progresso fica em /api/bulk-deletes/<id>/
+        job = BulkDeleteService().schedule(InteractionLog, filters)
         
         return Response({
-            'message': f'{count} log(s) de interação deletado(s) com sucesso',
-            'count': count
-        })
+            'message': f'Exclusão de {job.total} log(s) de interação agendada',
+            'count': job.total,
+            'job': BulkDeleteJobSerializer(job).data,
+        }, status=status.HTTP_202_ACCEPTED)
+
+
+class JobSearchLogViewSet(StreamingExportMixin, viewsets.ReadOnlyModelViewSet):
+    """
+    ViewSet para visualização de logs de busca de vagas (somente leitura).
+    """
+    queryset = JobSearchLog.objects.select_related('user')
+    serializer_class = JobSearchLogSerializer
+    permission_classes = [AllowAny]
+    pagination_class = KeysetPagination
+    keyset_fields = ('created_at', 'id')
+    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    filterset_fields = ['user', 'job_type', 'search_term']
+    search_fields = ['search_term', 'location']
+    ordering_fields = ['created_at', 'results_count']
+    ordering = ['-created_at']
+    export_filename = 'job-searches'
+    export_columns = [
+        ('id', 'id'),
+        ('created_at', 'created_at'),
+        ('user', 'user_id'),
+        ('user_phone', 'user__phone_number'),
+        ('search_term', 'search_term'),
+        ('location', 'location'),
+        ('job_type', 'job_type'),
+        ('results_count', 'results_count'),
+        ('filters', 'filters'),
+    ]
+
+
+class BulkDeleteJobViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    Acompanhamento das exclusões em massa agendadas (somente leitura).
+    """
+    queryset = BulkDeleteJob.objects.all()
+    serializer_class = BulkDeleteJobSerializer
+    permission_classes = [AllowAny]
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = ['status', 'model_label']
 
 
 class BotStatusViewSet(viewsets.ViewSet):
@@ -199,7 +321,7 @@ class BotStatusViewSet(viewsets.ViewSet):
     def list(self, request):
         """Obter status atual do bot."""
         monitor = BotHealthMonitor()
-        current_status = monitor.check_bot_status()
+        current_status = monitor.get_cached_status()
         metrics = monitor.get_metrics_summary(hours=24)
         
         response_data = {
@@ -238,15 +360,13 @@ class BotStatusViewSet(viewsets.ViewSet):
         """Métricas detalhadas do bot."""
         monitor = BotHealthMonitor()
         
-        # Métricas de diferentes períodos
-        metrics_1h = monitor.get_metrics_summary(hours=1)
-        metrics_24h = monitor.get_metrics_summary(hours=24)
-        metrics_7d = monitor.get_metrics_summary(hours=24*7)
+        # Métricas de diferentes períodos (uma única consulta agregada)
+        windows = monitor.get_metrics_windows([1, 24, 24 * 7])
         
         return Response({
-            'last_hour': metrics_1h,
-            'last_24_hours': metrics_24h,
-            'last_7_days': metrics_7d
+            'last_hour': windows[1],
+            'last_24_hours': windows[24],
+            'last_7_days': windows[24 * 7]
         })
 
 
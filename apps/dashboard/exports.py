@@ -0,0 +1,221 @@
+"""
+Streaming CSV/NDJSON exports for the dashboard API.
+
+Rows are read with ``QuerySet.values_list(...).iterator(chunk_size=...)``,
+which uses a server-side cursor on PostgreSQL. The response body is an async
+iterator: each chunk of rows is fetched through ``sync_to_async``, encoded and
+sent before the next one is read, so under ASGI memory use is bounded by one
+chunk no matter how large the table is. (A sync iterator would make Django's
+ASGI handler buffer the whole body first.)
+"""
+import csv
+import json
+from datetime import date, datetime
+from itertools import islice
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator, Sequence, Tuple
+
+from asgiref.sync import sync_to_async
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from rest_framework.decorators import action
+from rest_framework.renderers import BaseRenderer
+
+DEFAULT_CHUNK_SIZE = 2000
+
+# (column header, ``values_list`` lookup)
+Column = Tuple[str, str]
+
+
+class _Echo:
+    """File-like object whose ``write`` returns the value instead of buffering it."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def _csv_cell(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, cls=DjangoJSONEncoder, ensure_ascii=False)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def csv_lines(
+    headers: Sequence[str], rows: Iterable[Sequence[Any]], header: bool = True
+) -> Iterator[str]:
+    """
+    Encode rows as CSV, one line at a time.
+
+    Args:
+        headers: Header row
+        rows: Row values in header order
+        header: Emit the header row first (only for the first chunk)
+
+    Yields:
+        CSV lines, header first
+    """
+    writer = csv.writer(_Echo())
+    if header:
+        yield writer.writerow(headers)
+    for row in rows:
+        yield writer.writerow([_csv_cell(value) for value in row])
+
+
+def ndjson_lines(
+    headers: Sequence[str], rows: Iterable[Sequence[Any]], header: bool = True
+) -> Iterator[str]:
+    """
+    Encode rows as newline-delimited JSON objects.
+
+    Args:
+        headers: Object keys
+        rows: Row values in key order
+        header: Unused; NDJSON has no header row
+
+    Yields:
+        One JSON document per line
+    """
+    for row in rows:
+        yield json.dumps(dict(zip(headers, row)), cls=DjangoJSONEncoder, ensure_ascii=False) + "\n"
+
+
+ENCODERS = {"csv": csv_lines, "ndjson": ndjson_lines}
+
+
+async def encoded_chunks(
+    encode: Callable[..., Iterator[str]],
+    headers: Sequence[str],
+    rows: Iterator[Sequence[Any]],
+    chunk_size: int,
+) -> AsyncIterator[str]:
+    """
+    Fetch ``chunk_size`` rows at a time off the event loop and encode them.
+
+    Args:
+        encode: One of ``ENCODERS``
+        headers: Column headers
+        rows: Lazy row iterator (``QuerySet.iterator``)
+        chunk_size: Rows per fetch and per yielded chunk
+
+    Yields:
+        Encoded text of each chunk
+    """
+    # Thread-sensitive: the cursor must stay on the connection that opened it
+    fetch = sync_to_async(lambda: list(islice(rows, chunk_size)))
+    first = True
+    try:
+        while True:
+            chunk = await fetch()
+            text = "".join(encode(headers, chunk, header=first))
+            if text:
+                yield text
+            if len(chunk) < chunk_size:
+                break
+            first = False
+    finally:
+        # Client went away mid-export: release the server-side cursor
+        await sync_to_async(getattr(rows, "close", lambda: None))()
+
+
+def stream_export(
+    queryset: QuerySet,
+    columns: Sequence[Column],
+    export_format: str,
+    filename: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> StreamingHttpResponse:
+    """
+    Stream a queryset as a CSV or NDJSON attachment.
+
+    Args:
+        queryset: Rows to export, already filtered and ordered
+        columns: (header, lookup) pairs; lookups may span relations or name annotations
+        export_format: ``"csv"`` or ``"ndjson"``
+        filename: Attachment name without extension
+        chunk_size: Rows fetched from the cursor per round trip
+
+    Returns:
+        Streaming response
+
+    Raises:
+        ValueError: If the format is not supported
+    """
+    if export_format not in ENCODERS:
+        raise ValueError(f"unsupported export format: {export_format}")
+    headers = [header for header, _ in columns]
+    # Resolve the alias now: rows are read after ReadReplicaMiddleware has returned
+    queryset = queryset.using(queryset.db)
+    rows = queryset.values_list(*[lookup for _, lookup in columns]).iterator(chunk_size=chunk_size)
+    renderer = EXPORT_RENDERERS[export_format]
+    response = StreamingHttpResponse(
+        encoded_chunks(ENCODERS[export_format], headers, rows, chunk_size),
+        content_type=f"{renderer.media_type}; charset={renderer.charset}",
+    )
+    stamp = timezone.localtime().strftime("%Y%m%d-%H%M%S")
+    response["Content-Disposition"] = f'attachment; filename="{filename}-{stamp}.{export_format}"'
+    # Let a buffering reverse proxy pass chunks through as they are produced
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+class _ExportRenderer(BaseRenderer):
+    # Exports bypass rendering; this only serialises error responses
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return json.dumps(data, cls=DjangoJSONEncoder, ensure_ascii=False).encode(self.charset)
+
+
+class CSVExportRenderer(_ExportRenderer):
+    media_type = "text/csv"
+    format = "csv"
+
+
+class NDJSONExportRenderer(_ExportRenderer):
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+
+
+EXPORT_RENDERERS = {
+    renderer.format: renderer for renderer in (CSVExportRenderer, NDJSONExportRenderer)
+}
+
+
+class StreamingExportMixin:
+    """
+    Adds ``GET <list>/export/`` to a viewset.
+
+    The export goes through ``filter_queryset``, so it honours the same
+    filter, search and ordering parameters as the list endpoint, but is
+    not paginated. The format is negotiated like any DRF response:
+    ``?format=csv`` (default) or ``?format=ndjson``, or the ``Accept`` header.
+
+    Viewsets set ``export_columns`` and ``export_filename``.
+    """
+
+    export_columns: Sequence[Column] = ()
+    export_filename = "export"
+    export_chunk_size = DEFAULT_CHUNK_SIZE
+
+    @action(
+        detail=False,
+        methods=["get"],
+        renderer_classes=[CSVExportRenderer, NDJSONExportRenderer],
+    )
+    def export(self, request, *args, **kwargs):
+        """Exportar todos os registros filtrados (CSV ou NDJSON, sem paginação)."""
+        queryset = self.filter_queryset(self.get_queryset())
+        return stream_export(
+            queryset,
+            self.export_columns,
+            request.accepted_renderer.format,
+            self.export_filename,
+            chunk_size=self.export_chunk_size,
+        )
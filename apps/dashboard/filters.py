@@ -0,0 +1,19 @@
+"""
+Filtros customizados da API do dashboard.
+"""
+from rest_framework.filters import SearchFilter
+
+from apps.bot.search import search_interactions
+
+
+class InteractionSearchFilter(SearchFilter):
+    """
+    Parâmetro ``search`` dos logs de interação servido pelo índice de busca
+    (trigram no PostgreSQL, FTS5 no SQLite) em vez de ``LIKE '%x%'`` com JOIN.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        terms = self.get_search_terms(request)
+        if not terms:
+            return queryset
+        return search_interactions(queryset, " ".join(terms))
@@ -0,0 +1,240 @@
+"""
+Keyset (seek) pagination for the dashboard API and pages.
+
+Pages are selected with ``WHERE (created_at, id) < (:last_created_at, :last_id)``
+instead of ``OFFSET``, so every page is an index range scan regardless of
+depth and no ``COUNT(*)`` is issued. The position travels in an opaque
+base64 cursor.
+"""
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+@dataclass
+class KeysetPage:
+    """One page of results plus the cursors of its neighbours."""
+
+    items: List[Any]
+    next_cursor: Optional[str] = None
+    previous_cursor: Optional[str] = None
+    has_next: bool = field(init=False)
+    has_previous: bool = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.has_next = self.next_cursor is not None
+        self.has_previous = self.previous_cursor is not None
+
+
+def encode_cursor(values: Sequence[Any], backwards: bool = False) -> str:
+    """
+    Encode a keyset position as an opaque, URL-safe token.
+
+    Args:
+        values: Values of the keyset fields of the boundary row
+        backwards: Whether the cursor points to the previous page
+
+    Returns:
+        base64 token
+    """
+    payload = {
+        "v": [v.isoformat() if isinstance(v, datetime) else v for v in values],
+        "b": int(backwards),
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, model, fields: Sequence[str]) -> Tuple[List[Any], bool]:
+    """
+    Decode a token produced by ``encode_cursor``.
+
+    Args:
+        cursor: Token from the request
+        model: Model the keyset fields belong to
+        fields: Keyset field names
+
+    Returns:
+        Field values converted to Python and the direction flag
+
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        values = payload["v"]
+        if len(values) != len(fields):
+            raise ValueError("cursor does not match ordering")
+        values = [model._meta.get_field(name).to_python(v) for name, v in zip(fields, values)]
+        return values, bool(payload.get("b"))
+    except (binascii.Error, json.JSONDecodeError, KeyError, TypeError, ValidationError) as e:
+        raise ValueError(f"invalid cursor: {e}") from e
+
+
+def _after(fields: Sequence[str], values: Sequence[Any], descending: bool) -> Q:
+    # (f1, f2) < (v1, v2)  ==  f1 <= v1 AND (f1 < v1 OR (f1 = v1 AND f2 < v2));
+    # the leading "<=" keeps the condition sargable on the (f1, ...) index.
+    op = "lt" if descending else "gt"
+    expanded = Q()
+    for i, name in enumerate(fields):
+        equal_prefix = {f: v for f, v in zip(fields[:i], values[:i])}
+        expanded |= Q(**equal_prefix, **{f"{name}__{op}": values[i]})
+    return Q(**{f"{fields[0]}__{op}e": values[0]}) & expanded
+
+
+def keyset_page(
+    queryset: QuerySet,
+    fields: Sequence[str],
+    descending: bool = True,
+    cursor: Optional[str] = None,
+    page_size: int = 20,
+) -> KeysetPage:
+    """
+    Fetch one page of a queryset ordered by ``fields``.
+
+    Args:
+        queryset: Rows to paginate (its own ordering is replaced)
+        fields: Keyset fields, the last one unique (e.g. ``("created_at", "id")``)
+        descending: Newest first
+        cursor: Token of the page to fetch (None for the first page)
+        page_size: Rows per page
+
+    Returns:
+        The page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    position, backwards = (None, False)
+    if cursor:
+        position, backwards = decode_cursor(cursor, queryset.model, fields)
+
+    scan_descending = descending != backwards
+    ordering = [f"-{name}" if scan_descending else name for name in fields]
+    queryset = queryset.order_by(*ordering)
+    if position is not None:
+        queryset = queryset.filter(_after(fields, position, scan_descending))
+
+    rows = list(queryset[: page_size + 1])
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    if backwards:
+        rows.reverse()
+    if not rows:
+        return KeysetPage(items=[])
+
+    def values_of(row):
+        return [getattr(row, name) for name in fields]
+
+    more_after = has_more if not backwards else position is not None
+    more_before = position is not None if not backwards else has_more
+    return KeysetPage(
+        items=rows,
+        next_cursor=encode_cursor(values_of(rows[-1])) if more_after else None,
+        previous_cursor=encode_cursor(values_of(rows[0]), backwards=True) if more_before else None,
+    )
+
+
+class KeysetPagination(BasePagination):
+    """
+    DRF pagination over the view's ``keyset_fields`` (e.g. ``("created_at", "id")``).
+
+    The direction follows the view ordering on the first keyset field. Any
+    other ordering chosen through ``?ordering=`` falls back to page numbers.
+    """
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        fields = tuple(getattr(view, "keyset_fields", ("created_at", "id")))
+        ordering = list(queryset.query.order_by) or list(queryset.model._meta.ordering)
+        lead = ordering[0] if ordering else f"-{fields[0]}"
+        if lead.lstrip("-") != fields[0]:
+            self._fallback = PageNumberPagination()
+            return self._fallback.paginate_queryset(queryset, request, view)
+
+        self._fallback = None
+        self.request = request
+        try:
+            self.page = keyset_page(
+                queryset,
+                fields,
+                descending=lead.startswith("-"),
+                cursor=request.query_params.get(self.cursor_query_param),
+                page_size=self.get_page_size(request),
+            )
+        except ValueError:
+            raise NotFound("Cursor inválido")
+        return self.page.items
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except (TypeError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def _link(self, cursor):
+        if cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_paginated_response(self, data):
+        if self._fallback is not None:
+            return self._fallback.get_paginated_response(data)
+        return Response(
+            {
+                "next": self._link(self.page.next_cursor),
+                "previous": self._link(self.page.previous_cursor),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+
+def page_query_strings(request, page: KeysetPage, param: str = "cursor") -> Tuple[str, str]:
+    """
+    Query strings for the previous/next links of an HTML page, keeping filters.
+
+    Args:
+        request: Current request
+        page: Page being rendered
+        param: Name of the cursor query parameter
+
+    Returns:
+        (previous, next); an empty string when there is no such page
+    """
+
+    def build(cursor):
+        if cursor is None:
+            return ""
+        query = request.GET.copy()
+        query[param] = cursor
+        return "?" + query.urlencode()
+
+    return build(page.previous_cursor), build(page.next_cursor)
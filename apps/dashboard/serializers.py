@@ -4,6 +4,8 @@ Serializers para a API REST do dashboard.
 from rest_framework import serializers
 from apps.courses.models import Course, SearchTerm
 from apps.bot.models import InteractionLog, BotHealthCheck, BotMetrics, BotConfiguration
+from apps.core.models import BulkDeleteJob
+from apps.jobs.models import JobSearchLog
 from apps.users.models import UserProfile
 
 
@@ -16,6 +18,28 @@ class SearchTermSerializer(serializers.ModelSerializer):
         read_only_fields = ['created_at', 'updated_at']
 
 
+class SearchTermOrderItemSerializer(serializers.Serializer):
+    """Nova prioridade de um termo de busca."""
+    id = serializers.IntegerField()
+    priority = serializers.IntegerField()
+
+
+class SearchTermReorderSerializer(serializers.Serializer):
+    """Lista de prioridades enviada para reordenar termos de busca."""
+    order = SearchTermOrderItemSerializer(many=True, allow_empty=False)
+
+    def validate_order(self, value):
+        ids = [item['id'] for item in value]
+        duplicated = sorted({i for i in ids if ids.count(i) > 1})
+        if duplicated:
+            raise serializers.ValidationError(f"Termos repetidos: {duplicated}")
+        found = set(SearchTerm.objects.filter(id__in=ids).order_by().values_list('id', flat=True))
+        missing = sorted(set(ids) - found)
+        if missing:
+            raise serializers.ValidationError(f"Termos não encontrados: {missing}")
+        return value
+
+
 class CourseSerializer(serializers.ModelSerializer):
     """Serializer para cursos."""
     search_terms = SearchTermSerializer(many=True, read_only=True)
@@ -30,7 +54,9 @@ class CourseSerializer(serializers.ModelSerializer):
         read_only_fields = ['created_at', 'updated_at']
     
     def get_search_terms_count(self, obj):
-        return obj.search_terms.count()
+        # Anotado pelo CourseViewSet; objetos recém-criados caem na contagem
+        count = getattr(obj, 'search_terms_count', None)
+        return count if count is not None else obj.search_terms.count()
 
 
 class CourseListSerializer(serializers.ModelSerializer):
@@ -42,7 +68,9 @@ class CourseListSerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'code', 'is_active', 'order', 'search_terms_count']
     
     def get_search_terms_count(self, obj):
-        return obj.search_terms.count()
+        # Anotado pelo CourseViewSet; objetos recém-criados caem na contagem
+        count = getattr(obj, 'search_terms_count', None)
+        return count if count is not None else obj.search_terms.count()
 
 
 class UserProfileListSerializer(serializers.ModelSerializer):
@@ -62,7 +90,9 @@ class UserProfileListSerializer(serializers.ModelSerializer):
         ]
 
     def get_interactions_count(self, obj):
-        return obj.interactions.count()
+        # Anotado pelo UserProfileViewSet; objetos recém-criados caem na contagem
+        count = getattr(obj, "interactions_count", None)
+        return count if count is not None else obj.interactions.count()
 
 
 class UserProfileSerializer(serializers.ModelSerializer):
@@ -92,7 +122,9 @@ class UserProfileSerializer(serializers.ModelSerializer):
         ]
 
     def get_interactions_count(self, obj):
-        return obj.interactions.count()
+        # Anotado pelo UserProfileViewSet; objetos recém-criados caem na contagem
+        count = getattr(obj, "interactions_count", None)
+        return count if count is not None else obj.interactions.count()
 
 
 class InteractionLogSerializer(serializers.ModelSerializer):
@@ -109,6 +141,19 @@ class InteractionLogSerializer(serializers.ModelSerializer):
         read_only_fields = ['created_at']
 
 
+class JobSearchLogSerializer(serializers.ModelSerializer):
+    """Serializer para logs de busca de vagas."""
+    user_phone = serializers.CharField(source='user.phone_number', read_only=True)
+
+    class Meta:
+        model = JobSearchLog
+        fields = [
+            'id', 'user', 'user_phone', 'search_term', 'location', 'job_type',
+            'results_count', 'filters', 'results_preview', 'created_at'
+        ]
+        read_only_fields = fields
+
+
 class BotHealthCheckSerializer(serializers.ModelSerializer):
     """Serializer para verificações de saúde do bot."""
     
@@ -161,3 +206,16 @@ class BotConfigurationSerializer(serializers.ModelSerializer):
             "updated_at",
         ]
         read_only_fields = ["created_at", "updated_at"]
+
+
+class BulkDeleteJobSerializer(serializers.ModelSerializer):
+    """Serializer para acompanhar exclusões em massa."""
+    progress = serializers.FloatField(read_only=True)
+
+    class Meta:
+        model = BulkDeleteJob
+        fields = [
+            'id', 'model_label', 'status', 'total', 'deleted', 'progress',
+            'error_message', 'started_at', 'finished_at', 'created_at'
+        ]
+        read_only_fields = fields
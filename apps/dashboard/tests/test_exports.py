@@ -0,0 +1,151 @@
+import asyncio
+import csv
+import io
+import json
+import warnings
+from unittest.mock import patch
+
+from asgiref.sync import async_to_sync
+from django.core.handlers.asgi import ASGIHandler
+from django.core.signals import request_finished, request_started
+from django.db import close_old_connections
+from django.test import TestCase
+
+from apps.bot.models import InteractionLog
+from apps.dashboard.api_views import InteractionLogViewSet
+from apps.jobs.models import JobSearchLog
+from apps.users.models import UserProfile
+
+
+def _content(response):
+    async def collect():
+        return b"".join([chunk async for chunk in response.streaming_content])
+
+    return async_to_sync(collect)().decode()
+
+
+class StreamingExportTests(TestCase):
+    def setUp(self):
+        self.alice = UserProfile.objects.create(phone_number="5511999990001@c.us", ra="a1")
+        self.bob = UserProfile.objects.create(phone_number="5511999990002@c.us")
+        InteractionLog.objects.create(
+            user=self.alice, message_content="oi, tudo bem?", message_type="RECEIVED",
+            metadata={"k": "v"},
+        )
+        InteractionLog.objects.create(user=self.alice, message_content="menu", message_type="SENT")
+        InteractionLog.objects.create(user=self.bob, message_content="vagas", message_type="RECEIVED")
+
+    def test_interactions_csv_is_streamed_with_header(self):
+        response = self.client.get("/api/interactions/export/", secure=True)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertTrue(response["Content-Type"].startswith("text/csv"))
+        self.assertIn("attachment;", response["Content-Disposition"])
+        rows = list(csv.DictReader(io.StringIO(_content(response))))
+        self.assertEqual(len(rows), 3)
+        first = next(r for r in rows if r["message_content"] == "oi, tudo bem?")
+        self.assertEqual(first["user_phone"], self.alice.phone_number)
+        self.assertEqual(json.loads(first["metadata"]), {"k": "v"})
+
+    def test_interactions_export_honours_list_filters(self):
+        response = self.client.get(
+            "/api/interactions/export/",
+            {"format": "ndjson", "user": self.alice.pk, "message_type": "RECEIVED"},
+            secure=True,
+        )
+
+        self.assertTrue(response["Content-Type"].startswith("application/x-ndjson"))
+        lines = [json.loads(line) for line in _content(response).splitlines()]
+        self.assertEqual([line["message_content"] for line in lines], ["oi, tudo bem?"])
+
+    def test_interactions_export_honours_search(self):
+        response = self.client.get(
+            "/api/interactions/export/", {"format": "ndjson", "search": "vagas"}, secure=True
+        )
+
+        lines = [json.loads(line) for line in _content(response).splitlines()]
+        self.assertEqual([line["user"] for line in lines], [self.bob.pk])
+
+    def test_users_export_includes_interaction_counts(self):
+        response = self.client.get("/api/users/export/", {"format": "ndjson"}, secure=True)
+
+        lines = {row["phone_number"]: row for row in map(json.loads, _content(response).splitlines())}
+        self.assertEqual(lines[self.alice.phone_number]["interactions_count"], 2)
+        self.assertEqual(lines[self.bob.phone_number]["interactions_count"], 1)
+        self.assertNotIn("utfpr_password", lines[self.alice.phone_number])
+
+    def test_job_searches_export_and_list(self):
+        JobSearchLog.objects.create(user=self.alice, search_term="python", results_count=3)
+        JobSearchLog.objects.create(user=self.bob, search_term="java", results_count=1)
+
+        response = self.client.get(
+            "/api/job-searches/export/", {"format": "csv", "search_term": "python"}, secure=True
+        )
+        rows = list(csv.DictReader(io.StringIO(_content(response))))
+        self.assertEqual([(r["search_term"], r["results_count"]) for r in rows], [("python", "3")])
+
+        listed = self.client.get("/api/job-searches/", secure=True).json()
+        self.assertEqual({r["search_term"] for r in listed["results"]}, {"python", "java"})
+
+    def test_export_query_count_does_not_grow_with_rows(self):
+        with self.assertNumQueries(1):
+            _content(self.client.get("/api/interactions/export/", secure=True))
+
+        for i in range(20):
+            InteractionLog.objects.create(user=self.bob, message_content=f"m{i}", message_type="SENT")
+        with self.assertNumQueries(1):
+            _content(self.client.get("/api/interactions/export/", secure=True))
+
+
+class ASGIStreamingExportTests(TestCase):
+    def setUp(self):
+        user = UserProfile.objects.create(phone_number="5511999990003@c.us")
+        for i in range(5):
+            InteractionLog.objects.create(user=user, message_content=f"m{i}", message_type="SENT")
+        # Like Django's test client: keep the test transaction's connection open
+        for signal in (request_started, request_finished):
+            signal.disconnect(close_old_connections)
+            self.addCleanup(signal.connect, close_old_connections)
+
+    async def _call(self, path):
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "https",
+            "path": path,
+            "query_string": b"",
+            "headers": [(b"host", b"testserver")],
+            "server": ("testserver", 443),
+            "client": ("127.0.0.1", 50000),
+        }
+        requested = False
+        messages = []
+
+        async def receive():
+            nonlocal requested
+            if not requested:
+                requested = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            await asyncio.Event().wait()
+
+        async def send(message):
+            messages.append(message)
+
+        await ASGIHandler()(scope, receive, send)
+        return messages
+
+    def test_body_is_sent_in_chunks_without_buffering(self):
+        with patch.object(InteractionLogViewSet, "export_chunk_size", 2), warnings.catch_warnings(
+            record=True
+        ) as caught:
+            warnings.simplefilter("always")
+            messages = async_to_sync(self._call)("/api/interactions/export/")
+
+        self.assertEqual(messages[0]["status"], 200)
+        bodies = [m["body"] for m in messages if m["type"] == "http.response.body" and m.get("body")]
+        self.assertGreaterEqual(len(bodies), 3)
+        self.assertEqual(len(b"".join(bodies).decode().splitlines()), 6)
+        self.assertFalse([w for w in caught if "StreamingHttpResponse" in str(w.message)])
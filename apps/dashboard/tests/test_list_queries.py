@@ -0,0 +1,48 @@
+from django.test import TestCase
+
+from apps.bot.models import InteractionLog
+from apps.courses.models import Course, SearchTerm
+from apps.users.models import UserProfile
+
+
+class ListQueryCountTests(TestCase):
+    def _add_courses(self, count):
+        for i in range(count):
+            course = Course.objects.create(name=f"Curso {Course.objects.count()}")
+            SearchTerm.objects.create(course=course, term=f"termo {i}")
+            SearchTerm.objects.create(course=course, term=f"outro {i}")
+
+    def _add_users(self, count):
+        for i in range(count):
+            user = UserProfile.objects.create(phone_number=f"55{UserProfile.objects.count():011d}@c.us")
+            InteractionLog.objects.create(user=user, message_content="oi", message_type="RECEIVED")
+
+    def test_course_list_query_count_is_constant(self):
+        self._add_courses(2)
+        with self.assertNumQueries(2):  # COUNT(*) + page
+            self.client.get("/api/courses/", secure=True)
+
+        self._add_courses(10)
+        with self.assertNumQueries(2):
+            response = self.client.get("/api/courses/", secure=True)
+
+        self.assertEqual({c["search_terms_count"] for c in response.json()["results"]}, {2})
+
+    def test_user_list_query_count_is_constant(self):
+        self._add_users(2)
+        with self.assertNumQueries(1):
+            self.client.get("/api/users/", secure=True)
+
+        self._add_users(10)
+        with self.assertNumQueries(1):
+            response = self.client.get("/api/users/", secure=True)
+
+        self.assertEqual({u["interactions_count"] for u in response.json()["results"]}, {1})
+
+    def test_created_course_still_reports_count(self):
+        response = self.client.post(
+            "/api/courses/", {"name": "Novo"}, content_type="application/json", secure=True
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()["search_terms_count"], 0)
@@ -0,0 +1,95 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.bot.models import InteractionLog
+from apps.dashboard.pagination import decode_cursor, encode_cursor, keyset_page
+from apps.users.models import UserProfile
+
+
+class KeysetPaginationTests(TestCase):
+    def setUp(self):
+        self.user = UserProfile.objects.create(phone_number="5511000000001@c.us")
+        now = timezone.now()
+        InteractionLog.objects.bulk_create(
+            InteractionLog(user=self.user, message_content=str(i), message_type="SENT")
+            for i in range(7)
+        )
+        # Two rows share a timestamp so the id tiebreaker is exercised
+        for i, log in enumerate(InteractionLog.objects.order_by("id")):
+            InteractionLog.objects.filter(pk=log.pk).update(
+                created_at=now - timedelta(minutes=min(i, 5))
+            )
+
+    def _contents(self, page):
+        return [log.message_content for log in page.items]
+
+    def test_walks_forward_and_back_without_gaps(self):
+        fields = ("created_at", "id")
+        first = keyset_page(InteractionLog.objects.all(), fields, page_size=3)
+        second = keyset_page(InteractionLog.objects.all(), fields, cursor=first.next_cursor, page_size=3)
+        third = keyset_page(InteractionLog.objects.all(), fields, cursor=second.next_cursor, page_size=3)
+
+        self.assertEqual(self._contents(first), ["0", "1", "2"])
+        self.assertEqual(self._contents(second), ["3", "4", "6"])
+        self.assertEqual(self._contents(third), ["5"])
+        self.assertIsNone(first.previous_cursor)
+        self.assertIsNone(third.next_cursor)
+
+        back = keyset_page(
+            InteractionLog.objects.all(), fields, cursor=third.previous_cursor, page_size=3
+        )
+        self.assertEqual(self._contents(back), ["3", "4", "6"])
+        self.assertIsNotNone(back.next_cursor)
+
+    def test_cursor_round_trip_and_rejects_garbage(self):
+        log = InteractionLog.objects.first()
+        cursor = encode_cursor([log.created_at, log.id])
+
+        values, backwards = decode_cursor(cursor, InteractionLog, ("created_at", "id"))
+
+        self.assertEqual(values, [log.created_at, log.id])
+        self.assertFalse(backwards)
+        with self.assertRaises(ValueError):
+            decode_cursor("not-a-cursor", InteractionLog, ("created_at", "id"))
+
+    def test_api_uses_cursor_without_count(self):
+        # no COUNT(*): a single query, users come in through select_related
+        with self.assertNumQueries(1):
+            response = self.client.get("/api/interactions/?page_size=4", secure=True)
+
+        body = response.json()
+        self.assertEqual(len(body["results"]), 4)
+        self.assertNotIn("count", body)
+        self.assertIn("cursor=", body["next"])
+
+        response = self.client.get(body["next"], secure=True)
+        self.assertEqual(len(response.json()["results"]), 3)
+
+    def test_api_rejects_invalid_cursor(self):
+        response = self.client.get("/api/interactions/?cursor=bogus", secure=True)
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_users_api_pages_by_last_activity(self):
+        UserProfile.objects.create(phone_number="5511000000002@c.us")
+
+        response = self.client.get("/api/users/?page_size=1", secure=True)
+
+        body = response.json()
+        self.assertEqual(body["results"][0]["phone_number"], "5511000000002@c.us")
+        self.assertIsNotNone(body["next"])
+
+    def test_interactions_page_links_to_next_cursor(self):
+        InteractionLog.objects.bulk_create(
+            InteractionLog(user=self.user, message_content="x", message_type="SENT")
+            for _ in range(60)
+        )
+
+        response = self.client.get("/dashboard/interactions/?type=SENT", secure=True)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context["logs"]), 50)
+        self.assertIn("type=SENT", response.context["next_page"])
+        self.assertIn("cursor=", response.context["next_page"])
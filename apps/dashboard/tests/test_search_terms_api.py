@@ -0,0 +1,48 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from apps.courses.models import Course, SearchTerm
+
+
+class SearchTermReorderTests(TestCase):
+    def setUp(self):
+        course = Course.objects.create(name="Engenharia de Software")
+        self.terms = [
+            SearchTerm.objects.create(course=course, term=f"termo {i}", priority=i) for i in range(50)
+        ]
+
+    def _reorder(self, order):
+        return self.client.post(
+            "/api/terms/reorder/", {"order": order}, content_type="application/json", secure=True
+        )
+
+    def test_reorder_is_one_update_and_one_cache_bump(self):
+        order = [{"id": t.pk, "priority": 100 - i} for i, t in enumerate(self.terms)]
+
+        with patch("apps.courses.cache.bump_catalog_version") as bump:
+            with self.captureOnCommitCallbacks(execute=True):
+                # validation SELECT, then SAVEPOINT, SELECT ... FOR UPDATE,
+                # one UPDATE ... CASE, RELEASE
+                with self.assertNumQueries(5):
+                    response = self._reorder(order)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["updated"], 50)
+        bump.assert_called_once_with()
+        priorities = dict(SearchTerm.objects.values_list("id", "priority"))
+        self.assertEqual(priorities[self.terms[0].pk], 100)
+        self.assertEqual(priorities[self.terms[49].pk], 51)
+
+    def test_unknown_ids_reject_the_whole_request(self):
+        response = self._reorder([{"id": self.terms[0].pk, "priority": 99}, {"id": 999999, "priority": 1}])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("999999", str(response.json()))
+        self.assertEqual(SearchTerm.objects.get(pk=self.terms[0].pk).priority, 0)
+
+    def test_malformed_items_are_rejected(self):
+        self.assertEqual(self._reorder([{"id": self.terms[0].pk}]).status_code, 400)
+        self.assertEqual(self._reorder([]).status_code, 400)
+        duplicated = [{"id": self.terms[0].pk, "priority": 1}, {"id": self.terms[0].pk, "priority": 2}]
+        self.assertEqual(self._reorder(duplicated).status_code, 400)
@@ -1,13 +1,20 @@
 from datetime import timedelta
 
-from django.db.models import Q
+from django.db.models import Count, Q
 from django.shortcuts import get_object_or_404, render
 from django.utils import timezone
 
+from apps.bot.counters import estimated_interaction_total, get_interaction_counters
 from apps.bot.health import BotHealthMonitor
 from apps.bot.models import BotConfiguration, BotHealthCheck, InteractionLog
+from apps.bot.rollups import interaction_totals
+from apps.bot.search import search_interactions
 from apps.courses.models import Course
+from apps.dashboard.pagination import keyset_page, page_query_strings
 from apps.users.models import UserProfile
+from config.env import settings
+
+PAGE_SIZE = 50
 
 
 def dashboard_home(request):
@@ -16,8 +23,13 @@ def dashboard_home(request):
     """
     # Estatísticas gerais
     total_courses = Course.objects.filter(is_active=True).count()
-    total_interactions = InteractionLog.objects.count()
-    total_users = InteractionLog.objects.values("user_id").distinct().count()
+    # Estimativa do planejador + contadores no Redis, sem varrer a tabela
+    total_interactions = estimated_interaction_total()
+    counters = get_interaction_counters()
+    total_users = counters.unique_users(days=settings.retention.interaction_log_days)
+    if total_users is None:
+        total_users = InteractionLog.objects.values("user_id").distinct().count()
+    messages_today = counters.message_counts(days=1)
 
     # Últimas interações
     recent_logs = (
@@ -34,6 +46,7 @@ def dashboard_home(request):
         "total_courses": total_courses,
         "total_interactions": total_interactions,
         "total_users": total_users,
+        "messages_today": sum(messages_today.values()) if messages_today else None,
         "recent_logs": recent_logs,
         "bot_metrics": bot_metrics,
     }
@@ -47,13 +60,11 @@ def bot_status(request):
     """
     monitor = BotHealthMonitor()
 
-    # Status atual
-    current_status = monitor.check_bot_status()
+    # Status atual (publicado pelo prober em background)
+    current_status = monitor.get_cached_status()
 
-    # Métricas de diferentes períodos
-    metrics_1h = monitor.get_metrics_summary(hours=1)
-    metrics_24h = monitor.get_metrics_summary(hours=24)
-    metrics_7d = monitor.get_metrics_summary(hours=24 * 7)
+    # Métricas de diferentes períodos (uma única consulta agregada)
+    windows = monitor.get_metrics_windows([1, 24, 24 * 7])
 
     # Últimas verificações
     recent_checks = BotHealthCheck.objects.only(
@@ -62,9 +73,9 @@ def bot_status(request):
 
     context = {
         "current_status": current_status,
-        "metrics_1h": metrics_1h,
-        "metrics_24h": metrics_24h,
-        "metrics_7d": metrics_7d,
+        "metrics_1h": windows[1],
+        "metrics_24h": windows[24],
+        "metrics_7d": windows[24 * 7],
         "recent_checks": recent_checks,
     }
 
@@ -89,7 +100,7 @@ def courses_list(request):
     """
     Lista e gerenciamento de cursos.
     """
-    courses = Course.objects.prefetch_related("search_terms").all()
+    courses = Course.objects.annotate(search_terms_count=Count("search_terms"))
 
     context = {
         "courses": courses,
@@ -134,24 +145,36 @@ def interactions_log(request):
         queryset = queryset.filter(message_type=message_type)
 
     if search:
-        queryset = queryset.filter(
-            Q(message_content__icontains=search)
-            | Q(user__phone_number__icontains=search)
-            | Q(user__ra__icontains=search)
+        queryset = search_interactions(queryset, search)
+
+    # Paginação por cursor em (created_at, id), sem OFFSET
+    cursor = request.GET.get("cursor")
+    try:
+        page = keyset_page(queryset, ("created_at", "id"), cursor=cursor, page_size=PAGE_SIZE)
+    except ValueError:
+        page = keyset_page(queryset, ("created_at", "id"), page_size=PAGE_SIZE)
+    logs = page.items
+    previous_page, next_page = page_query_strings(request, page)
+
+    # Estatísticas (dos agregados por hora, exceto quando há busca textual)
+    if search:
+        stats = queryset.aggregate(
+            total=Count("id"),
+            received=Count("id", filter=Q(message_type="RECEIVED")),
+            sent=Count("id", filter=Q(message_type="SENT")),
         )
-
-    # Paginação manual (ou use Django Paginator)
-    logs = queryset[:100]
-
-    # Estatísticas
-    stats = {
-        "total": queryset.count(),
-        "received": queryset.filter(message_type="RECEIVED").count(),
-        "sent": queryset.filter(message_type="SENT").count(),
-    }
+    else:
+        totals = interaction_totals(since if days else None)
+        stats = {
+            "received": totals["messages_received"] if message_type != "SENT" else 0,
+            "sent": totals["messages_sent"] if message_type != "RECEIVED" else 0,
+        }
+        stats["total"] = stats["received"] + stats["sent"]
 
     context = {
         "logs": logs,
+        "previous_page": previous_page,
+        "next_page": next_page,
         "stats": stats,
         "days": days,
         "message_type": message_type,
@@ -162,13 +185,24 @@ def interactions_log(request):
 
 
 def users_list(request):
-    users_qs = UserProfile.objects.select_related("selected_course").order_by("-last_activity")
+    users_qs = UserProfile.objects.select_related("selected_course")
     total_users = users_qs.count()
     authenticated_users = users_qs.filter(is_authenticated_utfpr=True).count()
     unauthenticated_users = total_users - authenticated_users
 
+    # Paginação por cursor em (last_activity, id), sem OFFSET
+    page_qs = users_qs.annotate(interactions_count=InteractionLog.count_per_user())
+    cursor = request.GET.get("cursor")
+    try:
+        page = keyset_page(page_qs, ("last_activity", "id"), cursor=cursor, page_size=PAGE_SIZE)
+    except ValueError:
+        page = keyset_page(page_qs, ("last_activity", "id"), page_size=PAGE_SIZE)
+    previous_page, next_page = page_query_strings(request, page)
+
     context = {
-        "users": users_qs,
+        "users": page.items,
+        "previous_page": previous_page,
+        "next_page": next_page,
         "total_users": total_users,
         "authenticated_users": authenticated_users,
         "unauthenticated_users": unauthenticated_users,
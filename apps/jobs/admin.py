@@ -0,0 +1,27 @@
+from django.contrib import admin
+
+from .models import JobAlertDelivery, JobAlertSubscription, JobPosting, JobSearchLog
+
+
+@admin.register(JobSearchLog)
+class JobSearchLogAdmin(admin.ModelAdmin):
+    list_display = ('user', 'search_term', 'results_count', 'created_at')
+    search_fields = ('search_term', 'user__phone_number')
+
+
+@admin.register(JobPosting)
+class JobPostingAdmin(admin.ModelAdmin):
+    list_display = ('title', 'company', 'source_term', 'created_at')
+    search_fields = ('title', 'company', 'source_term')
+
+
+@admin.register(JobAlertSubscription)
+class JobAlertSubscriptionAdmin(admin.ModelAdmin):
+    list_display = ('user', 'course', 'term', 'is_active', 'updated_at')
+    list_filter = ('is_active', 'course')
+
+
+@admin.register(JobAlertDelivery)
+class JobAlertDeliveryAdmin(admin.ModelAdmin):
+    list_display = ('subscription', 'posting', 'status', 'sent_at')
+    list_filter = ('status',)
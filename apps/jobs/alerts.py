@@ -0,0 +1,259 @@
+"""
+Job alerts: collect new postings, match them to subscriptions, notify users.
+
+``collect_postings`` runs one JobSpy search per distinct subscribed phrase,
+stores postings not seen before and matches only those through the
+``SubscriptionIndex``; each match becomes a pending ``JobAlertDelivery``.
+``JobAlertSender`` later sends each subscriber one digest of everything
+matched during the window (see ``apps.jobs.digest``) through a rate-limited
+``BulkSender``.
+"""
+import hashlib
+from datetime import datetime
+from typing import Any, Iterable, List, Mapping, Optional
+
+import structlog
+from django.utils import timezone
+
+from apps.bot.counters import get_interaction_counters
+from apps.bot.models import BotConfiguration, InteractionLog
+from apps.jobs.digest import DigestBuilder, in_quiet_hours
+from apps.jobs.matching import SubscriptionIndex
+from apps.jobs.models import JobAlertDelivery, JobAlertSubscription, JobPosting
+from apps.users.models import UserProfile
+from config.env import settings
+from infra.jobspy.service import JobSearchService
+from infra.waha.bulk import BulkSender
+from infra.waha.client import WahaClient
+
+logger = structlog.get_logger(__name__)
+
+
+def fingerprint(job: Mapping[str, Any]) -> str:
+    """
+    Stable identity of a scraped posting.
+
+    Args:
+        job: Posting as returned by ``JobSearchService.search``
+
+    Returns:
+        Hex SHA-256 of the normalised url, title and company
+    """
+    parts = [str(job.get(key) or "").strip().lower() for key in ("url", "title", "company")]
+    return hashlib.sha256("\x1f".join(parts).encode()).hexdigest()
+
+
+def ingest_postings(jobs: Iterable[Mapping[str, Any]], source_term: str = "") -> List[JobPosting]:
+    """
+    Store scraped postings, skipping ones already known.
+
+    Args:
+        jobs: Postings as returned by ``JobSearchService.search``
+        source_term: Search phrase that produced them
+
+    Returns:
+        The postings created by this call
+    """
+    by_fingerprint = {}
+    for job in jobs:
+        by_fingerprint.setdefault(fingerprint(job), job)
+    if not by_fingerprint:
+        return []
+
+    known = set(
+        JobPosting.objects.filter(fingerprint__in=by_fingerprint).values_list("fingerprint", flat=True)
+    )
+    new = [
+        JobPosting(
+            fingerprint=fp,
+            title=(job.get("title") or "Vaga")[:255],
+            company=(job.get("company") or "")[:255],
+            location=(job.get("location") or "")[:255],
+            url=(job.get("url") or "")[:1000],
+            description=job.get("description") or "",
+            source_term=source_term[:255],
+        )
+        for fp, job in by_fingerprint.items()
+        if fp not in known
+    ]
+    if not new:
+        return []
+    # A concurrent collector may have inserted some of them meanwhile
+    JobPosting.objects.bulk_create(new, ignore_conflicts=True)
+    return list(JobPosting.objects.filter(fingerprint__in=[p.fingerprint for p in new]))
+
+
+def match_postings(
+    postings: Iterable[JobPosting], index: Optional[SubscriptionIndex] = None
+) -> int:
+    """
+    Queue a delivery for every (subscription, posting) match.
+
+    Args:
+        postings: Newly stored postings
+        index: Subscription index (built from the database when omitted)
+
+    Returns:
+        Number of deliveries queued
+    """
+    index = index if index is not None else SubscriptionIndex.build()
+    deliveries = [
+        JobAlertDelivery(subscription_id=subscription_id, posting=posting)
+        for posting in postings
+        for subscription_id in index.match(posting)
+    ]
+    JobAlertDelivery.objects.bulk_create(deliveries, ignore_conflicts=True, batch_size=1000)
+    return len(deliveries)
+
+
+def collect_postings(job_service: Optional[JobSearchService] = None) -> int:
+    """
+    Search JobSpy for every subscribed phrase and queue alerts for new postings.
+
+    Args:
+        job_service: Job search service (optional, defaults to a new one)
+
+    Returns:
+        Number of deliveries queued
+    """
+    job_service = job_service or JobSearchService()
+    index = SubscriptionIndex.build()
+    new_postings: List[JobPosting] = []
+    for phrase in index.phrases():
+        try:
+            jobs = job_service.search([phrase], limit=settings.job_alerts.results_per_term)
+        except Exception as e:
+            logger.warning("job_alert_search_failed", term=phrase, error=str(e))
+            continue
+        new_postings.extend(ingest_postings(jobs, source_term=phrase))
+
+    queued = match_postings(new_postings, index)
+    logger.info(
+        "job_postings_collected",
+        phrases=len(index),
+        new_postings=len(new_postings),
+        deliveries=queued,
+    )
+    return queued
+
+
+def subscribe(user: UserProfile) -> JobAlertSubscription:
+    """
+    Subscribe a user to the course (and term, if any) they last selected.
+
+    Args:
+        user: User with a ``selected_course``
+
+    Returns:
+        The active subscription
+    """
+    term = user.selected_term
+    if term is not None and term.course_id != user.selected_course_id:
+        term = None
+    subscription, _ = JobAlertSubscription.objects.update_or_create(
+        user=user,
+        defaults={"course_id": user.selected_course_id, "term": term, "is_active": True},
+    )
+    return subscription
+
+
+def unsubscribe(user: UserProfile) -> bool:
+    """
+    Stop alerts for a user.
+
+    Args:
+        user: User profile
+
+    Returns:
+        True if an active subscription was disabled
+    """
+    return bool(JobAlertSubscription.objects.filter(user=user, is_active=True).update(is_active=False))
+
+
+class JobAlertSender:
+    """
+    Sends due job alert digests, one message per subscriber, at a paced rate.
+    """
+
+    def __init__(
+        self,
+        bulk_sender: Optional[BulkSender] = None,
+        digest_builder: Optional[DigestBuilder] = None,
+    ) -> None:
+        """
+        Initialize the sender.
+
+        Args:
+            bulk_sender: Rate-limited sender (defaults to the active WAHA configuration
+                paced at ``JOB_ALERTS_SEND_RATE_PER_SECOND``)
+            digest_builder: Digest builder (defaults to the configured window)
+        """
+        self.bulk_sender = bulk_sender or BulkSender(
+            WahaClient(settings=BotConfiguration.get_active()),
+            settings.job_alerts.send_rate_per_second,
+        )
+        self.digest_builder = digest_builder or DigestBuilder()
+
+    def send_digests(
+        self, now: Optional[datetime] = None, max_subscriptions: Optional[int] = None
+    ) -> int:
+        """
+        Send the digests of up to ``max_subscriptions`` due subscribers.
+
+        Args:
+            now: Reference time (defaults to the current time)
+            max_subscriptions: Users notified in this call (defaults to
+                ``JOB_ALERTS_SEND_BATCH_SIZE``)
+
+        Returns:
+            Number of digests WAHA accepted
+        """
+        now = now or timezone.now()
+        alerts = settings.job_alerts
+        if in_quiet_hours(now, alerts.quiet_hours_start, alerts.quiet_hours_end):
+            return 0
+        grouped = self.digest_builder.claim(now, max_subscriptions or alerts.send_batch_size)
+        if not grouped:
+            return 0
+
+        outbox = []
+        for deliveries in grouped.values():
+            subscription = deliveries[0].subscription
+            outbox.append(
+                (subscription, deliveries, self.digest_builder.render(subscription, deliveries))
+            )
+
+        session = self.bulk_sender.client.settings.session_name
+        counters = get_interaction_counters()
+        sent_ids, failed_ids, logs = [], [], []
+        results = self.bulk_sender.send_many(
+            (subscription.user.phone_number, text) for subscription, _, text in outbox
+        )
+        for (subscription, deliveries, text), (_, ok) in zip(outbox, results):
+            ids = [d.id for d in deliveries]
+            if ok:
+                sent_ids.extend(ids)
+                logs.append(
+                    InteractionLog(
+                        user=subscription.user,
+                        message_content=text,
+                        message_type="SENT",
+                        session_id=session,
+                        metadata={"job_alert_digest": True, "postings": len(ids)},
+                    )
+                )
+                counters.record(subscription.user_id, "SENT")
+            else:
+                failed_ids.extend(ids)
+
+        now = timezone.now()
+        JobAlertDelivery.objects.filter(id__in=sent_ids).update(status="sent", sent_at=now, updated_at=now)
+        JobAlertDelivery.objects.filter(id__in=failed_ids).update(status="failed", updated_at=now)
+        InteractionLog.objects.bulk_create(logs)
+        logger.info(
+            "job_alert_digests_sent",
+            digests=len(logs),
+            postings=len(sent_ids),
+            failed_digests=len(outbox) - len(logs),
+        )
+        return len(logs)
@@ -0,0 +1,150 @@
+"""
+Digest batching for job alerts.
+
+Matches are not sent as they arrive. Each subscriber's pending deliveries
+accumulate until the oldest one is ``window`` old; the whole batch then goes
+out as one message, so a user receives at most one digest per window
+instead of one message per matched job. Nothing is sent during quiet hours.
+"""
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from django.db import transaction
+from django.db.models import Min
+from django.utils import timezone
+
+from apps.jobs.formatting import format_job_message
+from apps.jobs.models import JobAlertDelivery, JobAlertSubscription
+from config.env import settings
+
+# Postings listed in one digest; the rest are summarised in a count
+MAX_JOBS_PER_DIGEST = 10
+# Deliveries left in "sending" this long (worker died mid-batch) are queued again
+STALE_SENDING_AFTER = timedelta(minutes=15)
+
+
+def in_quiet_hours(moment: datetime, start_hour: int, end_hour: int) -> bool:
+    """
+    Whether a moment falls in the local quiet period ``[start_hour, end_hour)``.
+
+    The period may wrap around midnight (e.g. 22 → 8); equal hours disable it.
+
+    Args:
+        moment: Aware datetime
+        start_hour: Local hour quiet time starts
+        end_hour: Local hour quiet time ends
+
+    Returns:
+        True if messages should be held back
+    """
+    if start_hour == end_hour:
+        return False
+    hour = timezone.localtime(moment).hour
+    if start_hour < end_hour:
+        return start_hour <= hour < end_hour
+    return hour >= start_hour or hour < end_hour
+
+
+class DigestBuilder:
+    """
+    Picks subscribers whose digest is due, claims their matches and renders the message.
+    """
+
+    def __init__(
+        self, window: Optional[timedelta] = None, max_jobs: int = MAX_JOBS_PER_DIGEST
+    ) -> None:
+        """
+        Initialize the builder.
+
+        Args:
+            window: How long matches accumulate (defaults to
+                ``JOB_ALERTS_DIGEST_WINDOW_HOURS``)
+            max_jobs: Postings listed per digest
+        """
+        self.window = window or timedelta(hours=settings.job_alerts.digest_window_hours)
+        self.max_jobs = max_jobs
+
+    def due_subscription_ids(self, now: datetime, limit: int) -> List[int]:
+        """
+        Active subscriptions whose oldest pending match is at least one window old.
+
+        Args:
+            now: Reference time
+            limit: Maximum subscriptions returned (longest waiting first)
+
+        Returns:
+            Subscription ids
+        """
+        due = (
+            JobAlertDelivery.objects.filter(status="pending", subscription__is_active=True)
+            .values("subscription_id")
+            .annotate(oldest=Min("created_at"))
+            .filter(oldest__lte=now - self.window)
+            .order_by("oldest")
+            .values_list("subscription_id", flat=True)
+        )
+        return list(due[:limit])
+
+    def claim(self, now: datetime, limit: int) -> Dict[int, List[JobAlertDelivery]]:
+        """
+        Mark the pending matches of up to ``limit`` due subscribers as being sent.
+
+        Args:
+            now: Reference time
+            limit: Maximum subscribers
+
+        Returns:
+            Claimed deliveries per subscription id, newest posting first
+        """
+        JobAlertDelivery.objects.filter(
+            status="sending", updated_at__lt=now - STALE_SENDING_AFTER
+        ).update(status="pending", updated_at=now)
+
+        subscription_ids = self.due_subscription_ids(now, limit)
+        if not subscription_ids:
+            return {}
+        with transaction.atomic():
+            ids = list(
+                JobAlertDelivery.objects.select_for_update(skip_locked=True, of=("self",))
+                .filter(status="pending", subscription_id__in=subscription_ids)
+                .values_list("id", flat=True)
+            )
+            JobAlertDelivery.objects.filter(id__in=ids).update(status="sending", updated_at=now)
+
+        grouped: Dict[int, List[JobAlertDelivery]] = defaultdict(list)
+        deliveries = JobAlertDelivery.objects.filter(id__in=ids).select_related(
+            "posting", "subscription__user", "subscription__course", "subscription__term"
+        )
+        for delivery in deliveries.order_by("-posting__created_at", "id"):
+            grouped[delivery.subscription_id].append(delivery)
+        return grouped
+
+    def render(
+        self, subscription: JobAlertSubscription, deliveries: List[JobAlertDelivery]
+    ) -> str:
+        """
+        Render one digest message.
+
+        Args:
+            subscription: Recipient's subscription
+            deliveries: Its claimed matches, newest first
+
+        Returns:
+            Message text
+        """
+        target = subscription.term.term if subscription.term else subscription.course.name
+        header = (
+            f"📬 *Resumo de vagas para {target}*\n"
+            f"{len(deliveries)} nova(s) vaga(s) desde o último resumo."
+        )
+        jobs = [
+            {"title": d.posting.title, "company": d.posting.company, "url": d.posting.url}
+            for d in deliveries[: self.max_jobs]
+        ]
+        footer = []
+        hidden = len(deliveries) - self.max_jobs
+        if hidden > 0:
+            footer.append(f"➕ E mais {hidden} vaga(s). Digite *3* para buscar.")
+        footer.append("Para parar de receber alertas, digite *4*.")
+        return format_job_message(header, jobs, footer="\n".join(footer))
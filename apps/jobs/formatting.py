@@ -0,0 +1,40 @@
+"""Formatação de vagas para mensagens do WhatsApp."""
+from typing import Any, Iterable, Mapping, Optional
+
+
+def format_job(job: Mapping[str, Any]) -> str:
+    """
+    Monta o bloco de uma vaga (título, empresa e link).
+
+    Args:
+        job: Vaga com as chaves ``title``, ``company`` e ``url``
+
+    Returns:
+        Texto da vaga
+    """
+    title = job.get("title") or "Vaga"
+    company = job.get("company") or "Empresa"
+    url = job.get("url") or "#"
+    return f"💼 *{title}*\n🏢 {company}\n🔗 {url}"
+
+
+def format_job_message(
+    header: str, jobs: Iterable[Mapping[str, Any]], footer: Optional[str] = None
+) -> str:
+    """
+    Monta a mensagem de uma lista de vagas, como a do resultado da busca.
+
+    Args:
+        header: Primeira linha (título da mensagem)
+        jobs: Vagas a listar
+        footer: Texto final opcional
+
+    Returns:
+        Texto da mensagem
+    """
+    lines = [header]
+    for job in jobs:
+        lines.append(f"\n{format_job(job)}")
+    if footer:
+        lines.append(f"\n{footer}")
+    return "\n".join(lines)
@@ -0,0 +1,130 @@
+"""
+Incremental matching of new job postings against alert subscriptions.
+
+Every subscribed search phrase (a ``SearchTerm``, or all active terms of the
+course for course-wide subscriptions) is tokenised and stored in an inverted
+index under one of its tokens. A posting is matched by looking up only the
+tokens it contains and checking the few candidate phrases found there, so
+the work grows with the number of new postings and their length, not with
+subscribers × postings.
+"""
+import re
+import unicodedata
+from collections import defaultdict
+from typing import Dict, FrozenSet, List, Optional, Set
+
+from django.db.models import QuerySet
+
+from apps.courses.models import SearchTerm
+from apps.jobs.models import JobAlertSubscription, JobPosting
+
+_WORD = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> Set[str]:
+    """
+    Split text into lowercase, accent-free word tokens.
+
+    Args:
+        text: Free text
+
+    Returns:
+        Set of tokens
+    """
+    normalized = unicodedata.normalize("NFKD", text or "")
+    stripped = "".join(c for c in normalized if not unicodedata.combining(c))
+    return set(_WORD.findall(stripped.lower()))
+
+
+def posting_tokens(posting: JobPosting) -> Set[str]:
+    """Tokens a posting can be matched on (title and description)."""
+    return tokenize(posting.title) | tokenize(posting.description)
+
+
+class SubscriptionIndex:
+    """
+    Inverted index from phrase tokens to the subscriptions interested in them.
+
+    A phrase matches a posting when all of its tokens occur in the posting.
+    Each phrase is indexed under its longest token only: a matching posting
+    must contain that token anyway, and long tokens tend to be the rarest,
+    which keeps candidate lists short.
+    """
+
+    def __init__(self) -> None:
+        self._by_token: Dict[str, List[FrozenSet[str]]] = defaultdict(list)
+        self._subscribers: Dict[FrozenSet[str], Set[int]] = defaultdict(set)
+        self._phrases: Dict[FrozenSet[str], str] = {}
+
+    def add(self, subscription_id: int, phrase: str) -> None:
+        """
+        Register a subscription's interest in a phrase.
+
+        Args:
+            subscription_id: ``JobAlertSubscription`` id
+            phrase: Search phrase
+        """
+        tokens = frozenset(tokenize(phrase))
+        if not tokens:
+            return
+        if tokens not in self._subscribers:
+            self._by_token[max(tokens, key=lambda t: (len(t), t))].append(tokens)
+            self._phrases[tokens] = phrase
+        self._subscribers[tokens].add(subscription_id)
+
+    def phrases(self) -> List[str]:
+        """Distinct subscribed phrases (one JobSpy search each)."""
+        return list(self._phrases.values())
+
+    def match_tokens(self, tokens: Set[str]) -> Set[int]:
+        """
+        Subscriptions with at least one phrase fully contained in ``tokens``.
+
+        Args:
+            tokens: Tokens of a posting
+
+        Returns:
+            Subscription ids
+        """
+        matched: Set[int] = set()
+        for token in tokens:
+            for phrase in self._by_token.get(token, ()):
+                if phrase <= tokens:
+                    matched |= self._subscribers[phrase]
+        return matched
+
+    def match(self, posting: JobPosting) -> Set[int]:
+        """Subscriptions interested in a posting."""
+        return self.match_tokens(posting_tokens(posting))
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+    @classmethod
+    def build(cls, subscriptions: Optional[QuerySet] = None) -> "SubscriptionIndex":
+        """
+        Index the active subscriptions (two queries).
+
+        Args:
+            subscriptions: ``JobAlertSubscription`` queryset (defaults to the active ones)
+
+        Returns:
+            The index
+        """
+        if subscriptions is None:
+            subscriptions = JobAlertSubscription.objects.filter(is_active=True)
+        rows = list(subscriptions.values_list("id", "course_id", "term__term"))
+
+        course_wide = {course_id for _, course_id, term in rows if term is None}
+        course_terms: Dict[int, List[str]] = defaultdict(list)
+        if course_wide:
+            for course_id, term in SearchTerm.objects.filter(
+                course_id__in=course_wide, is_default=True
+            ).values_list("course_id", "term"):
+                course_terms[course_id].append(term)
+
+        index = cls()
+        for subscription_id, course_id, term in rows:
+            for phrase in [term] if term is not None else course_terms[course_id]:
+                index.add(subscription_id, phrase)
+        return index
@@ -0,0 +1,87 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:59
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("users", "0002_userprofile_last_activity_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="JobSearchLog",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "search_term",
+                    models.CharField(help_text="Termo de busca utilizado", max_length=255),
+                ),
+                (
+                    "location",
+                    models.CharField(
+                        blank=True, help_text="Localização da busca", max_length=255, null=True
+                    ),
+                ),
+                (
+                    "job_type",
+                    models.CharField(
+                        blank=True,
+                        help_text="Tipo de vaga (estágio, CLT, etc.)",
+                        max_length=50,
+                        null=True,
+                    ),
+                ),
+                (
+                    "results_count",
+                    models.IntegerField(default=0, help_text="Número de resultados encontrados"),
+                ),
+                (
+                    "filters",
+                    models.JSONField(
+                        blank=True, default=dict, help_text="Filtros aplicados na busca"
+                    ),
+                ),
+                (
+                    "results_preview",
+                    models.JSONField(
+                        blank=True,
+                        default=list,
+                        help_text="Preview dos primeiros resultados (máx 5)",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        help_text="Usuário que realizou a busca",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="job_searches",
+                        to="users.userprofile",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Log de Busca de Vagas",
+                "verbose_name_plural": "Logs de Buscas de Vagas",
+                "ordering": ["-created_at"],
+                "indexes": [
+                    models.Index(fields=["-created_at"], name="jobs_jobsea_created_6f5265_idx"),
+                    models.Index(
+                        fields=["user", "-created_at"], name="jobs_jobsea_user_id_d2ae3b_idx"
+                    ),
+                    models.Index(fields=["search_term"], name="jobs_jobsea_search__1e205c_idx"),
+                ],
+            },
+        ),
+    ]
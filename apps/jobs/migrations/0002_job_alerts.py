@@ -0,0 +1,168 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:04
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0001_initial"),
+        ("jobs", "0001_initial"),
+        ("users", "0002_userprofile_last_activity_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="JobAlertSubscription",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("is_active", models.BooleanField(default=True)),
+                (
+                    "course",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="job_alerts",
+                        to="courses.course",
+                    ),
+                ),
+                (
+                    "term",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="job_alerts",
+                        to="courses.searchterm",
+                    ),
+                ),
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="job_alert",
+                        to="users.userprofile",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Alerta de Vagas",
+                "verbose_name_plural": "Alertas de Vagas",
+            },
+        ),
+        migrations.CreateModel(
+            name="JobPosting",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "fingerprint",
+                    models.CharField(
+                        help_text="Hash de url/título/empresa usado para deduplicar",
+                        max_length=64,
+                        unique=True,
+                    ),
+                ),
+                ("title", models.CharField(max_length=255)),
+                ("company", models.CharField(blank=True, default="", max_length=255)),
+                ("location", models.CharField(blank=True, default="", max_length=255)),
+                ("url", models.URLField(blank=True, default="", max_length=1000)),
+                ("description", models.TextField(blank=True, default="")),
+                (
+                    "source_term",
+                    models.CharField(
+                        blank=True,
+                        default="",
+                        help_text="Termo de busca que trouxe a vaga",
+                        max_length=255,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Vaga",
+                "verbose_name_plural": "Vagas",
+                "ordering": ["-created_at"],
+                "indexes": [
+                    models.Index(fields=["-created_at"], name="jobs_jobpos_created_ba4c9f_idx")
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="JobAlertDelivery",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pendente"),
+                            ("sending", "Enviando"),
+                            ("sent", "Enviada"),
+                            ("failed", "Falhou"),
+                        ],
+                        default="pending",
+                        max_length=10,
+                    ),
+                ),
+                ("sent_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "subscription",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="deliveries",
+                        to="jobs.jobalertsubscription",
+                    ),
+                ),
+                (
+                    "posting",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="deliveries",
+                        to="jobs.jobposting",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Envio de Alerta",
+                "verbose_name_plural": "Envios de Alertas",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="jobalertsubscription",
+            index=models.Index(
+                fields=["is_active", "course"], name="jobs_jobale_is_acti_b7c8d5_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="jobalertdelivery",
+            index=models.Index(
+                fields=["status", "subscription"], name="jobs_jobale_status_cedfc7_idx"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="jobalertdelivery",
+            constraint=models.UniqueConstraint(
+                fields=("subscription", "posting"), name="jobs_delivery_unique_posting"
+            ),
+        ),
+    ]
@@ -1,5 +1,6 @@
 from django.db import models
 from apps.core.models import TimeStampedModel
+from apps.courses.models import Course, SearchTerm
 from apps.users.models import UserProfile
 
 
@@ -56,3 +57,115 @@ class JobSearchLog(TimeStampedModel):
     
     def __str__(self):
         return f"{self.user.phone_number}: {self.search_term} ({self.results_count} resultados)"
+
+
+class JobPosting(TimeStampedModel):
+    """
+    Vaga coletada pelo JobSpy, guardada uma única vez para os alertas.
+    """
+    fingerprint = models.CharField(
+        max_length=64,
+        unique=True,
+        help_text="Hash de url/título/empresa usado para deduplicar"
+    )
+    title = models.CharField(max_length=255)
+    company = models.CharField(max_length=255, blank=True, default="")
+    location = models.CharField(max_length=255, blank=True, default="")
+    url = models.URLField(max_length=1000, blank=True, default="")
+    description = models.TextField(blank=True, default="")
+    source_term = models.CharField(
+        max_length=255,
+        blank=True,
+        default="",
+        help_text="Termo de busca que trouxe a vaga"
+    )
+
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = 'Vaga'
+        verbose_name_plural = 'Vagas'
+        indexes = [
+            models.Index(fields=['-created_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.title} ({self.company})"
+
+
+class JobAlertSubscription(TimeStampedModel):
+    """
+    Inscrição de um usuário para receber novas vagas do seu curso/termo.
+
+    Sem ``term`` o usuário recebe vagas de todos os termos ativos do curso.
+    """
+    user = models.OneToOneField(
+        UserProfile,
+        on_delete=models.CASCADE,
+        related_name='job_alert',
+    )
+    course = models.ForeignKey(
+        Course,
+        on_delete=models.CASCADE,
+        related_name='job_alerts',
+    )
+    term = models.ForeignKey(
+        SearchTerm,
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+        related_name='job_alerts',
+    )
+    is_active = models.BooleanField(default=True)
+
+    class Meta:
+        verbose_name = 'Alerta de Vagas'
+        verbose_name_plural = 'Alertas de Vagas'
+        indexes = [
+            models.Index(fields=['is_active', 'course']),
+        ]
+
+    def __str__(self):
+        alvo = self.term.term if self.term else self.course.name
+        return f"{self.user.phone_number} → {alvo}"
+
+
+class JobAlertDelivery(TimeStampedModel):
+    """
+    Vaga casada com uma inscrição, aguardando (ou já enviada pelo) envio em massa.
+
+    A unicidade de (inscrição, vaga) garante que ninguém recebe a mesma vaga duas vezes.
+    """
+    STATUS_CHOICES = (
+        ('pending', 'Pendente'),
+        ('sending', 'Enviando'),
+        ('sent', 'Enviada'),
+        ('failed', 'Falhou'),
+    )
+
+    subscription = models.ForeignKey(
+        JobAlertSubscription,
+        on_delete=models.CASCADE,
+        related_name='deliveries',
+    )
+    posting = models.ForeignKey(
+        JobPosting,
+        on_delete=models.CASCADE,
+        related_name='deliveries',
+    )
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='pending')
+    sent_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        verbose_name = 'Envio de Alerta'
+        verbose_name_plural = 'Envios de Alertas'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['subscription', 'posting'], name='jobs_delivery_unique_posting'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['status', 'subscription']),
+        ]
+
+    def __str__(self):
+        return f"{self.subscription_id}:{self.posting_id} ({self.status})"
@@ -0,0 +1,28 @@
+"""Background tasks for the jobs app."""
+from celery import shared_task
+from django.core.cache import cache
+
+from apps.jobs.alerts import JobAlertSender, collect_postings
+from config.env import settings
+
+# Only one sender runs at a time, so the WAHA rate limit holds across workers
+SENDER_LOCK_KEY = "capyvagas:job-alerts:sender-lock"
+
+
+@shared_task(ignore_result=True)
+def collect_job_postings() -> None:
+    """Search new postings for the subscribed terms and queue them for the digests (run by Celery beat)."""
+    collect_postings()
+
+
+@shared_task(ignore_result=True)
+def send_job_alerts() -> None:
+    """Send one paced batch of due job alert digests (run by Celery beat)."""
+    alerts = settings.job_alerts
+    lock_ttl = int(alerts.send_batch_size / alerts.send_rate_per_second) + 60
+    if not cache.add(SENDER_LOCK_KEY, 1, timeout=lock_ttl):
+        return
+    try:
+        JobAlertSender().send_digests()
+    finally:
+        cache.delete(SENDER_LOCK_KEY)
@@ -0,0 +1,221 @@
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.bot.models import InteractionLog
+from apps.bot.services import BotService
+from apps.courses.models import Course, SearchTerm
+from apps.jobs.alerts import JobAlertSender, collect_postings, ingest_postings
+from apps.jobs.digest import DigestBuilder, in_quiet_hours
+from apps.jobs.matching import SubscriptionIndex, tokenize
+from apps.jobs.models import JobAlertDelivery, JobAlertSubscription, JobPosting
+from apps.users.models import UserProfile
+from infra.waha.bulk import BulkSender, TokenBucket
+
+
+def _job(title, company="ACME", url=None):
+    return {"title": title, "company": company, "url": url or f"https://example.com/{title}"}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class SubscriptionIndexTests(TestCase):
+    def test_tokenize_strips_accents_and_case(self):
+        self.assertEqual(tokenize("Estágio em Automação!"), {"estagio", "em", "automacao"})
+
+    def test_phrase_matches_only_when_all_tokens_present(self):
+        index = SubscriptionIndex()
+        index.add(1, "Estágio Python")
+        index.add(2, "python")
+        index.add(3, "Java")
+
+        self.assertEqual(index.match_tokens(tokenize("Estagio em Python e Django")), {1, 2})
+        self.assertEqual(index.match_tokens(tokenize("Desenvolvedor Python")), {2})
+        self.assertEqual(index.match_tokens(tokenize("Analista de dados")), set())
+
+    def test_build_expands_course_wide_subscriptions(self):
+        course = Course.objects.create(name="Engenharia de Software")
+        python = SearchTerm.objects.create(course=course, term="Python")
+        SearchTerm.objects.create(course=course, term="Django")
+        SearchTerm.objects.create(course=course, term="Inativo", is_default=False)
+        alice = UserProfile.objects.create(phone_number="alice@c.us")
+        bob = UserProfile.objects.create(phone_number="bob@c.us")
+        by_term = JobAlertSubscription.objects.create(user=alice, course=course, term=python)
+        course_wide = JobAlertSubscription.objects.create(user=bob, course=course)
+
+        with self.assertNumQueries(2):
+            index = SubscriptionIndex.build()
+
+        self.assertEqual(sorted(index.phrases()), ["Django", "Python"])
+        self.assertEqual(index.match_tokens({"python"}), {by_term.pk, course_wide.pk})
+        self.assertEqual(index.match_tokens({"django"}), {course_wide.pk})
+        self.assertEqual(index.match_tokens({"inativo"}), set())
+
+
+class CollectPostingsTests(TestCase):
+    def setUp(self):
+        self.course = Course.objects.create(name="Engenharia de Software")
+        self.term = SearchTerm.objects.create(course=self.course, term="Python")
+        self.user = UserProfile.objects.create(phone_number="alice@c.us")
+        self.subscription = JobAlertSubscription.objects.create(
+            user=self.user, course=self.course, term=self.term
+        )
+        self.job_service = MagicMock()
+
+    def test_ingest_skips_known_postings(self):
+        self.assertEqual(len(ingest_postings([_job("Dev Python"), _job("Dev Python")])), 1)
+        self.assertEqual(ingest_postings([_job("Dev Python")]), [])
+        self.assertEqual(JobPosting.objects.count(), 1)
+
+    def test_new_matching_postings_are_queued_once(self):
+        self.job_service.search.return_value = [_job("Estágio Python"), _job("Vaga Java")]
+
+        self.assertEqual(collect_postings(self.job_service), 1)
+        self.assertEqual(collect_postings(self.job_service), 0)
+
+        self.job_service.search.assert_called_with(["Python"], limit=20)
+        delivery = JobAlertDelivery.objects.get()
+        self.assertEqual(delivery.subscription, self.subscription)
+        self.assertEqual(delivery.posting.title, "Estágio Python")
+
+    def test_inactive_subscriptions_are_not_searched(self):
+        self.subscription.is_active = False
+        self.subscription.save()
+
+        self.assertEqual(collect_postings(self.job_service), 0)
+        self.job_service.search.assert_not_called()
+
+
+class JobAlertSenderTests(TestCase):
+    def setUp(self):
+        course = Course.objects.create(name="Engenharia de Software")
+        term = SearchTerm.objects.create(course=course, term="Python")
+        self.users = [UserProfile.objects.create(phone_number=f"55{i}@c.us") for i in range(2)]
+        for user in self.users:
+            JobAlertSubscription.objects.create(user=user, course=course, term=term)
+        job_service = MagicMock()
+        job_service.search.return_value = [_job(f"Dev Python {i}") for i in range(12)]
+        collect_postings(job_service)
+        # Midday, more than one 24h window after the matches were queued
+        self.later = timezone.localtime(timezone.now() + timedelta(days=2)).replace(hour=12)
+
+        self.clock = FakeClock()
+        self.waha = MagicMock()
+        self.waha.settings = MagicMock(session_name="test-session")
+        self.waha.send_message.return_value = True
+        bucket = TokenBucket(rate=2, clock=self.clock, sleep=self.clock.sleep)
+        self.sender = JobAlertSender(BulkSender(self.waha, 2, bucket=bucket))
+
+    def test_one_paced_digest_per_subscriber(self):
+        with patch("apps.jobs.alerts.get_interaction_counters"):
+            self.assertEqual(self.sender.send_digests(now=self.later), 2)
+
+        self.assertEqual(self.waha.send_message.call_count, 2)
+        self.assertEqual(self.clock.sleeps, [0.5])
+        chat_id, text = self.waha.send_message.call_args_list[0][0]
+        self.assertEqual(chat_id, self.users[0].phone_number)
+        self.assertIn("Resumo de vagas para Python", text)
+        self.assertIn("12 nova(s) vaga(s)", text)
+        self.assertEqual(text.count("💼"), 10)
+        self.assertIn("E mais 2 vaga(s)", text)
+        self.assertFalse(JobAlertDelivery.objects.exclude(status="sent").exists())
+        self.assertEqual(InteractionLog.objects.filter(message_type="SENT").count(), 2)
+
+        self.assertEqual(self.sender.send_digests(now=self.later), 0)
+
+    def test_matches_wait_for_the_window(self):
+        soon = timezone.now() + timedelta(hours=1)
+
+        self.assertEqual(DigestBuilder(window=timedelta(hours=24)).due_subscription_ids(soon, 10), [])
+        self.assertEqual(
+            len(DigestBuilder(window=timedelta(minutes=30)).due_subscription_ids(soon, 10)), 2
+        )
+
+    def test_nothing_is_sent_in_quiet_hours(self):
+        night = self.later.replace(hour=23)
+
+        self.assertEqual(self.sender.send_digests(now=night), 0)
+
+        self.waha.send_message.assert_not_called()
+        self.assertEqual(JobAlertDelivery.objects.filter(status="pending").count(), 24)
+
+    def test_batch_size_limits_subscribers_per_run(self):
+        with patch("apps.jobs.alerts.get_interaction_counters"):
+            self.assertEqual(self.sender.send_digests(now=self.later, max_subscriptions=1), 1)
+            self.assertEqual(self.sender.send_digests(now=self.later, max_subscriptions=1), 1)
+
+        recipients = [c[0][0] for c in self.waha.send_message.call_args_list]
+        self.assertEqual(recipients, [u.phone_number for u in self.users])
+
+    def test_rejected_messages_are_marked_failed(self):
+        self.waha.send_message.return_value = False
+
+        with patch("apps.jobs.alerts.get_interaction_counters"):
+            self.assertEqual(self.sender.send_digests(now=self.later), 0)
+
+        self.assertEqual(JobAlertDelivery.objects.filter(status="failed").count(), 24)
+        self.assertFalse(InteractionLog.objects.exists())
+
+
+class QuietHoursTests(TestCase):
+    def test_quiet_period_may_wrap_midnight(self):
+        def at(hour):
+            return timezone.localtime().replace(hour=hour, minute=30)
+
+        self.assertTrue(in_quiet_hours(at(23), 22, 8))
+        self.assertTrue(in_quiet_hours(at(3), 22, 8))
+        self.assertFalse(in_quiet_hours(at(8), 22, 8))
+        self.assertTrue(in_quiet_hours(at(13), 12, 14))
+        self.assertFalse(in_quiet_hours(at(14), 12, 14))
+        self.assertFalse(in_quiet_hours(at(23), 0, 0))
+
+
+class TokenBucketTests(TestCase):
+    def test_waits_for_refill_after_burst(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=4, burst=2, clock=clock, sleep=clock.sleep)
+
+        waits = [bucket.acquire() for _ in range(4)]
+
+        self.assertEqual(waits, [0.0, 0.0, 0.25, 0.25])
+
+
+class JobAlertMenuTests(TestCase):
+    def setUp(self):
+        self.waha_client = MagicMock()
+        self.waha_client.settings = MagicMock(session_name="test-session")
+        self.service = BotService(waha_client=self.waha_client)
+        course = Course.objects.create(name="Engenharia de Software")
+        self.user = UserProfile.objects.create(
+            phone_number="5511999999999@c.us", is_authenticated_utfpr=True, selected_course=course
+        )
+
+    def _send(self, text):
+        self.service.process_message(self.user.phone_number, text, from_me=False)
+        return self.waha_client.send_message.call_args[0][1]
+
+    def test_option_four_toggles_subscription(self):
+        self.assertIn("Alertas ativados para *Engenharia de Software*", self._send("4"))
+        self.assertTrue(JobAlertSubscription.objects.get(user=self.user).is_active)
+
+        self.assertIn("desativados", self._send("4"))
+        self.assertFalse(JobAlertSubscription.objects.get(user=self.user).is_active)
+
+    def test_logout_disables_alerts(self):
+        self._send("4")
+        self._send("logout")
+
+        self.assertFalse(JobAlertSubscription.objects.get(user=self.user).is_active)
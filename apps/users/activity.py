@@ -0,0 +1,131 @@
+"""
+Coalesced ``UserProfile.last_activity`` updates.
+
+Handling a message used to rewrite ``last_activity`` on every save. Now each
+message only sets ``user_id → timestamp`` in a Redis hash, so any number of
+messages from one user between flushes collapse into one field. A periodic
+task renames the hash out of the way and writes all collected timestamps
+with one ``UPDATE ... CASE`` per batch, never moving a value backwards.
+If Redis is unreachable, ``touch`` falls back to a single-column UPDATE.
+"""
+import time
+from datetime import datetime, timezone as dt_timezone
+from typing import Callable, Dict, Optional
+
+import structlog
+from django.db.models import Case, F, Q, Value, When
+from django.utils import timezone
+
+from apps.users.models import UserProfile
+from infra.redis import get_redis_client
+
+logger = structlog.get_logger(__name__)
+
+
+class ActivityTracker:
+    """
+    Buffers last-seen timestamps in Redis and flushes them in bulk.
+    """
+
+    PENDING_KEY = "capyvagas:activity:pending"
+    FLUSHING_KEY = "capyvagas:activity:flushing"
+    # How long to write straight to the database after a Redis error
+    FALLBACK_SECONDS = 30
+
+    def __init__(
+        self,
+        client=None,
+        batch_size: int = 500,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize the tracker.
+
+        Args:
+            client: Redis client (optional, defaults to the shared client)
+            batch_size: Users written per UPDATE statement on flush
+            clock: Time source in seconds
+        """
+        self.client = client if client is not None else get_redis_client()
+        self.batch_size = batch_size
+        self.clock = clock
+        self._redis_retry_at = 0.0
+
+    def touch(self, user_id: int, when: Optional[datetime] = None) -> None:
+        """
+        Record that a user was active.
+
+        Args:
+            user_id: ``UserProfile`` id
+            when: Activity time (defaults to now)
+        """
+        when = when or timezone.now()
+        now = self.clock()
+        if self.client is not None and now >= self._redis_retry_at:
+            try:
+                self.client.hset(self.PENDING_KEY, user_id, when.timestamp())
+                return
+            except Exception as e:
+                self._redis_retry_at = now + self.FALLBACK_SECONDS
+                logger.warning("activity_buffer_unavailable", error=str(e))
+        UserProfile.objects.filter(pk=user_id, last_activity__lt=when).update(last_activity=when)
+
+    def _write(self, seen: Dict[int, datetime]) -> int:
+        user_ids = sorted(seen)
+        updated = 0
+        for start in range(0, len(user_ids), self.batch_size):
+            chunk = user_ids[start : start + self.batch_size]
+            whens = [
+                When(Q(pk=user_id, last_activity__lt=seen[user_id]), then=Value(seen[user_id]))
+                for user_id in chunk
+            ]
+            updated += UserProfile.objects.filter(pk__in=chunk).update(
+                last_activity=Case(*whens, default=F("last_activity"))
+            )
+        return updated
+
+    def flush(self) -> int:
+        """
+        Write buffered timestamps to the database.
+
+        A batch left behind by a failed flush is written before new activity.
+
+        Returns:
+            Number of users whose row was written
+        """
+        if self.client is None:
+            return 0
+        try:
+            if not self.client.exists(self.FLUSHING_KEY):
+                if not self.client.exists(self.PENDING_KEY):
+                    return 0
+                self.client.rename(self.PENDING_KEY, self.FLUSHING_KEY)
+            raw = self.client.hgetall(self.FLUSHING_KEY)
+        except Exception as e:
+            logger.warning("activity_buffer_unavailable", error=str(e))
+            return 0
+
+        seen = {
+            int(user_id): datetime.fromtimestamp(float(ts), tz=dt_timezone.utc)
+            for user_id, ts in raw.items()
+        }
+        updated = self._write(seen)
+        try:
+            self.client.delete(self.FLUSHING_KEY)
+        except Exception as e:
+            # Rewriting the same timestamps next time is harmless
+            logger.warning("activity_buffer_unavailable", error=str(e))
+        logger.info("user_activity_flushed", users=len(seen), updated=updated)
+        return updated
+
+
+# Global instance
+_tracker: Optional[ActivityTracker] = None
+
+
+def get_activity_tracker() -> ActivityTracker:
+    """Get or create the per-process activity tracker."""
+    global _tracker
+    if _tracker is None:
+        _tracker = ActivityTracker()
+    return _tracker
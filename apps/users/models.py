@@ -1,9 +1,10 @@
 from django.db import models
-from apps.core.models import TimeStampedModel
+from django.utils import timezone
+from apps.core.models import DirtyFieldsMixin, TimeStampedModel
 from apps.courses.models import Course, SearchTerm
 from infra.security.fields import EncryptedCharField
 
-class UserProfile(TimeStampedModel):
+class UserProfile(DirtyFieldsMixin, TimeStampedModel):
     """
     Representa um usuário do sistema, vinculado ao número de telefone (WAHA ID).
     Armazena credenciais da UTFPR (criptografadas idealmente, aqui simplificado para MVP).
@@ -12,7 +13,8 @@ class UserProfile(TimeStampedModel):
     ra = models.CharField(max_length=20, blank=True, null=True, help_text="Registro Acadêmico")
     utfpr_password = EncryptedCharField(max_length=512, blank=True, null=True, help_text="Senha do Portal (criptografada)")
     is_authenticated_utfpr = models.BooleanField(default=False)
-    last_activity = models.DateTimeField(auto_now=True)
+    # Atualizado em lote pelo ActivityTracker (apps.users.activity), não a cada save
+    last_activity = models.DateTimeField(default=timezone.now)
     current_action = models.CharField(
         max_length=50,
         blank=True,
@@ -35,5 +37,11 @@ class UserProfile(TimeStampedModel):
     )
     flow_data = models.JSONField(default=dict, blank=True, help_text="Dados temporários do fluxo conversacional")
 
+    class Meta:
+        indexes = [
+            # Paginação por cursor em (last_activity, id) no dashboard
+            models.Index(fields=['-last_activity', '-id'], name='users_last_activity_id_idx'),
+        ]
+
     def __str__(self):
         return f"{self.phone_number} ({self.ra if self.ra else 'Sem RA'})"
@@ -1,5 +1,7 @@
 import logging
+
 from apps.users.models import UserProfile
+from infra.utfpr.portal import get_portal_authenticator
 
 logger = logging.getLogger(__name__)
 
@@ -8,36 +10,36 @@ class UTFPRAuthService:
     Serviço para autenticação no portal da UTFPR.
     """
 
+    def __init__(self, authenticator=None):
+        self.authenticator = authenticator or get_portal_authenticator()
+
     def authenticate(self, ra, password):
         """
         Autentica o usuário no portal do aluno.
         Retorna True se sucesso, False caso contrário.
+
+        Levanta ``PortalUnavailableError`` se o portal não responder, para que
+        quem chamou possa tentar de novo em vez de recusar a senha.
         """
         logger.info(f"Tentando autenticar RA: {ra}")
-        
-        # TODO: Implementar scraping real ou integração com API se houver
-        # Por enquanto, retorna True para qualquer RA que não seja '000000'
-        
-        if ra == '000000':
-            return False
-            
-        return True
+        return self.authenticator.login(ra, password).ok
 
     def link_user(self, phone_number, ra, password):
         """
-        Vincula um RA a um número de telefone após autenticação bem sucedida.
+        Vincula um RA a um número de telefone.
+
+        Não valida as credenciais: deve ser chamado só depois de
+        ``authenticate`` ter retornado True.
         """
-        if self.authenticate(ra, password):
-            user, created = UserProfile.objects.update_or_create(
-                phone_number=phone_number,
-                defaults={
-                    'ra': ra,
-                    'utfpr_password': password, # TODO: Encrypt this!
-                    'is_authenticated_utfpr': True
-                }
-            )
-            return user
-        return None
+        user, created = UserProfile.objects.update_or_create(
+            phone_number=phone_number,
+            defaults={
+                'ra': ra,
+                'utfpr_password': password,
+                'is_authenticated_utfpr': True
+            }
+        )
+        return user
 
     def logout(self, phone_number):
         """
@@ -45,9 +47,11 @@ class UTFPRAuthService:
         """
         try:
             user = UserProfile.objects.get(phone_number=phone_number)
+            if user.ra:
+                self.authenticator.forget(user.ra)
             user.is_authenticated_utfpr = False
             user.utfpr_password = None
-            user.save()
+            user.save(update_fields=['is_authenticated_utfpr', 'utfpr_password', 'updated_at'])
             return True
         except UserProfile.DoesNotExist:
             return False
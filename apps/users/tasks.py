@@ -0,0 +1,10 @@
+"""Background tasks for the users app."""
+from celery import shared_task
+
+from apps.users.activity import get_activity_tracker
+
+
+@shared_task(ignore_result=True)
+def flush_user_activity() -> None:
+    """Write the buffered last-activity timestamps to the database (run by Celery beat)."""
+    get_activity_tracker().flush()
@@ -0,0 +1,131 @@
+from datetime import timedelta
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.users.activity import ActivityTracker
+from apps.users.models import UserProfile
+
+
+class FakeRedis:
+    """Just the hash commands the tracker uses."""
+
+    def __init__(self):
+        self.data = {}
+
+    def hset(self, key, field, value):
+        self.data.setdefault(key, {})[str(field).encode()] = str(value).encode()
+
+    def hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    def exists(self, key):
+        return int(key in self.data)
+
+    def rename(self, src, dst):
+        self.data[dst] = self.data.pop(src)
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+
+class UnavailableRedis:
+    def hset(self, *args):
+        raise ConnectionError("down")
+
+
+class ActivityTrackerTests(TestCase):
+    def setUp(self):
+        self.old = timezone.now() - timedelta(days=1)
+        self.alice = UserProfile.objects.create(phone_number="1@c.us", last_activity=self.old)
+        self.bob = UserProfile.objects.create(phone_number="2@c.us", last_activity=self.old)
+        self.redis = FakeRedis()
+        self.tracker = ActivityTracker(client=self.redis)
+
+    def test_touches_are_coalesced_and_flushed_in_one_update(self):
+        now = timezone.now()
+        for seconds in range(5):
+            self.tracker.touch(self.alice.id, now - timedelta(seconds=5 - seconds))
+        self.tracker.touch(self.alice.id, now)
+        self.tracker.touch(self.bob.id, now)
+
+        with self.assertNumQueries(0):
+            self.tracker.touch(self.bob.id, now)
+        with self.assertNumQueries(1):
+            self.assertEqual(self.tracker.flush(), 2)
+
+        self.alice.refresh_from_db()
+        self.assertAlmostEqual(self.alice.last_activity, now, delta=timedelta(milliseconds=1))
+        self.assertEqual(self.redis.data, {})
+        self.assertEqual(self.tracker.flush(), 0)
+
+    def test_flush_never_moves_activity_backwards(self):
+        newer = timezone.now()
+        UserProfile.objects.filter(pk=self.alice.pk).update(last_activity=newer)
+        self.tracker.touch(self.alice.id, newer - timedelta(minutes=5))
+
+        self.tracker.flush()
+
+        self.alice.refresh_from_db()
+        self.assertEqual(self.alice.last_activity, newer)
+
+    def test_batch_left_by_failed_flush_is_written_first(self):
+        self.tracker.touch(self.alice.id)
+        self.redis.rename(ActivityTracker.PENDING_KEY, ActivityTracker.FLUSHING_KEY)
+        self.tracker.touch(self.bob.id)
+
+        self.tracker.flush()
+
+        self.alice.refresh_from_db()
+        self.bob.refresh_from_db()
+        self.assertGreater(self.alice.last_activity, self.old)
+        self.assertEqual(self.bob.last_activity, self.old)
+        self.assertIn(ActivityTracker.PENDING_KEY, self.redis.data)
+
+    def test_falls_back_to_direct_update_without_redis(self):
+        tracker = ActivityTracker(client=UnavailableRedis())
+
+        tracker.touch(self.alice.id)
+
+        self.alice.refresh_from_db()
+        self.assertGreater(self.alice.last_activity, self.old)
+
+
+class DirtyFieldsTests(TestCase):
+    def setUp(self):
+        UserProfile.objects.create(phone_number="1@c.us", ra="a1", utfpr_password="secret")
+        self.user = UserProfile.objects.get(phone_number="1@c.us")
+
+    def test_save_writes_only_changed_columns(self):
+        self.user.current_action = "login_step_ra"
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.user.save()
+
+        sql = ctx.captured_queries[0]["sql"]
+        self.assertIn('"current_action"', sql)
+        self.assertIn('"updated_at"', sql)
+        self.assertNotIn('"utfpr_password"', sql)
+        self.assertNotIn('"last_activity"', sql)
+
+    def test_unchanged_save_is_skipped(self):
+        with self.assertNumQueries(0):
+            self.user.save()
+
+    def test_mutated_json_field_is_dirty(self):
+        self.user.flow_data["temp_ra"] = "a1"
+
+        self.assertEqual(self.user.get_dirty_fields(), ["flow_data"])
+        self.user.save()
+        self.assertEqual(self.user.get_dirty_fields(), [])
+        self.assertEqual(UserProfile.objects.get().flow_data, {"temp_ra": "a1"})
+
+    def test_fields_left_out_of_update_fields_stay_dirty(self):
+        self.user.current_action = "x"
+        self.user.ra = "a2"
+
+        self.user.save(update_fields=["current_action"])
+
+        self.assertEqual(self.user.get_dirty_fields(), ["ra"])
@@ -0,0 +1,111 @@
+from unittest.mock import MagicMock, patch
+
+import requests
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from apps.core.testing import LOCMEM_CACHE
+from apps.users.models import UserProfile
+from apps.users.services import UTFPRAuthService
+from config.env import PortalSettings
+from infra.utfpr.portal import PortalAuthenticator, PortalUnavailableError
+
+LOGIN_FORM = """
+<form method="post">
+  <input type="hidden" name="csrf" value="abc123">
+  <input type="text" name="username">
+  <input type="password" name="password">
+</form>
+"""
+
+
+def _response(status_code=200, text=""):
+    return MagicMock(status_code=status_code, text=text)
+
+
+def _portal_settings(login_url="https://portal.example/login"):
+    portal = PortalSettings()
+    portal.login_url = login_url
+    return portal
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class PortalAuthenticatorTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.authenticator = PortalAuthenticator(_portal_settings())
+        self.session = MagicMock()
+        self.session.cookies = requests.cookies.RequestsCookieJar()
+        self.session.cookies.set("JSESSIONID", "s1")
+        patcher = patch.object(self.authenticator, "_new_session", return_value=self.session)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_posts_credentials_with_hidden_form_fields(self):
+        self.session.get.return_value = _response(text=LOGIN_FORM)
+        self.session.post.return_value = _response(text="<h1>Bem-vindo</h1>")
+
+        result = self.authenticator.login("a1234567", "secret")
+
+        self.assertTrue(result.ok)
+        self.assertEqual(result.cookies, {"JSESSIONID": "s1"})
+        data = self.session.post.call_args.kwargs["data"]
+        self.assertEqual(data, {"csrf": "abc123", "username": "a1234567", "password": "secret"})
+
+    def test_rejects_when_portal_renders_the_form_again(self):
+        self.session.get.return_value = _response(text=LOGIN_FORM)
+        self.session.post.return_value = _response(text=LOGIN_FORM)
+
+        self.assertFalse(self.authenticator.login("a1234567", "wrong").ok)
+        self.assertIsNone(self.authenticator.cached_session("a1234567"))
+
+    def test_repeated_login_reuses_cached_session(self):
+        self.session.get.return_value = _response(text=LOGIN_FORM)
+        self.session.post.return_value = _response(text="ok")
+        self.authenticator.login("a1234567", "secret")
+
+        again = self.authenticator.login("a1234567", "secret")
+
+        self.assertTrue(again.reused)
+        self.assertEqual(self.session.post.call_count, 1)
+
+        # A different password is checked on the portal again
+        self.session.post.return_value = _response(text=LOGIN_FORM)
+        self.assertFalse(self.authenticator.login("a1234567", "other").ok)
+        self.assertEqual(self.session.post.call_count, 2)
+
+    def test_network_errors_and_server_errors_raise_unavailable(self):
+        self.session.get.side_effect = requests.ConnectionError("down")
+        with self.assertRaises(PortalUnavailableError):
+            self.authenticator.login("a1234567", "secret")
+
+        self.session.get.side_effect = None
+        self.session.get.return_value = _response(status_code=503)
+        with self.assertRaises(PortalUnavailableError):
+            self.authenticator.login("a1234567", "secret")
+
+    def test_without_portal_url_accepts_any_ra_but_the_test_one(self):
+        authenticator = PortalAuthenticator(_portal_settings(login_url=""))
+
+        self.assertTrue(authenticator.login("a1234567", "x").ok)
+        self.assertFalse(authenticator.login("000000", "x").ok)
+
+
+class UTFPRAuthServiceTests(TestCase):
+    def test_link_user_does_not_verify_again(self):
+        authenticator = MagicMock()
+        service = UTFPRAuthService(authenticator=authenticator)
+
+        user = service.link_user("5511900000000@c.us", "a1234567", "secret")
+
+        authenticator.login.assert_not_called()
+        self.assertTrue(user.is_authenticated_utfpr)
+        self.assertEqual(UserProfile.objects.get(pk=user.pk).utfpr_password, "secret")
+
+    def test_logout_forgets_portal_session(self):
+        authenticator = MagicMock()
+        UserProfile.objects.create(phone_number="5511900000000@c.us", ra="a1234567")
+
+        UTFPRAuthService(authenticator=authenticator).logout("5511900000000@c.us")
+
+        authenticator.forget.assert_called_once_with("a1234567")
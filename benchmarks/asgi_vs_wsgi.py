@@ -0,0 +1,140 @@
+"""
+Compare webhook throughput under WSGI (gunicorn sync) and ASGI (gunicorn + uvicorn).
+
+Both servers get the same CPU budget: one worker process, pinned to the same
+core(s) with ``taskset`` when it is available. WAHA is replaced by
+``benchmarks.fake_waha`` with an artificial latency, so the numbers show how
+many webhooks each server model keeps in flight while waiting on I/O.
+
+SQLite is used by default; pass ``--database-url`` pointing at Postgres for
+representative numbers (SQLite serializes writers).
+
+Usage:
+    python -m benchmarks.asgi_vs_wsgi --requests 2000 --concurrency 200 --waha-latency-ms 150
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from benchmarks.common import free_port, latency_summary, wait_for_port
+from benchmarks.fake_waha import FakeWahaServer
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+SERVERS = {
+    "wsgi": ["gunicorn", "waha_bot.wsgi:application", "--workers", "1"],
+    "asgi": [
+        "gunicorn",
+        "waha_bot.asgi:application",
+        "--workers",
+        "1",
+        "--worker-class",
+        "uvicorn_worker.UvicornWorker",
+    ],
+}
+
+
+def _post_webhook(url: str, index: int) -> tuple[float, bool]:
+    body = json.dumps(
+        {
+            "event": "message.any",
+            "payload": {
+                "id": f"bench_{uuid.uuid4().hex}",
+                "from": f"55419{index:08d}@c.us",
+                "body": "menu",
+                "fromMe": False,
+            },
+        }
+    ).encode()
+    request = urllib.request.Request(url, data=body, headers={"Content-Type": "application/json"})
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=60) as response:
+            ok = response.status == 200
+    except Exception:
+        ok = False
+    return (time.perf_counter() - start) * 1000, ok
+
+
+def run_load(url: str, total: int, concurrency: int) -> dict:
+    """Fire ``total`` webhook deliveries with ``concurrency`` in flight."""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(lambda i: _post_webhook(url, i), range(total)))
+    elapsed = time.perf_counter() - start
+
+    summary = latency_summary([latency for latency, ok in results if ok], elapsed)
+    summary["errors"] = sum(1 for _, ok in results if not ok)
+    return summary
+
+
+def _server_command(mode: str, port: int, cpus: str) -> list[str]:
+    command = SERVERS[mode] + ["--bind", f"127.0.0.1:{port}", "--log-level", "warning"]
+    if cpus and shutil.which("taskset"):
+        command = ["taskset", "-c", cpus] + command
+    return command
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--waha-latency-ms", type=float, default=100.0)
+    parser.add_argument("--cpus", default="0", help="CPU list given to taskset for each server")
+    parser.add_argument("--database-url", default="")
+    parser.add_argument("--modes", default="wsgi,asgi")
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="capyvagas-bench-"))
+    results = {}
+    with FakeWahaServer(latency_ms=args.waha_latency_ms) as waha:
+        env = {
+            **os.environ,
+            "DEBUG": "True",
+            "ALLOWED_HOSTS": "*",
+            "DATABASE_URL": args.database_url or f"sqlite:///{workdir / 'bench.sqlite3'}",
+            "REDIS_URL": os.environ.get("REDIS_URL", ""),
+            "WAHA_URL": waha.url,
+            "WEBHOOK_DEBUG_SAMPLE_RATE": "0",
+        }
+        subprocess.run(
+            [sys.executable, "manage.py", "migrate", "--noinput"],
+            cwd=BASE_DIR,
+            env=env,
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+
+        for mode in args.modes.split(","):
+            port = free_port()
+            server = subprocess.Popen(
+                _server_command(mode, port, args.cpus),
+                cwd=BASE_DIR,
+                env=env,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            try:
+                wait_for_port(port)
+                results[mode] = run_load(
+                    f"http://127.0.0.1:{port}/webhook/", args.requests, args.concurrency
+                )
+            finally:
+                server.terminate()
+                server.wait(timeout=30)
+
+    shutil.rmtree(workdir, ignore_errors=True)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
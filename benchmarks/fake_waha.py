@@ -0,0 +1,102 @@
+"""Minimal stand-in for the WAHA HTTP API used by benchmarks."""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeWahaServer:
+    """
+    Threaded HTTP server answering the WAHA endpoints the bot calls.
+
+    ``POST /api/sendText`` and ``GET /api/sessions/<name>`` are answered after
+    an optional artificial latency, so benchmarks can reproduce a slow WAHA.
+    Every ``sendText`` body is recorded in ``sent`` (bounded by ``max_recorded``).
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_ms: float = 0.0,
+        max_recorded: int = 100_000,
+    ) -> None:
+        self.latency_ms = latency_ms
+        self.max_recorded = max_recorded
+        self.send_count = 0
+        self.sent: list[dict] = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args) -> None:  # silence per-request stderr logs
+                pass
+
+            def _reply(self, status: int, body: dict) -> None:
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+                if server.latency_ms:
+                    time.sleep(server.latency_ms / 1000)
+                if self.path == "/api/sendText":
+                    server.record_send(body)
+                    self._reply(201, {"id": f"fake_{server.send_count}"})
+                else:
+                    self._reply(404, {"error": "not found"})
+
+            def do_GET(self) -> None:
+                if server.latency_ms:
+                    time.sleep(server.latency_ms / 1000)
+                if self.path.startswith("/api/sessions/"):
+                    self._reply(200, {"name": self.path.rsplit("/", 1)[-1], "status": "WORKING"})
+                else:
+                    self._reply(200, {"status": "ok"})
+
+        return Handler
+
+    def record_send(self, body: dict) -> None:
+        with self._lock:
+            self.send_count += 1
+            if len(self.sent) < self.max_recorded:
+                self.sent.append(body)
+
+    def sends_by_chat(self) -> dict[str, int]:
+        """Number of recorded ``sendText`` calls per chat id."""
+        counts: dict[str, int] = {}
+        with self._lock:
+            for body in self.sent:
+                chat_id = body.get("chatId", "")
+                counts[chat_id] = counts.get(chat_id, 0) + 1
+        return counts
+
+    def start(self) -> "FakeWahaServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeWahaServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
@@ -0,0 +1,140 @@
+"""
+Startup cost of the web and Celery worker processes.
+
+For each target a fresh interpreter boots the way the real process does,
+under ``python -X importtime``; the report lists the total import time and
+the modules with the largest cumulative cost, and flags heavy stacks
+(pandas/numpy/JobSpy/tls-client) that should only load on first use. For the
+web target the time from process spawn to the first answered request
+(``GET /health/`` through the WSGI handler) is measured as well.
+
+Usage:
+    python -m benchmarks.startup --runs 5 --top 15
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.common import percentile
+
+ROOT = Path(__file__).resolve().parent.parent
+
+BOOT = {
+    "web": (
+        "import django; django.setup();"
+        "from waha_bot.wsgi import application; import waha_bot.urls"
+    ),
+    "worker": (
+        "from waha_bot.celery import app; import django; django.setup();"
+        "app.loader.import_default_modules()"
+    ),
+}
+
+FIRST_REQUEST = """
+from waha_bot.wsgi import application
+from django.test import RequestFactory
+response = application.get_response(RequestFactory().get({path!r}, secure=True))
+print(response.status_code, flush=True)
+"""
+
+HEAVY_MODULES = ("pandas", "numpy", "jobspy", "tls_client")
+
+
+def _env(workdir: Path) -> dict:
+    env = dict(os.environ)
+    env.update(
+        {
+            "DJANGO_SETTINGS_MODULE": "waha_bot.settings",
+            "DATABASE_URL": f"sqlite:///{workdir / 'startup.sqlite3'}",
+            "ALLOWED_HOSTS": "*",
+        }
+    )
+    # No Redis round trips (or DNS lookups) in the measured path
+    env.setdefault("REDIS_URL", "")
+    return env
+
+
+def _parse_importtime(stderr: str) -> list[tuple[str, int, int]]:
+    """``(module, depth, cumulative_us)`` per line of ``-X importtime`` output."""
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative_us, name = line[len("import time:") :].split("|")
+        # One space after the bar for top-level imports, two more per nesting level
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        modules.append((name.strip(), depth, int(cumulative_us)))
+    return modules
+
+
+def import_report(target: str, env: dict, top: int) -> dict:
+    """Import-time breakdown of one boot target."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", BOOT[target]],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = _parse_importtime(result.stderr)
+    slowest: dict[str, int] = {}
+    for name, _, cumulative in modules:
+        slowest[name] = max(cumulative, slowest.get(name, 0))
+    loaded = {name.split(".")[0] for name in slowest}
+    return {
+        "modules": len(slowest),
+        "import_ms": round(sum(m[2] for m in modules if m[1] == 0) / 1000, 1),
+        "heavy_modules_loaded": sorted(loaded.intersection(HEAVY_MODULES)),
+        "slowest": [
+            {"module": name, "cumulative_ms": round(cumulative / 1000, 1)}
+            for name, cumulative in sorted(slowest.items(), key=lambda m: m[1], reverse=True)[:top]
+        ],
+    }
+
+
+def time_to_first_request(env: dict, path: str, runs: int) -> dict:
+    """Milliseconds from spawning a web process to its first response."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-c", FIRST_REQUEST.format(path=path)],
+            cwd=ROOT,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        samples.append((time.perf_counter() - start) * 1000)
+    return {
+        "path": path,
+        "status": int(result.stdout.split()[-1]),
+        "runs": runs,
+        "median_ms": round(statistics.median(samples), 1),
+        "p95_ms": round(percentile(samples, 95), 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=5, help="Processes spawned per timing")
+    parser.add_argument("--top", type=int, default=15, help="Slowest modules listed")
+    parser.add_argument("--path", default="/health/", help="First request path")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="capyvagas-startup-") as workdir:
+        env = _env(Path(workdir))
+        report = {target: import_report(target, env, args.top) for target in BOOT}
+        report["web"]["first_request"] = time_to_first_request(env, args.path, args.runs)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""
+Load-test harness for the webhook view + BotService.
+
+Runs entirely in-process: a throwaway database is migrated and seeded with a
+course catalog, WAHA is replaced by ``benchmarks.fake_waha`` (recording every
+``/api/sendText``), and scripted conversations are replayed through the full
+Django stack (middleware + ``apps.bot.views.webhook``) from many synthetic
+chat_ids. Conversations advance in waves, one script step for every user at a
+time, so deliveries from different chats interleave as they do in production.
+
+Reports throughput, p50/p95/p99 latency and DB queries per message, overall
+and per conversation step.
+
+SQLite serializes writers; keep ``--concurrency 1`` with it and use
+``--database-url postgres://...`` (a disposable database!) for concurrent runs.
+
+Usage:
+    python -m benchmarks.webhook_load --users 2000 --concurrency 1
+"""
+import argparse
+import contextvars
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from benchmarks.common import latency_summary
+from benchmarks.fake_waha import FakeWahaServer
+
+# menu → login → course → term → search
+CONVERSATION = [
+    ("menu", "menu"),
+    ("login", "1"),
+    ("login_ra", "a{index:07d}"),
+    ("login_password", "senha-bench"),
+    ("courses", "3"),
+    ("course", "1"),
+    ("term_search", "1"),
+]
+
+QUERY_COUNTER_UID = "bench_query_counter"
+
+_query_counter: contextvars.ContextVar[list[int] | None] = contextvars.ContextVar(
+    "bench_query_counter", default=None
+)
+
+
+def _count_queries(execute, sql, params, many, context):
+    counter = _query_counter.get()
+    if counter is not None:
+        counter[0] += 1
+    return execute(sql, params, many, context)
+
+
+def _install_query_counter() -> None:
+    """Count queries on every connection, including ones opened by worker threads."""
+    from django.db import connections
+    from django.db.backends.signals import connection_created
+
+    def install(sender, connection, **kwargs):
+        if _count_queries not in connection.execute_wrappers:
+            connection.execute_wrappers.append(_count_queries)
+
+    # Receivers outlive the profiled() blocks that open pool-thread connections;
+    # the dispatch_uid keeps repeated installs idempotent
+    connection_created.connect(install, weak=False, dispatch_uid=QUERY_COUNTER_UID)
+    for connection in connections.all():
+        install(None, connection)
+
+
+def _setup_django(database_url: str, waha_url: str) -> None:
+    os.environ.update(
+        {
+            "DJANGO_SETTINGS_MODULE": "waha_bot.settings",
+            "DEBUG": "True",
+            "ALLOWED_HOSTS": "*",
+            "DATABASE_URL": database_url,
+            "WAHA_URL": waha_url,
+            "WEBHOOK_DEBUG_SAMPLE_RATE": "0",
+        }
+    )
+    os.environ.setdefault("REDIS_URL", "")
+
+    import django
+    from django.core.management import call_command
+
+    django.setup()
+    # Per-request INFO logs would dominate the measured latency
+    logging.disable(logging.INFO)
+    call_command("migrate", verbosity=0, interactive=False)
+    _install_query_counter()
+
+
+def _seed_catalog() -> None:
+    from apps.courses.models import Course, SearchTerm
+
+    course, _ = Course.objects.get_or_create(name="Engenharia de Software", defaults={"order": 0})
+    for priority, term in enumerate(["Python", "Django", "Estágio TI"]):
+        SearchTerm.objects.get_or_create(course=course, term=term, defaults={"priority": priority})
+
+
+class Replayer:
+    """Posts scripted messages to the webhook and records per-message cost."""
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.samples: list[tuple[str, float, int, bool]] = []
+
+    def _client(self):
+        from django.test import Client
+
+        if not hasattr(self._local, "client"):
+            self._local.client = Client(raise_request_exception=False)
+        return self._local.client
+
+    def send(self, step: str, chat_id: str, text: str) -> None:
+        body = json.dumps(
+            {
+                "event": "message.any",
+                "payload": {
+                    "id": f"false_{chat_id}_{uuid.uuid4().hex}",
+                    "from": chat_id,
+                    "body": text,
+                    "fromMe": False,
+                },
+            }
+        )
+        counter = [0]
+        token = _query_counter.set(counter)
+        start = time.perf_counter()
+        try:
+            response = self._client().post("/webhook/", body, content_type="application/json")
+            ok = response.status_code == 200
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            _query_counter.reset(token)
+        with self._lock:
+            self.samples.append((step, elapsed_ms, counter[0], ok))
+
+
+def _summarize(samples: list[tuple[str, float, int, bool]], elapsed_s: float) -> dict:
+    ok_samples = [s for s in samples if s[3]]
+    summary = latency_summary([s[1] for s in ok_samples], elapsed_s)
+    summary["errors"] = len(samples) - len(ok_samples)
+    summary["queries_per_message"] = (
+        round(sum(s[2] for s in ok_samples) / len(ok_samples), 2) if ok_samples else 0.0
+    )
+    return summary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--users", type=int, default=500, help="Synthetic chat_ids")
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--waha-latency-ms", type=float, default=0.0)
+    parser.add_argument("--database-url", default="")
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="capyvagas-load-"))
+    database_url = args.database_url or f"sqlite:///{workdir / 'load.sqlite3'}"
+
+    with FakeWahaServer(latency_ms=args.waha_latency_ms) as waha:
+        _setup_django(database_url, waha.url)
+        _seed_catalog()
+
+        replayer = Replayer()
+        chat_ids = [f"55419{index:08d}@c.us" for index in range(args.users)]
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            for step, template in CONVERSATION:
+                list(
+                    pool.map(
+                        lambda pair: replayer.send(step, pair[1], template.format(index=pair[0])),
+                        enumerate(chat_ids),
+                    )
+                )
+        elapsed = time.perf_counter() - start
+
+        report = {
+            "users": args.users,
+            "messages": len(replayer.samples),
+            "concurrency": args.concurrency,
+            "waha_send_text_calls": waha.send_count,
+            "waha_calls_per_message": round(waha.send_count / max(1, len(replayer.samples)), 2),
+            "overall": _summarize(replayer.samples, elapsed),
+            "steps": {},
+        }
+        for step, _ in CONVERSATION:
+            step_samples = [s for s in replayer.samples if s[0] == step]
+            step_elapsed = sum(s[1] for s in step_samples) / 1000 / args.concurrency
+            report["steps"][step] = _summarize(step_samples, step_elapsed)
+
+    shutil.rmtree(workdir, ignore_errors=True)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 import os
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
@@ -13,6 +14,12 @@ env = environ.Env(
     DJANGO_SECRET_KEY=(str, ""),
     ALLOWED_HOSTS=(str, "*"),
     DATABASE_URL=(str, ""),
+    DATABASE_REPLICA_URL=(str, ""),
+    DATABASE_POOL=(bool, True),
+    DATABASE_POOL_MIN_SIZE=(int, 2),
+    DATABASE_POOL_MAX_SIZE=(int, 10),
+    DATABASE_POOL_TIMEOUT_SECONDS=(int, 10),
+    DATABASE_REPLICA_PIN_SECONDS=(int, 10),
     REDIS_URL=(str, "redis://redis:6379/0"),
     WAHA_URL=(str, "http://waha:3000"),
     WAHA_API_KEY=(str, ""),
@@ -23,6 +30,35 @@ env = environ.Env(
     DJANGO_ADMIN_USERNAME=(str, "admin"),
     DJANGO_ADMIN_PASSWORD=(str, "admin"),
     DOMAIN=(str, "localhost"),
+    WEBHOOK_DEDUP_TTL_SECONDS=(int, 86400),
+    WEBHOOK_DEBUG_SAMPLE_RATE=(float, 0.01),
+    WEBHOOK_WORKER_THREADS=(int, 8),
+    RATE_LIMIT_MESSAGES=(int, 20),
+    RATE_LIMIT_MESSAGES_WINDOW_SECONDS=(int, 60),
+    RATE_LIMIT_LOGIN_ATTEMPTS=(int, 5),
+    RATE_LIMIT_LOGIN_WINDOW_SECONDS=(int, 900),
+    RATE_LIMIT_SEARCHES=(int, 10),
+    RATE_LIMIT_SEARCH_WINDOW_SECONDS=(int, 600),
+    BOT_HEALTH_PROBE_INTERVAL_SECONDS=(int, 30),
+    HEALTH_READINESS_CACHE_SECONDS=(int, 5),
+    HEALTH_QUEUE_BACKLOG_MAX=(int, 1000),
+    INTERACTION_LOG_RETENTION_DAYS=(int, 180),
+    INTERACTION_LOG_PURGE_BATCH_SIZE=(int, 5000),
+    JOB_ALERTS_COLLECT_INTERVAL_MINUTES=(int, 30),
+    JOB_ALERTS_RESULTS_PER_TERM=(int, 20),
+    JOB_ALERTS_SEND_RATE_PER_SECOND=(float, 1.0),
+    JOB_ALERTS_SEND_BATCH_SIZE=(int, 200),
+    JOB_ALERTS_DIGEST_WINDOW_HOURS=(int, 24),
+    JOB_ALERTS_QUIET_HOURS_START=(int, 22),
+    JOB_ALERTS_QUIET_HOURS_END=(int, 8),
+    JOBSPY_ENABLED=(bool, False),
+    JOBSPY_SITES=(list, ["linkedin", "indeed"]),
+    JOBSPY_HOURS_OLD=(int, 72),
+    UTFPR_PORTAL_URL=(str, ""),
+    UTFPR_PORTAL_TIMEOUT_SECONDS=(int, 15),
+    UTFPR_PORTAL_POOL_SIZE=(int, 10),
+    UTFPR_PORTAL_USE_TLS_CLIENT=(bool, False),
+    UTFPR_PORTAL_SESSION_TTL_SECONDS=(int, 1800),
 )
 
 # Read .env file if it exists
@@ -69,6 +105,12 @@ class DjangoSettings:
 @dataclass
 class DatabaseSettings:
     url: str
+    replica_url: str
+    pool: bool
+    pool_min_size: int
+    pool_max_size: int
+    pool_timeout_seconds: int
+    replica_pin_seconds: int
 
     def __init__(self) -> None:
         # Try to read postgres password from secret
@@ -85,6 +127,16 @@ class DatabaseSettings:
             # Fallback to DATABASE_URL or SQLite
             self.url = env("DATABASE_URL", default=f"sqlite:///{BASE_DIR}/db.sqlite3")
 
+        # Optional read replica for dashboard/API reads (empty = everything on default)
+        self.replica_url = env("DATABASE_REPLICA_URL")
+        # psycopg 3 connection pool, used only with PostgreSQL
+        self.pool = env("DATABASE_POOL")
+        self.pool_min_size = env("DATABASE_POOL_MIN_SIZE")
+        self.pool_max_size = env("DATABASE_POOL_MAX_SIZE")
+        self.pool_timeout_seconds = env("DATABASE_POOL_TIMEOUT_SECONDS")
+        # After a write, the same browser reads from default for this long (replication lag)
+        self.replica_pin_seconds = env("DATABASE_REPLICA_PIN_SECONDS")
+
 
 @dataclass
 class RedisSettings:
@@ -108,6 +160,106 @@ class WahaSettings:
         self.timeout_seconds = env("WAHA_TIMEOUT_SECONDS")
 
 
+@dataclass
+class WebhookSettings:
+    dedup_ttl_seconds: int
+    debug_sample_rate: float
+    worker_threads: int
+
+    def __init__(self) -> None:
+        self.dedup_ttl_seconds = env("WEBHOOK_DEDUP_TTL_SECONDS")
+        self.debug_sample_rate = env("WEBHOOK_DEBUG_SAMPLE_RATE")
+        self.worker_threads = env("WEBHOOK_WORKER_THREADS")
+
+
+@dataclass
+class RateLimitSettings:
+    messages: int
+    messages_window_seconds: int
+    login_attempts: int
+    login_window_seconds: int
+    searches: int
+    search_window_seconds: int
+
+    def __init__(self) -> None:
+        self.messages = env("RATE_LIMIT_MESSAGES")
+        self.messages_window_seconds = env("RATE_LIMIT_MESSAGES_WINDOW_SECONDS")
+        self.login_attempts = env("RATE_LIMIT_LOGIN_ATTEMPTS")
+        self.login_window_seconds = env("RATE_LIMIT_LOGIN_WINDOW_SECONDS")
+        self.searches = env("RATE_LIMIT_SEARCHES")
+        self.search_window_seconds = env("RATE_LIMIT_SEARCH_WINDOW_SECONDS")
+
+
+@dataclass
+class MonitoringSettings:
+    probe_interval_seconds: int
+    readiness_cache_seconds: int
+    queue_backlog_max: int
+
+    def __init__(self) -> None:
+        self.probe_interval_seconds = env("BOT_HEALTH_PROBE_INTERVAL_SECONDS")
+        self.readiness_cache_seconds = env("HEALTH_READINESS_CACHE_SECONDS")
+        self.queue_backlog_max = env("HEALTH_QUEUE_BACKLOG_MAX")
+
+
+@dataclass
+class RetentionSettings:
+    interaction_log_days: int
+    purge_batch_size: int
+
+    def __init__(self) -> None:
+        self.interaction_log_days = env("INTERACTION_LOG_RETENTION_DAYS")
+        self.purge_batch_size = env("INTERACTION_LOG_PURGE_BATCH_SIZE")
+
+
+@dataclass
+class JobAlertSettings:
+    collect_interval_minutes: int
+    results_per_term: int
+    send_rate_per_second: float
+    send_batch_size: int
+    digest_window_hours: int
+    quiet_hours_start: int
+    quiet_hours_end: int
+
+    def __init__(self) -> None:
+        self.collect_interval_minutes = env("JOB_ALERTS_COLLECT_INTERVAL_MINUTES")
+        self.results_per_term = env("JOB_ALERTS_RESULTS_PER_TERM")
+        self.send_rate_per_second = env("JOB_ALERTS_SEND_RATE_PER_SECOND")
+        self.send_batch_size = env("JOB_ALERTS_SEND_BATCH_SIZE")
+        self.digest_window_hours = env("JOB_ALERTS_DIGEST_WINDOW_HOURS")
+        self.quiet_hours_start = env("JOB_ALERTS_QUIET_HOURS_START")
+        self.quiet_hours_end = env("JOB_ALERTS_QUIET_HOURS_END")
+
+
+@dataclass
+class JobSearchSettings:
+    enabled: bool
+    sites: list[str]
+    hours_old: int
+
+    def __init__(self) -> None:
+        self.enabled = env("JOBSPY_ENABLED")
+        self.sites = env("JOBSPY_SITES")
+        self.hours_old = env("JOBSPY_HOURS_OLD")
+
+
+@dataclass
+class PortalSettings:
+    login_url: str
+    timeout_seconds: int
+    pool_size: int
+    use_tls_client: bool
+    session_ttl_seconds: int
+
+    def __init__(self) -> None:
+        self.login_url = env("UTFPR_PORTAL_URL")
+        self.timeout_seconds = env("UTFPR_PORTAL_TIMEOUT_SECONDS")
+        self.pool_size = env("UTFPR_PORTAL_POOL_SIZE")
+        self.use_tls_client = env("UTFPR_PORTAL_USE_TLS_CLIENT")
+        self.session_ttl_seconds = env("UTFPR_PORTAL_SESSION_TTL_SECONDS")
+
+
 @dataclass
 class BotDashboardCredentials:
     username: str
@@ -128,22 +280,65 @@ class DjangoAdminCredentials:
         self.password = env("DJANGO_ADMIN_PASSWORD")
 
 
-@dataclass
 class AppConfig:
-    django: DjangoSettings
-    database: DatabaseSettings
-    redis: RedisSettings
-    waha: WahaSettings
-    dashboard_credentials: BotDashboardCredentials
-    admin_credentials: DjangoAdminCredentials
+    """
+    Application settings, one section per attribute.
 
-    def __init__(self) -> None:
-        self.django = DjangoSettings()
-        self.database = DatabaseSettings()
-        self.redis = RedisSettings()
-        self.waha = WahaSettings()
-        self.dashboard_credentials = BotDashboardCredentials()
-        self.admin_credentials = DjangoAdminCredentials()
+    Each section is built the first time it is read, so a process only parses
+    the variables (and Docker secret files) of the sections it uses.
+    """
+
+    @cached_property
+    def django(self) -> DjangoSettings:
+        return DjangoSettings()
+
+    @cached_property
+    def database(self) -> DatabaseSettings:
+        return DatabaseSettings()
+
+    @cached_property
+    def redis(self) -> RedisSettings:
+        return RedisSettings()
+
+    @cached_property
+    def waha(self) -> WahaSettings:
+        return WahaSettings()
+
+    @cached_property
+    def webhook(self) -> WebhookSettings:
+        return WebhookSettings()
+
+    @cached_property
+    def rate_limits(self) -> RateLimitSettings:
+        return RateLimitSettings()
+
+    @cached_property
+    def monitoring(self) -> MonitoringSettings:
+        return MonitoringSettings()
+
+    @cached_property
+    def retention(self) -> RetentionSettings:
+        return RetentionSettings()
+
+    @cached_property
+    def job_alerts(self) -> JobAlertSettings:
+        return JobAlertSettings()
+
+    @cached_property
+    def job_search(self) -> JobSearchSettings:
+        return JobSearchSettings()
+
+    @cached_property
+    def portal(self) -> PortalSettings:
+        return PortalSettings()
+
+    @cached_property
+    def dashboard_credentials(self) -> BotDashboardCredentials:
+        return BotDashboardCredentials()
+
+    @cached_property
+    def admin_credentials(self) -> DjangoAdminCredentials:
+        return DjangoAdminCredentials()
 
 
 settings = AppConfig()
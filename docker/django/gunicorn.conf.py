@@ -0,0 +1,14 @@
+"""Gunicorn settings for the backend container."""
+import os
+
+from prometheus_client import multiprocess
+
+bind = "0.0.0.0:8000"
+workers = int(os.environ.get("GUNICORN_WORKERS", "2"))
+worker_class = "uvicorn_worker.UvicornWorker"
+
+
+def child_exit(server, worker):
+    """Drop the exited worker's live gauges from the merged Prometheus view."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(worker.pid)
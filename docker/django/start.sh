@@ -4,4 +4,14 @@ set -e
 
 python manage.py migrate --noinput
 python manage.py collectstatic --noinput
-gunicorn waha_bot.wsgi:application --bind 0.0.0.0:8000
+
+# Prometheus multiprocess mode: each worker writes its metrics to this
+# directory and /metrics/ merges them. Stale files from a previous run would
+# be merged too, so start from an empty directory.
+export PROMETHEUS_MULTIPROC_DIR="${PROMETHEUS_MULTIPROC_DIR:-/tmp/prometheus}"
+rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+
+# ASGI workers: one process keeps many webhook requests in flight while they
+# wait on WAHA/DB (the sync bot pipeline runs on WEBHOOK_WORKER_THREADS threads).
+exec gunicorn waha_bot.asgi:application --config docker/django/gunicorn.conf.py
@@ -0,0 +1,4 @@
+"""Database routing helpers."""
+from .routers import REPLICA_ALIAS, ReadReplicaRouter, read_from_replica
+
+__all__ = ["REPLICA_ALIAS", "ReadReplicaRouter", "read_from_replica"]
@@ -0,0 +1,53 @@
+"""
+Read-replica routing.
+
+Reads go to the ``replica`` alias only inside ``read_from_replica()``, which
+the ``ReadReplicaMiddleware`` enters for safe dashboard/API requests. The
+flag lives in a context variable, so it follows the request through sync
+and async code and never leaks into webhook handling or Celery tasks.
+Writes always go to ``default``; without a ``replica`` alias everything
+stays on ``default``.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from django.conf import settings
+
+REPLICA_ALIAS = "replica"
+
+_use_replica: ContextVar[bool] = ContextVar("use_replica", default=False)
+
+
+@contextmanager
+def read_from_replica(enabled: bool = True) -> Iterator[None]:
+    """
+    Route ORM reads in this block to the replica, if one is configured.
+
+    Args:
+        enabled: Pass False to force reads back to ``default`` in a nested block
+    """
+    token = _use_replica.set(enabled)
+    try:
+        yield
+    finally:
+        _use_replica.reset(token)
+
+
+class ReadReplicaRouter:
+    """Sends reads to the replica while ``read_from_replica`` is active."""
+
+    def db_for_read(self, model, **hints) -> Optional[str]:
+        if _use_replica.get() and REPLICA_ALIAS in settings.DATABASES:
+            return REPLICA_ALIAS
+        return None
+
+    def db_for_write(self, model, **hints) -> Optional[str]:
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints) -> Optional[bool]:
+        # Both aliases hold the same data
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints) -> Optional[bool]:
+        return db != REPLICA_ALIAS
@@ -1,9 +1,23 @@
 import logging
 from typing import List, Dict, Any
-# from jobspy import scrape_jobs # Comentado para evitar erro de import se não estiver instalado ainda
+
+from config.env import settings
 
 logger = logging.getLogger(__name__)
 
+
+def _scrape_jobs():
+    """
+    Importa o ``scrape_jobs`` do JobSpy.
+
+    O JobSpy puxa pandas e numpy; importando só na primeira busca real, os
+    workers do gunicorn e do Celery sobem sem carregar essa pilha.
+    """
+    from jobspy import scrape_jobs
+
+    return scrape_jobs
+
+
 class JobSearchService:
     """
     Serviço para buscar vagas usando o JobSpy.
@@ -13,9 +27,10 @@ class JobSearchService:
         """
         Busca vagas para os termos fornecidos.
         """
-        # Mock implementation for now to avoid dependency issues during initial setup
-        # Real implementation would use scrape_jobs
-        
+        if settings.job_search.enabled:
+            return self.search_real(terms, location, limit)
+
+        # Resultados de exemplo enquanto JOBSPY_ENABLED estiver desligado
         results = []
         logger.info(f"Buscando vagas para: {terms} em {location}")
         
@@ -31,13 +46,29 @@ class JobSearchService:
             
         return results
 
-    # def search_real(self, terms: List[str], location: str = "Curitiba, PR", limit: int = 10) -> List[Dict[str, Any]]:
-    #     jobs = scrape_jobs(
-    #         site_name=["linkedin", "indeed", "glassdoor"],
-    #         search_term=" ".join(terms),
-    #         location=location,
-    #         results_wanted=limit,
-    #         hours_old=72,
-    #         country_indeed='Brazil'
-    #     )
-    #     return jobs.to_dict('records')
+    def search_real(self, terms: List[str], location: str = "Curitiba, PR", limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Busca vagas no JobSpy e converte para o formato usado pelo bot.
+        """
+        scrape_jobs = _scrape_jobs()
+        logger.info(f"Buscando vagas no JobSpy para: {terms} em {location}")
+        jobs = scrape_jobs(
+            site_name=settings.job_search.sites,
+            search_term=" ".join(terms),
+            location=location,
+            results_wanted=limit,
+            hours_old=settings.job_search.hours_old,
+            country_indeed='Brazil'
+        )
+        # Campos ausentes vêm como NaN do pandas
+        jobs = jobs.astype(object).where(jobs.notna(), None)
+        return [
+            {
+                "title": row.get("title"),
+                "company": row.get("company"),
+                "location": row.get("location"),
+                "url": row.get("job_url"),
+                "description": row.get("description") or "",
+            }
+            for row in jobs.to_dict('records')
+        ]
@@ -3,6 +3,7 @@ import uuid
 from typing import Callable
 
 import structlog
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
 from django.http import HttpRequest, HttpResponse
 
 logger = structlog.get_logger(__name__)
@@ -11,16 +12,39 @@ logger = structlog.get_logger(__name__)
 class CorrelationIdMiddleware:
     """Middleware that adds a correlation ID to each request for distributed tracing."""
 
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
         self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
 
     def __call__(self, request: HttpRequest) -> HttpResponse:
-        # Get or generate correlation ID
+        if iscoroutinefunction(self):
+            return self.__acall__(request)  # type: ignore[return-value]
+
+        correlation_id = self._bind_correlation_id(request)
+        response = self.get_response(request)
+
+        # Add correlation ID to response headers
+        response["X-Correlation-ID"] = correlation_id
+        return response
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        correlation_id = self._bind_correlation_id(request)
+        response = await self.get_response(request)  # type: ignore[misc]
+        response["X-Correlation-ID"] = correlation_id
+        return response
+
+    @staticmethod
+    def _bind_correlation_id(request: HttpRequest) -> str:
+        """Get or generate the correlation ID and bind it to the log context."""
         correlation_id = request.headers.get("X-Correlation-ID", str(uuid.uuid4()))
-        
+
         # Store in request for access in views
         request.correlation_id = correlation_id  # type: ignore[attr-defined]
-        
+
         # Add to structlog context
         structlog.contextvars.clear_contextvars()
         structlog.contextvars.bind_contextvars(
@@ -28,11 +52,4 @@ class CorrelationIdMiddleware:
             request_method=request.method,
             request_path=request.path,
         )
-        
-        # Process request
-        response = self.get_response(request)
-        
-        # Add correlation ID to response headers
-        response["X-Correlation-ID"] = correlation_id
-        
-        return response
+        return correlation_id
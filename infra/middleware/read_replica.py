@@ -0,0 +1,61 @@
+"""Middleware that serves read-only dashboard/API requests from the read replica."""
+import time
+from typing import Callable
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.http import HttpRequest, HttpResponse
+
+from config.env import settings
+from infra.db import read_from_replica
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+REPLICA_PATH_PREFIXES = ("/dashboard/", "/api/")
+# Set after a write so the next reads of the same browser see it despite replication lag
+PIN_COOKIE = "db_pin_primary"
+
+
+class ReadReplicaMiddleware:
+    """Routes ORM reads of safe dashboard/API requests to the replica."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+        self.pin_seconds = settings.database.replica_pin_seconds
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)  # type: ignore[return-value]
+
+        with read_from_replica(self._use_replica(request)):
+            response = self.get_response(request)
+        return self._pin_after_write(request, response)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        with read_from_replica(self._use_replica(request)):
+            response = await self.get_response(request)  # type: ignore[misc]
+        return self._pin_after_write(request, response)
+
+    @staticmethod
+    def _use_replica(request: HttpRequest) -> bool:
+        if request.method not in SAFE_METHODS or not request.path.startswith(REPLICA_PATH_PREFIXES):
+            return False
+        try:
+            pinned_until = float(request.COOKIES.get(PIN_COOKIE, 0))
+        except ValueError:
+            pinned_until = 0
+        return pinned_until < time.time()
+
+    def _pin_after_write(self, request: HttpRequest, response: HttpResponse) -> HttpResponse:
+        if request.method not in SAFE_METHODS and self.pin_seconds > 0:
+            response.set_cookie(
+                PIN_COOKIE,
+                str(time.time() + self.pin_seconds),
+                max_age=self.pin_seconds,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
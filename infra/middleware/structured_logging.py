@@ -3,6 +3,7 @@ import time
 from typing import Callable
 
 import structlog
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
 from django.http import HttpRequest, HttpResponse
 
 logger = structlog.get_logger(__name__)
@@ -11,13 +12,31 @@ logger = structlog.get_logger(__name__)
 class StructuredLoggingMiddleware:
     """Middleware that logs all requests and responses in structured JSON format."""
 
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
         self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
 
     def __call__(self, request: HttpRequest) -> HttpResponse:
-        start_time = time.time()
-        
-        # Log request
+        if iscoroutinefunction(self):
+            return self.__acall__(request)  # type: ignore[return-value]
+
+        start_time = self._log_request(request)
+        response = self.get_response(request)
+        self._log_response(request, response, start_time)
+        return response
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        start_time = self._log_request(request)
+        response = await self.get_response(request)  # type: ignore[misc]
+        self._log_response(request, response, start_time)
+        return response
+
+    def _log_request(self, request: HttpRequest) -> float:
+        """Log the incoming request and return its start time."""
         logger.info(
             "request_started",
             method=request.method,
@@ -25,14 +44,13 @@ class StructuredLoggingMiddleware:
             user_agent=request.headers.get("User-Agent", ""),
             remote_addr=self._get_client_ip(request),
         )
-        
-        # Process request
-        response = self.get_response(request)
-        
-        # Calculate duration
+        return time.time()
+
+    @staticmethod
+    def _log_response(request: HttpRequest, response: HttpResponse, start_time: float) -> None:
+        """Log the response with the request duration."""
         duration_ms = (time.time() - start_time) * 1000
-        
-        # Log response
+
         logger.info(
             "request_completed",
             method=request.method,
@@ -40,8 +58,6 @@ class StructuredLoggingMiddleware:
             status_code=response.status_code,
             duration_ms=round(duration_ms, 2),
         )
-        
-        return response
 
     def process_exception(
         self, request: HttpRequest, exception: Exception
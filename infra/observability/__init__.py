@@ -0,0 +1,18 @@
+"""Observability utilities package."""
+from .profiling import (
+    MessageProfile,
+    current_profile,
+    profiled,
+    record_cache_access,
+    track_step,
+    waha_call,
+)
+
+__all__ = [
+    "MessageProfile",
+    "current_profile",
+    "profiled",
+    "record_cache_access",
+    "track_step",
+    "waha_call",
+]
@@ -0,0 +1,76 @@
+"""
+In-process Prometheus metrics.
+
+Counters and histograms live in memory. Under gunicorn, set
+``PROMETHEUS_MULTIPROC_DIR`` before the workers start: prometheus_client then
+keeps each worker's values in mmap'd files and the scrape endpoint merges
+them, so every scrape sees the whole server and not just one worker.
+"""
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+WEBHOOK_LATENCY = Histogram(
+    "capyvagas_webhook_latency_seconds",
+    "Time spent handling one WAHA webhook delivery.",
+    ["outcome"],
+)
+WAHA_SENDS = Counter(
+    "capyvagas_waha_send_total",
+    "Messages sent through the WAHA API.",
+    ["status"],
+)
+WAHA_SEND_LATENCY = Histogram(
+    "capyvagas_waha_send_seconds",
+    "Latency of WAHA sendText calls.",
+)
+RATE_LIMITED = Counter(
+    "capyvagas_rate_limited_total",
+    "Bot actions refused by the per-chat rate limiter.",
+    ["action"],
+)
+JOB_SEARCH_DURATION = Histogram(
+    "capyvagas_job_search_seconds",
+    "Duration of job searches triggered from the bot.",
+    buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120),
+)
+WAHA_UP = Gauge(
+    "capyvagas_waha_up",
+    "1 when the last WAHA health probe found the session WORKING.",
+    multiprocess_mode="mostrecent",
+)
+WAHA_PROBE_LATENCY = Gauge(
+    "capyvagas_waha_probe_seconds",
+    "Latency of the last WAHA health probe.",
+    multiprocess_mode="mostrecent",
+)
+QUEUE_DEPTH = Gauge(
+    "capyvagas_queue_depth",
+    "Pending tasks per background queue, sampled at scrape time.",
+    ["queue"],
+    multiprocess_mode="mostrecent",
+)
+
+
+def render_latest() -> tuple[bytes, str]:
+    """
+    Render every metric in the Prometheus text format.
+
+    Returns:
+        Tuple of (payload, content type)
+    """
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -0,0 +1,157 @@
+"""Per-message cost accounting: DB queries, WAHA calls, cache lookups and step timings."""
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+from django.db import connections
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass
+class MessageProfile:
+    """Costs accumulated while one inbound message is processed."""
+
+    db_queries: int = 0
+    db_time_ms: float = 0.0
+    waha_calls: int = 0
+    waha_time_ms: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    total_ms: float = 0.0
+    steps: dict[str, float] = field(default_factory=dict)
+
+    def as_log_fields(self) -> dict[str, Any]:
+        """Flatten the profile into structlog-friendly fields."""
+        return {
+            "db_queries": self.db_queries,
+            "db_time_ms": round(self.db_time_ms, 2),
+            "waha_calls": self.waha_calls,
+            "waha_time_ms": round(self.waha_time_ms, 2),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "total_ms": round(self.total_ms, 2),
+            "steps_ms": {name: round(ms, 2) for name, ms in self.steps.items()},
+        }
+
+
+_current: ContextVar[Optional[MessageProfile]] = ContextVar("message_profile", default=None)
+
+
+def current_profile() -> Optional[MessageProfile]:
+    """Profile of the message being processed in this context, if any."""
+    return _current.get()
+
+
+def _db_wrapper(execute, sql, params, many, context):
+    profile = _current.get()
+    if profile is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        profile.db_queries += 1
+        profile.db_time_ms += (time.perf_counter() - start) * 1000
+
+
+@contextmanager
+def profiled() -> Iterator[tuple[MessageProfile, bool]]:
+    """
+    Collect costs for the enclosed block.
+
+    Re-entrant: nested blocks share the outermost profile.
+
+    Yields:
+        Tuple of (profile, is_root); only the root block should report it
+    """
+    existing = _current.get()
+    if existing is not None:
+        yield existing, False
+        return
+
+    profile = MessageProfile()
+    token = _current.set(profile)
+    start = time.perf_counter()
+    try:
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(_wrapped(connection))
+            yield profile, True
+    finally:
+        profile.total_ms = (time.perf_counter() - start) * 1000
+        _current.reset(token)
+
+
+@contextmanager
+def _wrapped(connection) -> Iterator[None]:
+    """
+    Install ``_db_wrapper`` on a connection for the enclosed block.
+
+    Unlike ``connection.execute_wrapper()``, which pops the last wrapper on exit,
+    this removes ``_db_wrapper`` by identity: a wrapper appended meanwhile (e.g.
+    by a ``connection_created`` receiver when the block opens the connection)
+    stays installed, and no stale ``_db_wrapper`` is left on long-lived threads.
+    """
+    connection.execute_wrappers.append(_db_wrapper)
+    try:
+        yield
+    finally:
+        connection.execute_wrappers.remove(_db_wrapper)
+
+
+@contextmanager
+def waha_call() -> Iterator[None]:
+    """Time one call to the WAHA API."""
+    profile = _current.get()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if profile is not None:
+            profile.waha_calls += 1
+            profile.waha_time_ms += (time.perf_counter() - start) * 1000
+
+
+def record_cache_access(hit: bool) -> None:
+    """Count a cache lookup against the current message."""
+    profile = _current.get()
+    if profile is None:
+        return
+    if hit:
+        profile.cache_hits += 1
+    else:
+        profile.cache_misses += 1
+
+
+def track_step(name: Optional[str] = None) -> Callable[[F], F]:
+    """
+    Decorator that accumulates the wall time of a handler method.
+
+    Timings are inclusive: a step that calls another step also counts its time.
+
+    Args:
+        name: Step name (defaults to the function qualified name)
+    """
+
+    def decorator(func: F) -> F:
+        step = name or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            profile = _current.get()
+            if profile is None:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = (time.perf_counter() - start) * 1000
+                profile.steps[step] = profile.steps.get(step, 0.0) + elapsed
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -0,0 +1,4 @@
+"""Redis client package."""
+from .client import get_redis_client
+
+__all__ = ["get_redis_client"]
@@ -0,0 +1,24 @@
+"""Shared raw Redis client for data structures the Django cache API does not expose."""
+from typing import Optional
+
+import redis
+
+from config.env import settings
+
+# Global instance
+_client: Optional[redis.Redis] = None
+
+
+def get_redis_client() -> Optional[redis.Redis]:
+    """
+    Get or create the process-wide Redis client.
+
+    Returns:
+        Redis client, or None when no ``REDIS_URL`` is configured
+    """
+    global _client
+    if _client is None and settings.redis.url:
+        _client = redis.Redis.from_url(
+            settings.redis.url, socket_connect_timeout=1, socket_timeout=1
+        )
+    return _client
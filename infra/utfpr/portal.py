@@ -0,0 +1,208 @@
+"""
+UTFPR student portal (Portal do Aluno) login.
+
+Every login gets its own cookie jar but the TCP/TLS connections come from
+one shared, pooled ``HTTPAdapter``, so consecutive logins skip the
+handshakes. After a successful login the portal cookies and a keyed hash of
+the password are cached per RA: a repeated login with the same credentials
+inside ``UTFPR_PORTAL_SESSION_TTL_SECONDS`` is answered without scraping the
+portal again, and later portal calls can reuse the session.
+
+Without ``UTFPR_PORTAL_URL`` the authenticator runs in development mode and
+accepts any RA except ``000000``.
+"""
+import hashlib
+import hmac
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+import requests
+import structlog
+from django.conf import settings as django_settings
+from django.core.cache import cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config.env import PortalSettings, settings
+
+logger = structlog.get_logger(__name__)
+
+_HIDDEN_INPUT = re.compile(r"<input[^>]*type=[\"']hidden[\"'][^>]*>", re.IGNORECASE)
+_ATTR = re.compile(r"(name|value)=[\"']([^\"']*)[\"']", re.IGNORECASE)
+_PASSWORD_INPUT = re.compile(r"<input[^>]*type=[\"']password[\"']", re.IGNORECASE)
+
+
+class PortalUnavailableError(Exception):
+    """The portal could not be reached or answered with a server error."""
+
+
+@dataclass
+class PortalLogin:
+    """Outcome of a login attempt."""
+
+    ok: bool
+    cookies: Dict[str, str] = field(default_factory=dict)
+    reused: bool = False
+
+
+def _import_tls_client():
+    # Imported only when enabled: it loads a native library at import time
+    try:
+        import tls_client
+    except ImportError:  # pragma: no cover - tls-client is optional
+        return None
+    return tls_client
+
+
+def _hidden_fields(html: str) -> Dict[str, str]:
+    fields = {}
+    for tag in _HIDDEN_INPUT.findall(html):
+        attrs = {k.lower(): v for k, v in _ATTR.findall(tag)}
+        if attrs.get("name"):
+            fields[attrs["name"]] = attrs.get("value", "")
+    return fields
+
+
+class PortalAuthenticator:
+    """
+    Verifies RA/password pairs against the student portal login form.
+    """
+
+    USERNAME_FIELD = "username"
+    PASSWORD_FIELD = "password"
+    CACHE_PREFIX = "utfpr:portal:session"
+
+    def __init__(self, portal_settings: Optional[PortalSettings] = None) -> None:
+        """
+        Initialize the authenticator.
+
+        Args:
+            portal_settings: Portal configuration (defaults to the environment)
+        """
+        self.settings = portal_settings or settings.portal
+        self._adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.settings.pool_size,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+        )
+        self._tls_client = _import_tls_client() if self.settings.use_tls_client else None
+        self._use_tls_client = self._tls_client is not None
+        if self.settings.use_tls_client and self._tls_client is None:
+            logger.warning("portal_tls_client_unavailable")
+
+    def _new_session(self):
+        if self._use_tls_client:
+            return self._tls_client.Session(client_identifier="chrome_120", random_tls_extension_order=True)
+        session = requests.Session()
+        session.mount("https://", self._adapter)
+        session.mount("http://", self._adapter)
+        return session
+
+    def _request(self, session, method: str, url: str, **kwargs):
+        timeout = self.settings.timeout_seconds
+        if self._use_tls_client:
+            kwargs["timeout_seconds"] = timeout
+        else:
+            kwargs["timeout"] = timeout
+        try:
+            response = getattr(session, method)(url, **kwargs)
+        except Exception as e:
+            raise PortalUnavailableError(str(e)) from e
+        if response.status_code >= 500:
+            raise PortalUnavailableError(f"portal answered {response.status_code}")
+        return response
+
+    def _cache_key(self, ra: str) -> str:
+        return f"{self.CACHE_PREFIX}:{hashlib.sha256(ra.encode()).hexdigest()}"
+
+    @staticmethod
+    def _password_digest(ra: str, password: str) -> str:
+        key = django_settings.SECRET_KEY.encode()
+        return hmac.new(key, f"{ra}\x00{password}".encode(), hashlib.sha256).hexdigest()
+
+    def cached_session(self, ra: str) -> Optional[Dict[str, str]]:
+        """
+        Portal cookies of the last successful login of an RA, if still cached.
+
+        Args:
+            ra: Registro Acadêmico
+
+        Returns:
+            Cookie name → value, or None
+        """
+        try:
+            entry = cache.get(self._cache_key(ra))
+        except Exception:
+            return None
+        return entry["cookies"] if entry else None
+
+    def forget(self, ra: str) -> None:
+        """Drop the cached session of an RA (e.g. on logout)."""
+        try:
+            cache.delete(self._cache_key(ra))
+        except Exception:
+            pass
+
+    def login(self, ra: str, password: str) -> PortalLogin:
+        """
+        Log in to the portal, reusing a cached session for repeated credentials.
+
+        Args:
+            ra: Registro Acadêmico
+            password: Portal password
+
+        Returns:
+            Login outcome
+
+        Raises:
+            PortalUnavailableError: If the portal could not answer
+        """
+        if not self.settings.login_url:
+            return PortalLogin(ok=ra != "000000")
+
+        digest = self._password_digest(ra, password)
+        try:
+            entry = cache.get(self._cache_key(ra))
+        except Exception:
+            entry = None
+        if entry and hmac.compare_digest(entry["digest"], digest):
+            return PortalLogin(ok=True, cookies=entry["cookies"], reused=True)
+
+        session = self._new_session()
+        form = self._request(session, "get", self.settings.login_url)
+        data = _hidden_fields(form.text)
+        data.update({self.USERNAME_FIELD: ra, self.PASSWORD_FIELD: password})
+        response = self._request(session, "post", self.settings.login_url, data=data)
+
+        # A rejected login renders the form (and its password input) again
+        if response.status_code >= 400 or _PASSWORD_INPUT.search(response.text or ""):
+            logger.info("portal_login_rejected", status=response.status_code)
+            return PortalLogin(ok=False)
+
+        cookies = dict(session.cookies.items()) if hasattr(session.cookies, "items") else {}
+        try:
+            cache.set(
+                self._cache_key(ra),
+                {"digest": digest, "cookies": cookies},
+                timeout=self.settings.session_ttl_seconds,
+            )
+        except Exception as e:
+            logger.warning("portal_session_cache_unavailable", error=str(e))
+        return PortalLogin(ok=True, cookies=cookies)
+
+
+# Global instance
+_authenticator: Optional[PortalAuthenticator] = None
+_authenticator_lock = threading.Lock()
+
+
+def get_portal_authenticator() -> PortalAuthenticator:
+    """Get or create the process-wide authenticator (and its connection pool)."""
+    global _authenticator
+    if _authenticator is None:
+        with _authenticator_lock:
+            if _authenticator is None:
+                _authenticator = PortalAuthenticator()
+    return _authenticator
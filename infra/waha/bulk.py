@@ -0,0 +1,121 @@
+"""Rate-limited bulk sending through WAHA."""
+import threading
+import time
+from typing import Callable, Iterable, Iterator, Optional, Tuple
+
+import structlog
+
+from infra.waha.client import WahaClient
+
+logger = structlog.get_logger(__name__)
+
+
+class TokenBucket:
+    """
+    Token bucket pacing calls to ``rate`` per second with bursts of up to ``burst``.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Initialize the bucket (full).
+
+        Args:
+            rate: Tokens added per second
+            burst: Bucket capacity
+            clock: Monotonic clock (injectable for tests)
+            sleep: Sleep function (injectable for tests)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(self.burst)
+        self._last = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def acquire(self) -> float:
+        """
+        Take one token, sleeping until one is available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        with self._lock:
+            self._refill()
+            waited = 0.0
+            if self._tokens < 1:
+                waited = (1 - self._tokens) / self.rate
+                self._sleep(waited)
+                self._refill()
+            self._tokens -= 1
+            return waited
+
+
+class BulkSender:
+    """
+    Sends many WhatsApp messages through one ``WahaClient`` without exceeding a set rate.
+    """
+
+    def __init__(
+        self,
+        client: WahaClient,
+        rate_per_second: float,
+        burst: int = 1,
+        bucket: Optional[TokenBucket] = None,
+    ) -> None:
+        """
+        Initialize the sender.
+
+        Args:
+            client: WAHA client
+            rate_per_second: Maximum messages per second
+            burst: Messages that may go out back to back before pacing starts
+            bucket: Custom token bucket (optional)
+        """
+        self.client = client
+        self.bucket = bucket or TokenBucket(rate_per_second, burst)
+
+    def send(self, chat_id: str, text: str) -> bool:
+        """
+        Send one message once the rate limit allows it.
+
+        Args:
+            chat_id: WhatsApp chat ID
+            text: Message text
+
+        Returns:
+            True if WAHA accepted the message
+        """
+        self.bucket.acquire()
+        return self.client.send_message(chat_id, text)
+
+    def send_many(self, messages: Iterable[Tuple[str, str]]) -> Iterator[Tuple[str, bool]]:
+        """
+        Send messages in order, paced by the rate limit.
+
+        Args:
+            messages: (chat_id, text) pairs
+
+        Yields:
+            (chat_id, delivered) for each message as soon as it is sent
+        """
+        sent = failed = 0
+        for chat_id, text in messages:
+            ok = self.send(chat_id, text)
+            sent += ok
+            failed += not ok
+            yield chat_id, ok
+        logger.info("waha_bulk_send_finished", sent=sent, failed=failed)
@@ -4,6 +4,8 @@ from typing import Optional
 import requests
 
 from config.env import WahaSettings
+from infra.observability import waha_call
+from infra.observability.metrics import WAHA_SEND_LATENCY, WAHA_SENDS
 
 logger = logging.getLogger(__name__)
 
@@ -34,16 +36,20 @@ class WahaClient:
             "session": self.settings.session_name,
         }
         try:
-            response = requests.post(
-                url, json=payload, headers=headers, timeout=self.settings.timeout_seconds
-            )
+            with waha_call(), WAHA_SEND_LATENCY.time():
+                response = requests.post(
+                    url, json=payload, headers=headers, timeout=self.settings.timeout_seconds
+                )
             if not 200 <= response.status_code < 300:
                 logger.error(
                     "Erro WAHA (%s): %s", response.status_code, response.text
                 )
+                WAHA_SENDS.labels(status="error").inc()
                 return False
         except Exception as error:  # pragma: no cover - defensive logging
             logger.error("Erro ao enviar mensagem WAHA: %s", error)
+            WAHA_SENDS.labels(status="error").inc()
             return False
 
+        WAHA_SENDS.labels(status="ok").inc()
         return True
@@ -0,0 +1,19 @@
+"""
+Celery application for background and scheduled tasks.
+
+Tasks live in each app's ``tasks.py`` and are discovered automatically;
+periodic tasks are declared in ``CELERY_BEAT_SCHEDULE`` (settings).
+"""
+
+import os
+
+from celery import Celery
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'waha_bot.settings')
+# Django system checks import every URLconf and view; they already run on the
+# web container, so workers skip them and boot without the HTTP stack
+os.environ.setdefault('CELERY_SKIP_CHECKS', '1')
+
+app = Celery('waha_bot')
+app.config_from_object('django.conf:settings', namespace='CELERY')
+app.autodiscover_tasks()
@@ -2,6 +2,7 @@ from pathlib import Path
 
 import dj_database_url
 import structlog
+from celery.schedules import crontab
 
 from config.env import settings
 
@@ -44,7 +45,8 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "infra.middleware.static_files.AsyncWhiteNoiseMiddleware",
+    "infra.middleware.read_replica.ReadReplicaMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -73,18 +75,33 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = "waha_bot.wsgi.application"
+ASGI_APPLICATION = "waha_bot.asgi.application"
 
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
-DATABASES = {
-    "default": dj_database_url.parse(
-        settings.database.url,
-        conn_max_age=600,
-        conn_health_checks=True,
-    )
-}
+def _database(url: str) -> dict:
+    """Database settings for one alias, pooled when it is PostgreSQL."""
+    database = dj_database_url.parse(url, conn_max_age=600, conn_health_checks=True)
+    if settings.database.pool and database["ENGINE"] == "django.db.backends.postgresql":
+        # The psycopg pool replaces persistent connections (Django rejects both at once)
+        database["CONN_MAX_AGE"] = 0
+        database.setdefault("OPTIONS", {})["pool"] = {
+            "min_size": settings.database.pool_min_size,
+            "max_size": settings.database.pool_max_size,
+            "timeout": settings.database.pool_timeout_seconds,
+        }
+    return database
+
+
+DATABASES = {"default": _database(settings.database.url)}
+if settings.database.replica_url:
+    DATABASES["replica"] = _database(settings.database.replica_url)
+    # Tests use the default test database for the replica alias
+    DATABASES["replica"]["TEST"] = {"MIRROR": "default"}
+
+DATABASE_ROUTERS = ["infra.db.routers.ReadReplicaRouter"]
 
 
 # Password validation
@@ -147,13 +164,21 @@ REST_FRAMEWORK = {
 }
 
 # Cache (Redis for production, LocMem for development)
-CACHES = {
-    "default": {
-        "BACKEND": "django.core.cache.backends.redis.RedisCache",
-        "LOCATION": settings.redis.url,
-        "KEY_PREFIX": "capyvagas",
+if settings.redis.url:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": settings.redis.url,
+            "KEY_PREFIX": "capyvagas",
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "KEY_PREFIX": "capyvagas",
+        }
     }
-}
 
 # Celery Configuration
 CELERY_BROKER_URL = settings.redis.url
@@ -162,10 +187,44 @@ CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = TIME_ZONE
+# Without a broker (REDIS_URL empty, local development) tasks run inline
+CELERY_TASK_ALWAYS_EAGER = not settings.redis.url
+CELERY_BEAT_SCHEDULE = {
+    "probe-bot-health": {
+        "task": "apps.bot.tasks.probe_bot_health",
+        "schedule": float(settings.monitoring.probe_interval_seconds),
+        "options": {"expires": settings.monitoring.probe_interval_seconds},
+    },
+    "refresh-rollups": {
+        "task": "apps.bot.tasks.refresh_rollups",
+        "schedule": 60.0,
+        "options": {"expires": 60},
+    },
+    "flush-user-activity": {
+        "task": "apps.users.tasks.flush_user_activity",
+        "schedule": 60.0,
+        "options": {"expires": 60},
+    },
+    "collect-job-postings": {
+        "task": "apps.jobs.tasks.collect_job_postings",
+        "schedule": settings.job_alerts.collect_interval_minutes * 60.0,
+    },
+    "send-job-alerts": {
+        "task": "apps.jobs.tasks.send_job_alerts",
+        "schedule": 60.0,
+        "options": {"expires": 60},
+    },
+    "interaction-log-retention": {
+        "task": "apps.bot.tasks.enforce_interaction_log_retention",
+        "schedule": crontab(hour=3, minute=15),
+    },
+}
 
 # Security Settings
 if not DEBUG:
     SECURE_SSL_REDIRECT = True
+    # Orchestrator probes hit the container over plain HTTP
+    SECURE_REDIRECT_EXEMPT = [r"^health/"]
     SESSION_COOKIE_SECURE = True
     CSRF_COOKIE_SECURE = True
     SECURE_BROWSER_XSS_FILTER = True
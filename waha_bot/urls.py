@@ -2,11 +2,14 @@ from django.contrib import admin
 from django.urls import path, include
 from django.views.generic import RedirectView
 from apps.bot.views import webhook
-from apps.core.views import HealthCheckView
+from apps.core.views import HealthCheckView, LivenessView, MetricsView, ReadinessView
 
 urlpatterns = [
     path('', RedirectView.as_view(url='/dashboard/', permanent=False)),
     path('health/', HealthCheckView.as_view(), name='health'),
+    path('health/live/', LivenessView.as_view(), name='health-live'),
+    path('health/ready/', ReadinessView.as_view(), name='health-ready'),
+    path('metrics/', MetricsView.as_view(), name='metrics'),
     path('admin/', admin.site.urls),
     path('webhook/', webhook),
     path('dashboard/', include('apps.dashboard.urls')),